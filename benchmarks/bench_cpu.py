@@ -0,0 +1,141 @@
+"""
+CPU Micro-benchmark for BasCAT
+
+Runs every shipped example program through the CPU interpreter and reports
+instructions per second. Programs are restarted whenever they halt so each
+example executes the same number of instructions; restart time is excluded
+and the best of several repeats is reported.
+
+Usage:
+    python benchmarks/bench_cpu.py [instructions_per_example] [--headless] [--translate]
+
+--translate runs headless through the basic-block translator.
+"""
+
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core.memory import Memory
+from src.core.cpu import CPU
+from src.core.assembler import Assembler
+from src.core.translator import BlockTranslator
+from src.compiler.compiler import SimpleBASCATCompiler
+
+DEFAULT_INSTRUCTIONS = 20000
+INPUT_BYTES = 64  # Bytes queued on every restart so IN never blocks
+REPEATS = 3
+
+
+def load_examples():
+    """Return a list of (name, bytecode) for all shipped examples"""
+    programs = []
+
+    for path in sorted(glob.glob(os.path.join(ROOT, "examples", "assembly", "*.asm"))):
+        with open(path, 'r') as f:
+            bytecode, error, _ = Assembler.assemble(f.read())
+        if not error:
+            programs.append((os.path.basename(path), bytecode))
+
+    compiler = SimpleBASCATCompiler()
+    for path in sorted(glob.glob(os.path.join(ROOT, "examples", "basic", "*.bas"))):
+        with open(path, 'r') as f:
+            result = compiler.compile(f.read())
+        if result.success:
+            programs.append((os.path.basename(path), result.bytecode))
+
+    return programs
+
+
+def restart(cpu, memory, bytecode):
+    """Reload the program and refill the input queue"""
+    cpu.reset()
+    memory.reset()
+    memory.load_program(0, bytecode)
+    for _ in range(INPUT_BYTES):
+        memory.io_controller.queue_input(7)
+
+
+def bench_program(bytecode, instructions, headless=False, translate=False):
+    """Execute `instructions` instructions and return instructions/sec"""
+    memory = Memory(headless=headless)
+    cpu = CPU(memory, headless=headless)
+    restart(cpu, memory, bytecode)
+
+    if translate:
+        return bench_translated(cpu, memory, bytecode, instructions)
+
+    execute = cpu.execute_instruction
+    clock = time.perf_counter
+    restart_time = 0.0
+    start = clock()
+    for _ in range(instructions):
+        if cpu.halted:
+            t = clock()
+            restart(cpu, memory, bytecode)
+            restart_time += clock() - t
+        try:
+            execute()
+        except ValueError:
+            # Program ran off the end of memory - start over
+            t = clock()
+            restart(cpu, memory, bytecode)
+            restart_time += clock() - t
+    elapsed = clock() - start - restart_time
+
+    return instructions / elapsed if elapsed > 0 else 0.0
+
+
+def bench_translated(cpu, memory, bytecode, instructions):
+    """bench_program through BlockTranslator.run"""
+    translator = BlockTranslator(cpu)
+    clock = time.perf_counter
+    restart_time = 0.0
+    executed = 0
+    start = clock()
+    while executed < instructions:
+        if cpu.halted:
+            t = clock()
+            restart(cpu, memory, bytecode)
+            restart_time += clock() - t
+        try:
+            executed += translator.run(instructions - executed)
+        except ValueError:
+            t = clock()
+            restart(cpu, memory, bytecode)
+            restart_time += clock() - t
+            executed += 1
+    elapsed = clock() - start - restart_time
+
+    return instructions / elapsed if elapsed > 0 else 0.0
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    translate = "--translate" in sys.argv
+    headless = translate or "--headless" in sys.argv
+    instructions = int(args[0]) if args else DEFAULT_INSTRUCTIONS
+    programs = load_examples()
+
+    mode = "translated" if translate else "headless" if headless else "observed"
+    print(f"Mode: {mode}")
+    print(f"{'Example':<28}{'Instr/sec':>14}")
+    print("-" * 42)
+
+    rates = []
+    for name, bytecode in programs:
+        rate = max(bench_program(bytecode, instructions, headless, translate) for _ in range(REPEATS))
+        rates.append(rate)
+        print(f"{name:<28}{rate:>14,.0f}")
+
+    print("-" * 42)
+    if rates:
+        print(f"{'Mean':<28}{sum(rates) / len(rates):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,79 +1,164 @@
 from src.core.signals import signals
 
+# Packed flag bits (ALU.packed_flags)
+FLAG_Z = 0x01  # Zero
+FLAG_N = 0x02  # Negative (bit 7 of the result)
+FLAG_C = 0x04  # Carry out of bit 7 (ADD) / borrow (SUB)
+FLAG_O = 0x08  # Overflow (not implemented, always 0)
+FLAG_BITS = {"Z": FLAG_Z, "N": FLAG_N, "C": FLAG_C, "O": FLAG_O}
+
+
+def _build_tables():
+    """
+    Precompute results and packed flags for every 8-bit operand pair.
+    Two-operand tables are indexed by (a << 8) | b; each 256-byte row is
+    built with slicing and bytes.translate, so import stays fast.
+    """
+    result_flags = bytes((FLAG_Z if r == 0 else 0) | (FLAG_N if r & 0x80 else 0)
+                         for r in range(256))
+    carry_flags = bytes(f | FLAG_C for f in result_flags)
+    identity = bytes(range(256))
+    add_rows, add_flag_rows, sub_rows, sub_flag_rows = [], [], [], []
+    for a in range(256):
+        # a + b for b = 0..255 carries for the last `a` values of b
+        row = identity[a:] + identity[:a]
+        add_rows.append(row)
+        add_flag_rows.append(row[:256 - a].translate(result_flags)
+                             + row[256 - a:].translate(carry_flags))
+        # a - b borrows for b > a
+        row = identity[a::-1] + identity[:a:-1]
+        sub_rows.append(row)
+        sub_flag_rows.append(row[:a + 1].translate(result_flags)
+                             + row[a + 1:].translate(carry_flags))
+    not_result = identity[::-1]
+    return (result_flags, b"".join(add_rows), b"".join(add_flag_rows),
+            b"".join(sub_rows), b"".join(sub_flag_rows), not_result)
+
+
+RESULT_FLAGS, ADD_RESULT, ADD_FLAGS, SUB_RESULT, SUB_FLAGS, NOT_RESULT = _build_tables()
+
+# Identity table: a stored packed flags byte is its own lookup key
+PACKED_FLAGS = bytes(range(256))
+
+
+def unpack_flags(packed):
+    """Packed flags byte -> {'Z': 0/1, 'N': 0/1, 'C': 0/1, 'O': 0/1}"""
+    return {name: 1 if packed & bit else 0 for name, bit in FLAG_BITS.items()}
+
+
+def pack_flags(flags):
+    """Flags dict -> packed flags byte"""
+    packed = 0
+    for name, bit in FLAG_BITS.items():
+        if flags.get(name):
+            packed |= bit
+    return packed
+
+
 class ALU:
     """
     Arithmetic Logic Unit.
     Performs operations on 8-bit data.
+
+    Results and flags come from precomputed tables, and the flags are kept
+    as one packed byte (packed_flags, see FLAG_Z/N/C/O). The dict form
+    (`flags`) is only built when someone reads it.
+
+    Flags are evaluated lazily: an operation only records which flag table
+    and index describe it (its kind and operands). The packed byte is looked
+    up when it is read - by a conditional jump, a snapshot or the GUI - so
+    flags overwritten by the next operation are never computed.
     """
-    def __init__(self):
-        self.flags = {"Z": 0, "N": 0, "C": 0, "O": 0}  # Zero, Negative, Carry, Overflow
+    def __init__(self, headless=False):
+        # Flags of the last operation: _flag_table[_flag_key]
+        self._flag_table = PACKED_FLAGS
+        self._flag_key = 0
+        self.headless = headless
+
+        if headless:
+            # Observer-free variant: no bus/flags signals on the hot path
+            self.operate = self._compute
+
+    @property
+    def packed_flags(self):
+        """Zero, Negative, Carry, Overflow bits of the last operation"""
+        return self._flag_table[self._flag_key]
+
+    @packed_flags.setter
+    def packed_flags(self, packed):
+        self._flag_table = PACKED_FLAGS
+        self._flag_key = packed & 0xFF
+
+    @property
+    def flags(self):
+        """Flags as a dict {'Z': 0/1, 'N': 0/1, 'C': 0/1, 'O': 0/1} (a copy)"""
+        return unpack_flags(self.packed_flags)
+
+    @flags.setter
+    def flags(self, flags):
+        self.packed_flags = pack_flags(flags)
 
     def operate(self, op_code, operand_a, operand_b=0):
         """
         Executes an operation based on op_code.
         Returns the result (8-bit).
         """
-        result = 0
-        
-        # Simple string-based opcodes for internal logic, actual CPU will use bytecodes
-        if op_code == "ADD":
-            res = operand_a + operand_b
-            result = res & 0xFF
-            self.update_flags(result, is_addition=True, op_a=operand_a, op_b=operand_b, res_raw=res)
-            
-        elif op_code == "SUB":
-            res = operand_a - operand_b
-            result = res & 0xFF
-            self.update_flags(result, is_addition=False, op_a=operand_a, op_b=operand_b, res_raw=res)
-            
-        elif op_code == "AND":
-            result = (operand_a & operand_b) & 0xFF
-            self.update_flags(result)
-            
-        elif op_code == "OR":
-            result = (operand_a | operand_b) & 0xFF
-            self.update_flags(result)
-            
-        elif op_code == "XOR":
-            result = (operand_a ^ operand_b) & 0xFF
-            self.update_flags(result)
-            
-        elif op_code == "NOT":
-            result = (~operand_a) & 0xFF
-            self.update_flags(result)
-            
-        elif op_code == "MOV":
-             # Pass through
-             result = operand_b & 0xFF
-        
+        result = self._compute(op_code, operand_a, operand_b)
+        if op_code != "MOV":
+            # Emit signal for GUI update
+            signals.flags_updated.emit(self.packed_flags)
         signals.bus_transfer.emit("ALU", "Internal Bus", result, "data")
         return result
 
-    def update_flags(self, result, is_addition=None, op_a=0, op_b=0, res_raw=0):
-        # Zero Flag
-        self.flags["Z"] = 1 if result == 0 else 0
-
-        # Negative Flag (MSB is set)
-        self.flags["N"] = 1 if (result & 0x80) else 0
-
-        # Carry Flag (Simplification)
-        if is_addition is not None:
-             if is_addition:
-                 # Carry out of bit 7
-                 self.flags["C"] = 1 if res_raw > 255 else 0
-             else:
-                 # Borrow (Carry is usually inverse borrow in some archs, but we'll stick to simple borrow=0/1 or carry logic)
-                 # For SUB: A - B. If B > A, we wrapped.
-                 self.flags["C"] = 1 if op_b > op_a else 0
-        else:
-            self.flags["C"] = 0
-
-        # Overflow Flag (Signed arithmetic overflow)
-        # implementation details can vary, keeping it simple for now or adding later
-        self.flags["O"] = 0 # Placeholder
-
-        # Emit signal for GUI update
-        signals.flags_updated.emit(self.flags.copy())
+    def _compute(self, op_code, operand_a, operand_b=0):
+        """Perform the operation and update flags. Returns the result (8-bit)."""
+        return self._OPERATIONS[op_code](self, operand_a & 0xFF, operand_b & 0xFF)
+
+    def _add(self, a, b):
+        index = (a << 8) | b
+        self._flag_table = ADD_FLAGS
+        self._flag_key = index
+        return ADD_RESULT[index]
+
+    def _sub(self, a, b):
+        # Carry means borrow: set when b > a
+        index = (a << 8) | b
+        self._flag_table = SUB_FLAGS
+        self._flag_key = index
+        return SUB_RESULT[index]
+
+    def _and(self, a, b):
+        result = a & b
+        self._flag_table = RESULT_FLAGS
+        self._flag_key = result
+        return result
+
+    def _or(self, a, b):
+        result = a | b
+        self._flag_table = RESULT_FLAGS
+        self._flag_key = result
+        return result
+
+    def _xor(self, a, b):
+        result = a ^ b
+        self._flag_table = RESULT_FLAGS
+        self._flag_key = result
+        return result
+
+    def _not(self, a, b):
+        result = NOT_RESULT[a]
+        self._flag_table = RESULT_FLAGS
+        self._flag_key = result
+        return result
+
+    def _mov(self, a, b):
+        # Pass through, flags unchanged
+        return b
+
+    _OPERATIONS = {
+        "ADD": _add, "SUB": _sub, "AND": _and, "OR": _or,
+        "XOR": _xor, "NOT": _not, "MOV": _mov,
+    }
 
     def add(self, a, b):
         """Convenience method for addition"""
@@ -0,0 +1,273 @@
+"""
+Breakpoints and watchpoints for BasCAT
+
+- Address breakpoints stop execution before the instruction at an address.
+- BASIC-line breakpoints stop before the first instruction of a BASIC
+  statement; they are resolved to addresses through the line maps whenever a
+  program is loaded or compiled.
+- Watchpoints stop execution after an instruction that read or wrote a
+  watched memory address.
+
+Everything is kept in 256-entry bitmaps, so a check is a single index.
+
+An address breakpoint may carry a condition such as `A == 10 and [0x80] > 5`
+or `SP < 0xF0`. Conditions are parsed once and compiled into a closure over
+the CPU and memory (compile_condition), which is only called when execution
+reaches the breakpoint's address. A condition that fails when evaluated (e.g.
+`A % B` with B == 0) stops execution there as a "condition_error".
+"""
+
+import ast
+
+from src.core.alu import FLAG_BITS
+from src.core.cpu import REGISTER_NUMBERS
+
+# Condition operands: registers, CPU registers, flags (0/1)
+_CONDITION_NAMES = {name: f"regs[{number}]" for name, number in REGISTER_NUMBERS.items()}
+_CONDITION_NAMES.update({name: f"cpu.{name}" for name in ("PC", "SP", "IR", "MAR")})
+_CONDITION_NAMES.update({f"{name}F": f"(1 if alu.packed_flags & {bit} else 0)"
+                         for name, bit in FLAG_BITS.items()})
+
+_OPERATORS = {
+    ast.And: "and", ast.Or: "or", ast.Not: "not ", ast.USub: "-", ast.Invert: "~",
+    ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.FloorDiv: "//", ast.Mod: "%",
+    ast.BitAnd: "&", ast.BitOr: "|", ast.BitXor: "^", ast.RShift: ">>",
+    ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=",
+}
+
+
+# Largest left shift a condition may do (larger counts raise ValueError)
+MAX_SHIFT = 64
+
+# Errors a condition can raise at run time (division by zero, negative or
+# oversized shift counts)
+CONDITION_ERRORS = (ArithmeticError, ValueError, MemoryError)
+
+
+def _shift_left(value, count):
+    """`value << count` for conditions, refusing huge results"""
+    if count > MAX_SHIFT:
+        raise ValueError(f"shift count too large: {count}")
+    return value << count
+
+
+def compile_condition(text, cpu, memory):
+    """
+    Compile a breakpoint condition into predicate() -> bool.
+
+    Operands: registers A-D, PC, SP, IR, MAR, flags ZF/NF/CF/OF (0 or 1),
+    integer literals and memory bytes written [address] (read directly, so
+    watching the INPUT port does not consume input). Operators: comparisons,
+    and/or/not, + - * // % & | ^ << >> ~ and parentheses.
+    Raises ValueError for anything else. The predicate itself may raise one
+    of CONDITION_ERRORS (see Breakpoints.should_stop).
+    """
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid breakpoint condition {text!r}: {e.msg}") from None
+    expression = _condition_source(tree.body, text)
+    source = f"def make_predicate(cpu, regs, alu, data):\n    return lambda: bool({expression})\n"
+    namespace = {"shift_left": _shift_left}
+    exec(compile(source, f"<condition {text!r}>", "exec"), namespace)
+    return namespace["make_predicate"](cpu, cpu.regs, cpu.alu, memory._data)
+
+
+def _condition_source(node, text):
+    """Python source for one condition AST node (whitelisted nodes only)"""
+    if isinstance(node, ast.BoolOp) and type(node.op) in _OPERATORS:
+        joiner = f" {_OPERATORS[type(node.op)]} "
+        return "(" + joiner.join(_condition_source(value, text) for value in node.values) + ")"
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _OPERATORS:
+        return f"({_OPERATORS[type(node.op)]}{_condition_source(node.operand, text)})"
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.LShift):
+        return f"shift_left({_condition_source(node.left, text)}, {_condition_source(node.right, text)})"
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        return (f"({_condition_source(node.left, text)} {_OPERATORS[type(node.op)]} "
+                f"{_condition_source(node.right, text)})")
+    if isinstance(node, ast.Compare) and all(type(op) in _OPERATORS for op in node.ops):
+        parts = [_condition_source(node.left, text)]
+        for op, comparator in zip(node.ops, node.comparators):
+            parts += [_OPERATORS[type(op)], _condition_source(comparator, text)]
+        return "(" + " ".join(parts) + ")"
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return repr(node.value)
+    if isinstance(node, ast.Name) and node.id.upper() in _CONDITION_NAMES:
+        return _CONDITION_NAMES[node.id.upper()]
+    if isinstance(node, ast.List) and len(node.elts) == 1:
+        # [address] - a memory byte
+        return f"data[{_condition_source(node.elts[0], text)} & 0xFF]"
+    raise ValueError(f"Invalid breakpoint condition {text!r}: "
+                     f"unsupported {ast.get_source_segment(text.strip(), node) or type(node).__name__!r}")
+
+
+class Breakpoints:
+    """
+    Breakpoint and watchpoint tables of one SimManager.
+
+    `check` has a nonzero byte for every address that execution must stop
+    at: ALWAYS for address breakpoints and resolved BASIC lines, CONDITIONAL
+    for addresses whose only breakpoint has a condition (see should_stop).
+    `reads`/`writes` flag watched addresses; Memory only looks at them while
+    at least one watchpoint is set (see Memory.set_watchpoints). `active` is
+    False when nothing is set, letting the simulator keep its unchecked fast
+    paths; `watching` is True while a watchpoint is set.
+
+    When a watched access happens, `hit` records ("read"/"write", address);
+    should_stop records ("breakpoint"/"condition_error", address).
+    """
+
+    SIZE = 256
+    ALWAYS, CONDITIONAL = 1, 2  # check bitmap values
+
+    def __init__(self, cpu, memory):
+        self.cpu = cpu
+        self.memory = memory
+        self.check = bytearray(self.SIZE)
+        self.reads = bytearray(self.SIZE)
+        self.writes = bytearray(self.SIZE)
+        self.active = False
+        self.watching = False
+        self.hit = None
+
+        self._addresses = set()  # Address breakpoints
+        self._conditions = {}  # Address -> (condition text, predicate)
+        self._basic_lines = set()  # BASIC line breakpoints
+        self._basic_addresses = {}  # BASIC line -> resolved address
+
+    # ----- Address breakpoints -----
+
+    def add(self, address, condition=None):
+        """
+        Stop before executing the instruction at address; with a condition
+        (e.g. "A == 10 and [0x80] > 5") only when it holds there. Raises
+        ValueError for an invalid condition.
+        """
+        self.validate_address(address)
+        if condition:
+            self._conditions[address] = (condition, compile_condition(condition, self.cpu, self.memory))
+        else:
+            self._conditions.pop(address, None)
+        self._addresses.add(address)
+        self._rebuild()
+
+    def remove(self, address):
+        self._addresses.discard(address)
+        self._conditions.pop(address, None)
+        self._rebuild()
+
+    def addresses(self):
+        """Address breakpoints (sorted)"""
+        return sorted(self._addresses)
+
+    def condition(self, address):
+        """Condition text of the breakpoint at address, or None"""
+        entry = self._conditions.get(address)
+        return entry[0] if entry else None
+
+    def should_stop(self, address):
+        """
+        Whether a breakpoint at address (check[address] set) fires now; if so
+        records ("breakpoint", address) in `hit`, or ("condition_error",
+        address) when its condition raised while being evaluated.
+        """
+        if self.check[address] != self.ALWAYS:
+            try:
+                if not self._conditions[address][1]():
+                    return False
+            except CONDITION_ERRORS:
+                self.hit = ("condition_error", address)
+                return True
+        self.hit = ("breakpoint", address)
+        return True
+
+    # ----- BASIC line breakpoints -----
+
+    def add_basic_line(self, basic_line):
+        """Stop before the first instruction of a BASIC statement (e.g. 30)"""
+        self._basic_lines.add(basic_line)
+        self._rebuild()
+
+    def remove_basic_line(self, basic_line):
+        self._basic_lines.discard(basic_line)
+        self._rebuild()
+
+    def basic_lines(self):
+        """BASIC line breakpoints (sorted)"""
+        return sorted(self._basic_lines)
+
+    def resolve(self, line_map, basic_line_map):
+        """
+        Map BASIC line breakpoints to addresses.
+        line_map: address -> assembly line; basic_line_map: BASIC line ->
+        assembly lines. A statement breaks at its lowest address.
+        """
+        asm_to_basic = {asm_line: basic_line
+                        for basic_line, asm_lines in basic_line_map.items()
+                        for asm_line in asm_lines}
+        entries = {}
+        for address, asm_line in line_map.items():
+            basic_line = asm_to_basic.get(asm_line)
+            if basic_line is not None and address < entries.get(basic_line, self.SIZE):
+                entries[basic_line] = address
+        self._basic_addresses = entries
+        self._rebuild()
+
+    # ----- Watchpoints -----
+
+    def watch(self, address, read=False, write=True):
+        """Stop after an instruction reads and/or writes address"""
+        self.validate_address(address)
+        self.reads[address] = 1 if read else 0
+        self.writes[address] = 1 if write else 0
+        self._rebuild()
+
+    def unwatch(self, address):
+        self.reads[address] = 0
+        self.writes[address] = 0
+        self._rebuild()
+
+    def watched(self):
+        """{address: (read, write)} for every watchpoint"""
+        return {address: (bool(self.reads[address]), bool(self.writes[address]))
+                for address in range(self.SIZE) if self.reads[address] or self.writes[address]}
+
+    def clear(self):
+        """Remove every breakpoint and watchpoint"""
+        self._addresses.clear()
+        self._conditions.clear()
+        self._basic_lines.clear()
+        self.reads[:] = bytes(self.SIZE)
+        self.writes[:] = bytes(self.SIZE)
+        self._rebuild()
+
+    def _on_access(self, kind, address):
+        """Memory callback for a watched access"""
+        self.hit = (kind, address)
+
+    # ----- Internals -----
+
+    def validate_address(self, address):
+        """Return address if it is a memory address, else raise ValueError"""
+        if not (0 <= address < self.SIZE):
+            raise ValueError(f"Address out of range: {address:#04x}")
+        return address
+
+    def _rebuild(self):
+        """Recompute the check bitmap and (re)install the memory hooks"""
+        check = bytearray(self.SIZE)
+        for address in self._addresses:
+            check[address] = self.CONDITIONAL if address in self._conditions else self.ALWAYS
+        for basic_line in self._basic_lines:
+            address = self._basic_addresses.get(basic_line)
+            if address is not None:
+                check[address] = self.ALWAYS
+        self.check[:] = check
+
+        watching_reads = any(self.reads)
+        watching_writes = any(self.writes)
+        self.memory.set_watchpoints(self.reads if watching_reads else None,
+                                    self.writes if watching_writes else None,
+                                    self._on_access)
+        self.watching = watching_reads or watching_writes
+        self.active = bool(self._addresses or self._basic_lines or self.watching)
@@ -1,20 +1,87 @@
-from PyQt6.QtCore import QTimer, QObject, pyqtSignal
-
-class Clock(QObject):
-    tick = pyqtSignal()
-    
-    def __init__(self):
-        super().__init__()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.tick.emit)
-        
-    def start(self, frequency_hz):
-        interval_ms = int(1000 / frequency_hz)
-        self.timer.start(interval_ms)
-        
+import time
+
+from src.core.signals import Signal
+
+class Clock:
+    """
+    System clock. Pure Python: paces execution and emits `tick`.
+
+    The clock paces virtual time in CPU clock cycles (see CPU.CYCLES), so an
+    instruction takes as long as its cycle count at the current frequency.
+    Every timer pulse emits tick(count, deadline): the number of cycles owed
+    since start() at the current frequency, and the perf_counter time by which
+    that burst should finish. Owed cycles are computed from the absolute start
+    time, so timer jitter and millisecond rounding never build up as drift.
+    Slow clocks pulse once per cycle; fast clocks pulse once per display frame
+    and run many instructions per pulse, each burst limited to budget_ms of
+    wall-clock time. Work that does not fit in the budget is dropped rather
+    than owed, so an overloaded simulator slows down instead of spiralling.
+
+    The base class has no timer of its own; call pulse() directly or use a
+    timer backend (e.g. QtClock in src.gui.qt_bridge) that implements
+    _start_timer/_stop_timer.
+    """
+    tick = Signal(int, float)  # cycle count, deadline (perf_counter seconds)
+
+    FRAME_INTERVAL_MS = 16  # Pulse period for fast clocks (~60 Hz)
+    TURBO = 0               # frequency_hz meaning "as fast as the budget allows"
+    TURBO_BURST = 1 << 30   # Cycle count requested per pulse in turbo mode
+
+    def __init__(self, budget_ms=10, time_source=time.perf_counter):
+        self.frequency_hz = 1
+        self.budget_ms = budget_ms
+        self.running = False
+        self._time = time_source
+        self._start_time = 0.0
+        self._issued = 0  # Cycles requested since start()
+
+    def start(self, frequency_hz=None):
+        if frequency_hz is not None:
+            self.frequency_hz = frequency_hz
+        self.running = True
+        self._start_time = self._time()
+        self._issued = 0
+        self._start_timer(self.interval_ms())
+
     def stop(self):
-        self.timer.stop()
-        
+        self.running = False
+        self._stop_timer()
+
     def set_speed(self, frequency_hz):
-        if self.timer.isActive():
+        if self.running:
             self.start(frequency_hz)
+        else:
+            self.frequency_hz = frequency_hz
+
+    def is_turbo(self):
+        return self.frequency_hz == self.TURBO
+
+    def interval_ms(self):
+        """Timer period: one cycle per pulse when slow, one frame when fast"""
+        hz = self.frequency_hz
+        if hz == self.TURBO or hz * self.FRAME_INTERVAL_MS >= 1000:
+            return self.FRAME_INTERVAL_MS
+        return int(1000 / hz)
+
+    def pulse(self):
+        """Called by the timer backend on every timeout"""
+        if not self.running:
+            return
+        now = self._time()
+        if self.frequency_hz == self.TURBO:
+            count = self.TURBO_BURST
+        else:
+            target = int((now - self._start_time) * self.frequency_hz)
+            count = target - self._issued
+            if count <= 0:
+                return
+            self._issued = target
+        self.tick.emit(count, now + self.budget_ms / 1000.0)
+
+    def _start_timer(self, interval_ms):
+        """Start (or restart) the periodic timer. Override in timer backends."""
+        pass
+
+    def _stop_timer(self):
+        """Stop the periodic timer. Override in timer backends."""
+        pass
@@ -1,18 +1,120 @@
+from collections.abc import MutableMapping
+
 from src.core.signals import signals
-from src.core.alu import ALU
+from src.core.alu import ALU, FLAG_C, FLAG_Z
+from src.core.decode_cache import DecodeCache
+from src.core.io_controller import IOController
+
+# Register file layout: encoded register number -> name
+REGISTER_NAMES = ("A", "B", "C", "D")
+REGISTER_NUMBERS = {name: number for number, name in enumerate(REGISTER_NAMES)}
+# Register operand byte -> register number, None for an unknown register
+REGISTER_INDEX = tuple(i if i < len(REGISTER_NAMES) else None for i in range(256))
+
+
+class RegisterView(MutableMapping):
+    """
+    Name-based view ("A".."D") of the CPU's bytearray register file, for the
+    GUI and tests. Compares equal to a dict with the same contents.
+    """
+    __slots__ = ("_regs",)
+
+    def __init__(self, regs):
+        self._regs = regs
+
+    def __getitem__(self, name):
+        return self._regs[REGISTER_NUMBERS[name]]
+
+    def __setitem__(self, name, value):
+        self._regs[REGISTER_NUMBERS[name]] = value & 0xFF
+
+    def __delitem__(self, name):
+        raise TypeError("CPU registers cannot be deleted")
+
+    def __iter__(self):
+        return iter(REGISTER_NAMES)
+
+    def __len__(self):
+        return len(REGISTER_NAMES)
+
+    def __repr__(self):
+        return repr(dict(self))
+
 
 class CPU:
     """
     Central Processing Unit for CAL-EB.
+
+    Instructions are decoded through a 256-entry dispatch table of bound
+    handler methods, one handler per opcode family.
+
+    In headless mode the table is filled with observer-free handler variants
+    (suffix `_headless`) that never emit signals, so batch runs execute at
+    pure-interpreter speed.
+
+    Decoded instructions are cached per address (see DecodeCache); Memory
+    invalidates them when a write touches their bytes.
+
+    The general-purpose registers live in `regs`, a bytearray indexed by the
+    encoded register number; `registers` is a name-based view of it. All
+    state lives in slots (no instance __dict__), including the hot-path
+    methods fetch_byte and execute_instruction, which are bound per mode.
+
+    `cycles` counts clock cycles since reset, per the CYCLES timing table.
+
+    set_profile() swaps in execute variants that also count executions and
+    clock cycles per instruction address (see Profiler).
     """
-    def __init__(self, memory):
+    __slots__ = ("PC", "SP", "IR", "MAR", "regs", "registers", "cycles", "halted",
+                 "memory", "headless", "alu", "_dispatch", "_decode_cache", "_decoded",
+                 "_profile", "_profile_cycles", "fetch_byte", "execute_instruction")
+
+    # Opcode -> ALU operation for the Reg, Value/Reg family
+    ALU_OPS = {0x02: "ADD", 0x03: "SUB", 0x05: "AND", 0x06: "OR", 0x07: "XOR"}
+
+    # Opcode -> (packed flag bit, required value of that bit), None for an
+    # unconditional jump
+    JUMP_CONDITIONS = {
+        0x10: None,                # JMP
+        0x11: (FLAG_Z, FLAG_Z),    # JZ
+        0x12: (FLAG_Z, 0),         # JNZ
+        0x13: (FLAG_C, FLAG_C),    # JC
+        0x14: (FLAG_C, 0),         # JNC
+    }
+
+    # Operand bytes per opcode: "r" = register (decoded to its number),
+    # "b" = raw byte (value, address or Value/Reg operand)
+    OPERAND_LAYOUT = [""] * 256
+    for _opcode in (0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x09, 0x30):
+        OPERAND_LAYOUT[_opcode] = "rb"
+    for _opcode in (0x08, 0x20, 0x21, 0x40, 0x41):
+        OPERAND_LAYOUT[_opcode] = "r"
+    for _opcode in (0x10, 0x11, 0x12, 0x13, 0x14):
+        OPERAND_LAYOUT[_opcode] = "b"
+    OPERAND_LAYOUT[0x31] = "br"
+
+    # Timing: every instruction byte (opcode and operands, read by
+    # fetch_byte) takes one fetch cycle, then the opcode's execute cycles:
+    # one for register, ALU and branch operations, two for those that
+    # access memory or I/O (stack, LDM/STM, IN/OUT)
+    EXECUTE_CYCLES = [1] * 256
+    for _opcode in (0x20, 0x21, 0x30, 0x31, 0x40, 0x41):
+        EXECUTE_CYCLES[_opcode] = 2
+    # Opcode -> total clock cycles of the instruction
+    CYCLES = [0] * 256
+    for _opcode in range(256):
+        CYCLES[_opcode] = 1 + len(OPERAND_LAYOUT[_opcode]) + EXECUTE_CYCLES[_opcode]
+    MAX_CYCLES = max(CYCLES)
+    del _opcode
+
+    def __init__(self, memory, headless=False):
         self.memory = memory
-        self.alu = ALU()
+        self.headless = headless
+        self.alu = ALU(headless=headless)
         
         # Registers
-        self.registers = {
-            "A": 0, "B": 0, "C": 0, "D": 0
-        }
+        self.regs = bytearray(len(REGISTER_NAMES))
+        self.registers = RegisterView(self.regs)
         self.PC = 0      # Program Counter (16-bit)
         self.IR = 0      # Instruction Register (8-bit opcode)
         self.MAR = 0     # Memory Address Register (16-bit)
@@ -20,15 +122,37 @@ class CPU:
         
         # Internal State
         self.halted = False
+        self.cycles = 0  # Clock cycles executed since reset
+        self._profile = None  # Executions per address while profiling
+        self._profile_cycles = None  # Clock cycles per address while profiling
+
+        # Opcode dispatch table
+        self._dispatch = self._build_dispatch_table()
+
+        # Predecoded instructions, invalidated by Memory on code writes
+        self._decode_cache = DecodeCache(memory.SIZE)
+        self._decoded = self._decode_cache.entries
+        memory.attach_decode_cache(self._decode_cache)
+
+        if headless:
+            # Observer-free variants of the hot-path methods
+            self.fetch_byte = self._fetch_byte_headless
+            self.execute_instruction = self._execute_instruction_headless
+        else:
+            self.fetch_byte = self._fetch_byte_observed
+            self.execute_instruction = self._execute_instruction_observed
 
     def reset(self):
         self.PC = 0
         self.IR = 0
         self.MAR = 0
         self.SP = 0xFD
-        for r in self.registers:
-            self.registers[r] = 0
+        self.regs[:] = bytes(len(self.regs))
         self.halted = False
+        self.cycles = 0
+
+        if self.headless:
+            return
 
         # Emit updates
         signals.pc_updated.emit(self.PC)
@@ -38,8 +162,62 @@ class CPU:
         for r, v in self.registers.items():
             signals.register_updated.emit(r, v)
 
-    def fetch_byte(self):
-        """Fetch a single byte from memory at PC, increment PC"""
+    def set_profile(self, profiler):
+        """
+        Count executions and cycles per instruction address into a Profiler,
+        or stop counting with None.
+        """
+        if profiler is None:
+            self._profile = self._profile_cycles = None
+            if self.headless:
+                self.execute_instruction = self._execute_instruction_headless
+            else:
+                self.execute_instruction = self._execute_instruction_observed
+            return
+        self._profile = profiler.counts
+        self._profile_cycles = profiler.cycles
+        if self.headless:
+            self.execute_instruction = self._execute_instruction_headless_profiled
+        else:
+            self.execute_instruction = self._execute_instruction_profiled
+
+    def _execute_instruction_profiled(self):
+        """_execute_instruction_observed that also profiles the instruction's address"""
+        if self.halted:
+            return
+        address = self.PC
+        self._profile[address] += 1
+        try:
+            entry = self._decoded[address] or self._decode(address)
+        except IndexError:
+            entry = None
+        if entry is None:
+            self._execute_uncached()
+            self._profile_cycles[address] += self.CYCLES[self.IR]
+            signals.instruction_executed.emit(address)
+            return
+        handler, opcode, length, x, y, raw = entry
+        mar_updated = signals.mar_updated.emit
+        pc_updated = signals.pc_updated.emit
+        bus_transfer = signals.bus_transfer.emit
+        for mar, byte_val in enumerate(raw, address):
+            mar_updated(mar)
+            bus_transfer("Memory", "Data Bus", byte_val, "data")
+            pc_updated(mar + 1)
+            if mar == address:
+                signals.ir_updated.emit(opcode)
+                bus_transfer("Memory", "IR", opcode, "data")
+        self.MAR = address + length - 1
+        self.PC = address + length
+        self.IR = opcode
+        cycles = self.CYCLES[opcode]
+        self.cycles += cycles
+        self._profile_cycles[address] += cycles
+        handler(opcode, x, y)
+        signals.instruction_executed.emit(address)
+
+    def _fetch_byte_observed(self):
+        """Fetch a single byte from memory at PC, increment PC (fetch_byte)"""
         self.MAR = self.PC
         signals.mar_updated.emit(self.MAR)
 
@@ -47,261 +225,390 @@ class CPU:
 
         self.PC += 1
         signals.pc_updated.emit(self.PC)
+        self.cycles += 1
 
         return byte_val
 
-    def execute_instruction(self):
-        """Fetch and execute one complete instruction"""
+    def _execute_instruction_observed(self):
+        """Fetch and execute one complete instruction (execute_instruction)"""
         if self.halted:
             return
 
-        # Fetch opcode
+        address = self.PC
+        try:
+            entry = self._decoded[address] or self._decode(address)
+        except IndexError:
+            entry = None  # PC ran off the end; the uncached fetch raises
+        if entry is None:
+            self._execute_uncached()
+            signals.instruction_executed.emit(address)
+            return
+
+        # Replay the fetch cycle of the cached instruction for observers
+        handler, opcode, length, x, y, raw = entry
+        mar_updated = signals.mar_updated.emit
+        pc_updated = signals.pc_updated.emit
+        bus_transfer = signals.bus_transfer.emit
+        for mar, byte_val in enumerate(raw, address):
+            mar_updated(mar)
+            bus_transfer("Memory", "Data Bus", byte_val, "data")
+            pc_updated(mar + 1)
+            if mar == address:
+                signals.ir_updated.emit(opcode)
+                bus_transfer("Memory", "IR", opcode, "data")
+        self.MAR = address + length - 1
+        self.PC = address + length
+        self.IR = opcode
+        self.cycles += self.CYCLES[opcode]
+
+        handler(opcode, x, y)
+        signals.instruction_executed.emit(address)
+
+    def _execute_uncached(self):
+        """
+        Fetch and execute byte by byte through Memory.read. Used for
+        instructions that overlap the I/O ports or run off the end of memory,
+        which must keep their read side effects (and errors).
+        """
         opcode = self.fetch_byte()
         self.IR = opcode
-        signals.ir_updated.emit(self.IR)
-        signals.bus_transfer.emit("Memory", "IR", self.IR, "data")
-
-        # Decode and execute
-        if opcode == 0x00:  # NOP
-            pass
-
-        elif opcode == 0x01:  # LOAD Reg, Value
-            reg_idx = self.fetch_byte()
-            value = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                self.registers[reg_name] = value
-                signals.register_updated.emit(reg_name, value)
-                signals.bus_transfer.emit("Memory", reg_name, value, "data")
-
-        elif opcode == 0x02:  # ADD Reg, Value/Reg
-            reg_idx = self.fetch_byte()
-            operand_byte = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                # Check if operand is register (high bit set) or immediate
-                if operand_byte & 0x80:
-                    src_idx = operand_byte & 0x7F
-                    src_name = self._reg_name(src_idx)
-                    if src_name:
-                        value = self.registers[src_name]
-                    else:
-                        value = 0
-                else:
-                    value = operand_byte
-                result = self.alu.add(self.registers[reg_name], value)
-                self.registers[reg_name] = result & 0xFF
-                signals.register_updated.emit(reg_name, self.registers[reg_name])
-
-        elif opcode == 0x03:  # SUB Reg, Value/Reg
-            reg_idx = self.fetch_byte()
-            operand_byte = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                # Check if operand is register (high bit set) or immediate
-                if operand_byte & 0x80:
-                    src_idx = operand_byte & 0x7F
-                    src_name = self._reg_name(src_idx)
-                    if src_name:
-                        value = self.registers[src_name]
-                    else:
-                        value = 0
-                else:
-                    value = operand_byte
-                result = self.alu.subtract(self.registers[reg_name], value)
-                self.registers[reg_name] = result & 0xFF
-                signals.register_updated.emit(reg_name, self.registers[reg_name])
-
-        elif opcode == 0x04:  # MOV Dest, Source
-            dest_idx = self.fetch_byte()
-            src_byte = self.fetch_byte()
-            dest_name = self._reg_name(dest_idx)
-            if dest_name:
-                # Check if source is a register (high bit set) or immediate value
-                if src_byte & 0x80:
-                    # Source is a register
-                    src_idx = src_byte & 0x7F
-                    src_name = self._reg_name(src_idx)
-                    if src_name:
-                        self.registers[dest_name] = self.registers[src_name]
-                        signals.bus_transfer.emit(src_name, dest_name, self.registers[dest_name], "data")
-                else:
-                    # Source is immediate value
-                    self.registers[dest_name] = src_byte
-                    signals.bus_transfer.emit("Memory", dest_name, src_byte, "data")
-                signals.register_updated.emit(dest_name, self.registers[dest_name])
-
-        # Logic operations
-        elif opcode == 0x05:  # AND Reg, Value/Reg
-            reg_idx = self.fetch_byte()
-            operand_byte = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                if operand_byte & 0x80:
-                    src_idx = operand_byte & 0x7F
-                    src_name = self._reg_name(src_idx)
-                    value = self.registers[src_name] if src_name else 0
-                else:
-                    value = operand_byte
-                result = self.alu.operate("AND", self.registers[reg_name], value)
-                self.registers[reg_name] = result & 0xFF
-                signals.register_updated.emit(reg_name, self.registers[reg_name])
-
-        elif opcode == 0x06:  # OR Reg, Value/Reg
-            reg_idx = self.fetch_byte()
-            operand_byte = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                if operand_byte & 0x80:
-                    src_idx = operand_byte & 0x7F
-                    src_name = self._reg_name(src_idx)
-                    value = self.registers[src_name] if src_name else 0
-                else:
-                    value = operand_byte
-                result = self.alu.operate("OR", self.registers[reg_name], value)
-                self.registers[reg_name] = result & 0xFF
-                signals.register_updated.emit(reg_name, self.registers[reg_name])
-
-        elif opcode == 0x07:  # XOR Reg, Value/Reg
-            reg_idx = self.fetch_byte()
-            operand_byte = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                if operand_byte & 0x80:
-                    src_idx = operand_byte & 0x7F
-                    src_name = self._reg_name(src_idx)
-                    value = self.registers[src_name] if src_name else 0
-                else:
-                    value = operand_byte
-                result = self.alu.operate("XOR", self.registers[reg_name], value)
-                self.registers[reg_name] = result & 0xFF
-                signals.register_updated.emit(reg_name, self.registers[reg_name])
-
-        elif opcode == 0x08:  # NOT Reg
-            reg_idx = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                result = self.alu.operate("NOT", self.registers[reg_name])
-                self.registers[reg_name] = result & 0xFF
-                signals.register_updated.emit(reg_name, self.registers[reg_name])
-
-        # Comparison
-        elif opcode == 0x09:  # CMP Reg, Value
-            reg_idx = self.fetch_byte()
-            value = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                # Perform subtraction to set flags, but don't store result
-                self.alu.subtract(self.registers[reg_name], value)
+        if not self.headless:
+            signals.ir_updated.emit(self.IR)
+            signals.bus_transfer.emit("Memory", "IR", self.IR, "data")
+
+        operands = [None, None]
+        for i, kind in enumerate(self.OPERAND_LAYOUT[opcode]):
+            byte_val = self.fetch_byte()
+            operands[i] = REGISTER_INDEX[byte_val] if kind == "r" else byte_val
+        self.cycles += self.EXECUTE_CYCLES[opcode]
+        self._dispatch[opcode](opcode, operands[0], operands[1])
+
+    def _decode(self, address):
+        """
+        Decode the instruction at address and cache it.
+
+        Entries are tuples (handler, opcode, length, x, y, raw): x and y are
+        the pre-parsed operands (register number for register operands, None
+        for an unknown register, the raw byte otherwise, None if absent) and raw holds the instruction bytes.
+        Returns None for instructions that cannot be cached.
+        """
+        data = self.memory._data
+        opcode = data[address]
+        layout = self.OPERAND_LAYOUT[opcode]
+        length = 1 + len(layout)
+        if address + length > IOController.OUTPUT_PORT:
+            return None
+
+        raw = bytes(data[address:address + length])
+        operands = [None, None]
+        for i, kind in enumerate(layout):
+            byte_val = raw[i + 1]
+            operands[i] = REGISTER_INDEX[byte_val] if kind == "r" else byte_val
+
+        entry = (self._dispatch[opcode], opcode, length, operands[0], operands[1], raw)
+        self._decode_cache.store(address, entry, length)
+        return entry
+
+    def _build_dispatch_table(self):
+        """
+        Build the 256-entry opcode dispatch table.
+        Unassigned opcodes behave like NOP.
+        """
+        suffix = "_headless" if self.headless else ""
+
+        def handler(name):
+            return getattr(self, name + suffix)
+
+        table = [handler("_op_nop")] * 256
+
+        table[0x01] = handler("_op_load")
+        table[0x04] = handler("_op_mov")
+
+        # Arithmetic and logic (Reg, Value/Reg)
+        for opcode in self.ALU_OPS:
+            table[opcode] = handler("_op_alu")
+        table[0x08] = handler("_op_not")
+        table[0x09] = handler("_op_cmp")
 
         # Branching
-        elif opcode == 0x10:  # JMP Address
-            addr = self.fetch_byte()
-            self.PC = addr
-            signals.pc_updated.emit(self.PC)
-
-        elif opcode == 0x11:  # JZ Address - Jump if Zero
-            addr = self.fetch_byte()
-            if self.alu.flags["Z"] == 1:
-                self.PC = addr
-                signals.pc_updated.emit(self.PC)
-
-        elif opcode == 0x12:  # JNZ Address - Jump if Not Zero
-            addr = self.fetch_byte()
-            if self.alu.flags["Z"] == 0:
-                self.PC = addr
-                signals.pc_updated.emit(self.PC)
+        for opcode in self.JUMP_CONDITIONS:
+            table[opcode] = handler("_op_jump")
+
+        # Stack, memory and I/O
+        table[0x20] = handler("_op_push")
+        table[0x21] = handler("_op_pop")
+        table[0x30] = handler("_op_ldm")
+        table[0x31] = handler("_op_stm")
+        table[0x40] = handler("_op_out")
+        table[0x41] = handler("_op_in")
+
+        table[0xFF] = handler("_op_halt")
+        return table
+
+    def _operand_value(self, operand_byte):
+        """
+        Resolve a Value/Reg operand byte.
+        High bit set selects a register (low bits = index), otherwise immediate.
+        Unknown registers read as 0.
+        """
+        if operand_byte & 0x80:
+            src = REGISTER_INDEX[operand_byte & 0x7F]
+            return self.regs[src] if src is not None else 0
+        return operand_byte
+
+    # ----- Instruction handlers (one per opcode family) -----
+    #
+    # Handlers receive the opcode and its pre-parsed operands (see _decode);
+    # PC already points past the instruction. Register operands are indices
+    # into self.regs, or None for an unknown register.
+
+    def _op_nop(self, opcode, x, y):
+        """NOP (and any unassigned opcode)"""
+        pass
+
+    def _op_load(self, opcode, reg, value):
+        """LOAD Reg, Value"""
+        if reg is not None:
+            self.regs[reg] = value
+            name = REGISTER_NAMES[reg]
+            signals.register_updated.emit(name, value)
+            signals.bus_transfer.emit("Memory", name, value, "data")
+
+    def _op_alu(self, opcode, reg, operand_byte):
+        """ADD/SUB/AND/OR/XOR Reg, Value/Reg"""
+        value = self._operand_value(operand_byte)
+        if reg is not None:
+            regs = self.regs
+            regs[reg] = self.alu.operate(self.ALU_OPS[opcode], regs[reg], value)
+            signals.register_updated.emit(REGISTER_NAMES[reg], regs[reg])
+
+    def _op_mov(self, opcode, dest, src_byte):
+        """MOV Dest, Source (register or immediate)"""
+        if dest is not None:
+            regs = self.regs
+            dest_name = REGISTER_NAMES[dest]
+            if src_byte & 0x80:
+                # Source is a register
+                src = REGISTER_INDEX[src_byte & 0x7F]
+                if src is not None:
+                    regs[dest] = regs[src]
+                    signals.bus_transfer.emit(REGISTER_NAMES[src], dest_name, regs[dest], "data")
+            else:
+                # Source is immediate value
+                regs[dest] = src_byte
+                signals.bus_transfer.emit("Memory", dest_name, src_byte, "data")
+            signals.register_updated.emit(dest_name, regs[dest])
+
+    def _op_not(self, opcode, reg, y):
+        """NOT Reg"""
+        if reg is not None:
+            regs = self.regs
+            regs[reg] = self.alu.operate("NOT", regs[reg])
+            signals.register_updated.emit(REGISTER_NAMES[reg], regs[reg])
+
+    def _op_cmp(self, opcode, reg, value):
+        """CMP Reg, Value - subtract to set flags, discard result"""
+        if reg is not None:
+            self.alu.subtract(self.regs[reg], value)
+
+    def _op_jump(self, opcode, addr, y):
+        """JMP/JZ/JNZ/JC/JNC Address"""
+        condition = self.JUMP_CONDITIONS[opcode]
+        if condition is not None:
+            bit, expected = condition
+            if self.alu.packed_flags & bit != expected:
+                return
+        self.PC = addr
+        signals.pc_updated.emit(self.PC)
 
-        elif opcode == 0x13:  # JC Address - Jump if Carry
-            addr = self.fetch_byte()
-            if self.alu.flags["C"] == 1:
-                self.PC = addr
+    def _op_push(self, opcode, reg, y):
+        """PUSH Reg"""
+        if reg is not None:
+            # Push register value onto stack
+            value = self.regs[reg]
+            self.memory.write(self.SP, value)
+            signals.bus_transfer.emit(REGISTER_NAMES[reg], "Memory", value, "data")
+            self.SP = (self.SP - 1) & 0xFF  # Decrement SP (stack grows down)
+            signals.sp_updated.emit(self.SP)
+
+    def _op_pop(self, opcode, reg, y):
+        """POP Reg"""
+        if reg is not None:
+            # Pop value from stack into register
+            self.SP = (self.SP + 1) & 0xFF  # Increment SP
+            signals.sp_updated.emit(self.SP)
+            value = self.memory.read(self.SP)
+            self.regs[reg] = value
+            name = REGISTER_NAMES[reg]
+            signals.register_updated.emit(name, value)
+            signals.bus_transfer.emit("Memory", name, value, "data")
+
+    def _op_ldm(self, opcode, reg, addr):
+        """LDM Reg, [addr] - Load from memory"""
+        if reg is not None:
+            value = self.memory.read(addr)
+            self.regs[reg] = value
+            name = REGISTER_NAMES[reg]
+            signals.register_updated.emit(name, value)
+            signals.bus_transfer.emit("Memory", name, value, "data")
+
+    def _op_stm(self, opcode, addr, reg):
+        """STM [addr], Reg - Store to memory"""
+        if reg is not None:
+            value = self.regs[reg]
+            self.memory.write(addr, value)
+            signals.bus_transfer.emit(REGISTER_NAMES[reg], "Memory", value, "data")
+
+    def _op_out(self, opcode, reg, y):
+        """OUT Reg - Write register to OUTPUT port (0xFE)"""
+        if reg is not None:
+            value = self.regs[reg]
+            self.memory.write(0xFE, value)
+            signals.bus_transfer.emit(REGISTER_NAMES[reg], "I/O", value, "data")
+
+    def _op_in(self, opcode, reg, y):
+        """IN Reg - Read from INPUT port (0xFF) to register"""
+        if reg is not None:
+            # Check if input is available
+            if not self.memory.io_controller.has_input():
+                # No input available - rewind PC to re-execute this instruction
+                # This effectively "blocks" until input is provided
+                self.PC -= 2  # Rewind past opcode + register byte
                 signals.pc_updated.emit(self.PC)
+                signals.input_requested.emit()
+                return  # Don't proceed - wait for input
+
+            value = self.memory.read(0xFF)
+            self.regs[reg] = value
+            name = REGISTER_NAMES[reg]
+            signals.register_updated.emit(name, value)
+            signals.bus_transfer.emit("I/O", name, value, "data")
+
+    def _op_halt(self, opcode, x, y):
+        """HALT"""
+        self.halted = True
+
+    # ----- Headless (observer-free) variants -----
+
+    def _fetch_byte_headless(self):
+        """fetch_byte without register/bus signals"""
+        self.MAR = pc = self.PC
+        byte_val = self.memory.read(pc)
+        self.PC = pc + 1
+        self.cycles += 1
+        return byte_val
 
-        elif opcode == 0x14:  # JNC Address - Jump if Not Carry
-            addr = self.fetch_byte()
-            if self.alu.flags["C"] == 0:
-                self.PC = addr
-                signals.pc_updated.emit(self.PC)
+    def _execute_instruction_headless(self):
+        """execute_instruction without IR/bus signals"""
+        if self.halted:
+            return
+        address = self.PC
+        try:
+            entry = self._decoded[address] or self._decode(address)
+        except IndexError:
+            entry = None  # PC ran off the end; the uncached fetch raises
+        if entry is None:
+            self._execute_uncached()
+            return
+        handler, opcode, length, x, y, raw = entry
+        self.IR = opcode
+        self.MAR = address + length - 1
+        self.PC = address + length
+        self.cycles += self.CYCLES[opcode]
+        handler(opcode, x, y)
 
-        # Stack operations
-        elif opcode == 0x20:  # PUSH Reg
-            reg_idx = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                # Push register value onto stack
-                self.memory.write(self.SP, self.registers[reg_name])
-                signals.bus_transfer.emit(reg_name, "Memory", self.registers[reg_name], "data")
-                self.SP = (self.SP - 1) & 0xFF  # Decrement SP (stack grows down)
-                signals.sp_updated.emit(self.SP)
-
-        elif opcode == 0x21:  # POP Reg
-            reg_idx = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                # Pop value from stack into register
-                self.SP = (self.SP + 1) & 0xFF  # Increment SP
-                signals.sp_updated.emit(self.SP)
-                value = self.memory.read(self.SP)
-                self.registers[reg_name] = value
-                signals.register_updated.emit(reg_name, value)
-                signals.bus_transfer.emit("Memory", reg_name, value, "data")
-
-        # Memory operations
-        elif opcode == 0x30:  # LDM Reg, [addr] - Load from memory
-            reg_idx = self.fetch_byte()
-            addr = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                value = self.memory.read(addr)
-                self.registers[reg_name] = value
-                signals.register_updated.emit(reg_name, value)
-                signals.bus_transfer.emit("Memory", reg_name, value, "data")
-
-        elif opcode == 0x31:  # STM [addr], Reg - Store to memory
-            addr = self.fetch_byte()
-            reg_idx = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                self.memory.write(addr, self.registers[reg_name])
-                signals.bus_transfer.emit(reg_name, "Memory", self.registers[reg_name], "data")
-
-        # I/O operations
-        elif opcode == 0x40:  # OUT Reg - Write register to OUTPUT port (0xFE)
-            reg_idx = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                value = self.registers[reg_name]
-                # Write to OUTPUT port address
-                self.memory.write(0xFE, value)
-                signals.bus_transfer.emit(reg_name, "I/O", value, "data")
-
-        elif opcode == 0x41:  # IN Reg - Read from INPUT port (0xFF) to register
-            reg_idx = self.fetch_byte()
-            reg_name = self._reg_name(reg_idx)
-            if reg_name:
-                # Check if input is available
-                if not self.memory.io_controller.has_input():
-                    # No input available - rewind PC to re-execute this instruction
-                    # This effectively "blocks" until input is provided
-                    self.PC -= 2  # Rewind past opcode + register byte
-                    signals.pc_updated.emit(self.PC)
-                    signals.input_requested.emit()
-                    return  # Don't proceed - wait for input
-                
-                # Read from INPUT port address
-                value = self.memory.read(0xFF)
-                self.registers[reg_name] = value
-                signals.register_updated.emit(reg_name, value)
-                signals.bus_transfer.emit("I/O", reg_name, value, "data")
-
-        elif opcode == 0xFF:  # HALT
-            self.halted = True
-
-    def _reg_name(self, idx):
-        """Convert register index to name"""
-        names = {0: "A", 1: "B", 2: "C", 3: "D"}
-        return names.get(idx)
+    def _execute_instruction_headless_profiled(self):
+        """_execute_instruction_headless that also profiles the instruction's address"""
+        if self.halted:
+            return
+        address = self.PC
+        self._profile[address] += 1
+        try:
+            entry = self._decoded[address] or self._decode(address)
+        except IndexError:
+            entry = None
+        if entry is None:
+            self._execute_uncached()
+            self._profile_cycles[address] += self.CYCLES[self.IR]
+            return
+        handler, opcode, length, x, y, raw = entry
+        self.IR = opcode
+        self.MAR = address + length - 1
+        self.PC = address + length
+        cycles = self.CYCLES[opcode]
+        self.cycles += cycles
+        self._profile_cycles[address] += cycles
+        handler(opcode, x, y)
+
+    def _op_nop_headless(self, opcode, x, y):
+        pass
+
+    def _op_load_headless(self, opcode, reg, value):
+        if reg is not None:
+            self.regs[reg] = value
+
+    def _op_alu_headless(self, opcode, reg, operand_byte):
+        value = self._operand_value(operand_byte)
+        if reg is not None:
+            regs = self.regs
+            regs[reg] = self.alu.operate(self.ALU_OPS[opcode], regs[reg], value)
+
+    def _op_mov_headless(self, opcode, dest, src_byte):
+        if dest is not None:
+            if src_byte & 0x80:
+                src = REGISTER_INDEX[src_byte & 0x7F]
+                if src is not None:
+                    self.regs[dest] = self.regs[src]
+            else:
+                self.regs[dest] = src_byte
+
+    def _op_not_headless(self, opcode, reg, y):
+        if reg is not None:
+            regs = self.regs
+            regs[reg] = self.alu.operate("NOT", regs[reg])
+
+    def _op_cmp_headless(self, opcode, reg, value):
+        if reg is not None:
+            self.alu.subtract(self.regs[reg], value)
+
+    def _op_jump_headless(self, opcode, addr, y):
+        condition = self.JUMP_CONDITIONS[opcode]
+        if condition is not None:
+            bit, expected = condition
+            if self.alu.packed_flags & bit != expected:
+                return
+        self.PC = addr
+
+    def _op_push_headless(self, opcode, reg, y):
+        if reg is not None:
+            self.memory.write(self.SP, self.regs[reg])
+            self.SP = (self.SP - 1) & 0xFF
+
+    def _op_pop_headless(self, opcode, reg, y):
+        if reg is not None:
+            self.SP = (self.SP + 1) & 0xFF
+            self.regs[reg] = self.memory.read(self.SP)
+
+    def _op_ldm_headless(self, opcode, reg, addr):
+        if reg is not None:
+            self.regs[reg] = self.memory.read(addr)
+
+    def _op_stm_headless(self, opcode, addr, reg):
+        if reg is not None:
+            self.memory.write(addr, self.regs[reg])
+
+    def _op_out_headless(self, opcode, reg, y):
+        if reg is not None:
+            self.memory.write(0xFE, self.regs[reg])
+
+    def _op_in_headless(self, opcode, reg, y):
+        if reg is not None:
+            if not self.memory.io_controller.has_input():
+                self.PC -= 2  # Block until input is provided
+                return
+            self.regs[reg] = self.memory.read(0xFF)
+
+    _op_halt_headless = _op_halt
 
     # Legacy method for compatibility
     def fetch(self):
@@ -0,0 +1,65 @@
+"""
+Predecoded instruction cache for BasCAT
+
+The CPU decodes an instruction the first time it executes it and keeps the
+result, keyed by address, so later executions skip the per-byte fetch through
+Memory.read. Memory marks every byte covered by a cached instruction in
+`guard`; writing a guarded byte calls invalidate() so self-modifying programs
+(POKE into their own code) always execute the bytes currently in RAM.
+
+Other caches of translated code (e.g. the BlockTranslator) register in
+`dependents` and are invalidated and cleared together with this one.
+"""
+
+
+class DecodeCache:
+    """
+    Address-indexed cache of decoded instructions.
+
+    entries[address] is None or the CPU's decoded tuple for the instruction
+    starting at `address`. guard[address] is non-zero if any cached
+    instruction covers that byte. Guard bits are conservative: they are only
+    cleared by clear(), so a stale bit merely costs one extra check.
+    """
+
+    MAX_LENGTH = 3  # Longest CAL-EB instruction: opcode + two operand bytes
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = [None] * size
+        self.guard = bytearray(size)
+        self.dependents = []  # Objects with invalidate(address) and clear()
+
+    def store(self, address, entry, length):
+        """Cache `entry` for the `length`-byte instruction at address"""
+        self.entries[address] = entry
+        self.guard[address:address + length] = b"\x01" * length
+
+    def invalidate(self, address):
+        """Drop every cached instruction that covers address"""
+        entries = self.entries
+        for start in range(max(0, address - self.MAX_LENGTH + 1), address + 1):
+            entry = entries[start]
+            if entry is not None and start + entry[2] > address:
+                entries[start] = None
+        for dependent in self.dependents:
+            dependent.invalidate(address)
+
+    def invalidate_range(self, start, end):
+        """Drop every cached instruction covering an address in [start, end)"""
+        guard = self.guard
+        if guard.find(1, start, end) < 0:
+            return
+        for address in range(start, end):
+            if guard[address]:
+                self.invalidate(address)
+
+    def clear(self):
+        """Drop all cached instructions"""
+        self.entries[:] = [None] * self.size
+        self.guard[:] = bytes(self.size)
+        for dependent in self.dependents:
+            dependent.clear()
+
+    def __len__(self):
+        return sum(1 for entry in self.entries if entry is not None)
@@ -23,7 +23,7 @@ class IOController:
     OUTPUT_PORT = 0xFE  # 254
     INPUT_PORT = 0xFF   # 255
 
-    def __init__(self):
+    def __init__(self, headless=False):
         # Input queue (FIFO) - stores bytes waiting to be read
         self.input_queue = deque()
 
@@ -33,12 +33,20 @@ class IOController:
         # Input status: True if data available
         self.input_available = False
 
+        self.headless = headless
+        if headless:
+            # Observer-free variants: no I/O signals on the hot path
+            self.write_output = self._write_output_headless
+            self.read_input = self._read_input_headless
+            self.queue_input = self._queue_input_headless
+
     def reset(self):
         """Reset the I/O controller"""
         self.input_queue.clear()
         self.output_buffer.clear()
         self.input_available = False
-        signals.output_cleared.emit()
+        if not self.headless:
+            signals.output_cleared.emit()
 
     def write_output(self, value):
         """
@@ -97,6 +105,23 @@ class IOController:
         # Emit signal for GUI update
         signals.input_queued.emit(value)
 
+    def _write_output_headless(self, value):
+        """write_output() without signals"""
+        self.output_buffer.append(value & 0xFF)
+
+    def _read_input_headless(self):
+        """read_input() without signals"""
+        if self.input_queue:
+            value = self.input_queue.popleft()
+            self.input_available = len(self.input_queue) > 0
+            return value & 0xFF
+        return 0
+
+    def _queue_input_headless(self, value):
+        """queue_input() without signals"""
+        self.input_queue.append(value & 0xFF)
+        self.input_available = True
+
     def queue_string(self, text):
         """
         Queue a string as a series of bytes.
@@ -1,6 +1,9 @@
 from src.core.signals import signals
 from src.core.io_controller import IOController
 
+# Byte -> 1 if nonzero: turns an XOR of two memory images into a change map
+_NONZERO = bytes([0]) + bytes([1]) * 255
+
 class Memory:
     """
     Represents the 256-byte RAM of the CAL-EB computer.
@@ -13,9 +16,34 @@ class Memory:
     """
     SIZE = 256  # 8-bit address space
 
-    def __init__(self, io_controller=None):
+    def __init__(self, io_controller=None, headless=False):
         self._data = bytearray(self.SIZE)
-        self.io_controller = io_controller or IOController()
+        self.headless = headless
+        self.io_controller = io_controller or IOController(headless=headless)
+
+        # Predecoded instructions of the CPU running from this memory (see
+        # attach_decode_cache); _code_guard marks bytes covered by one.
+        self.decode_cache = None
+        self._code_guard = bytearray(self.SIZE)
+
+        # Change tracking (see changed_since): the image as of the last
+        # collection and the generation each address last changed in
+        self._shadow = bytearray(self.SIZE)
+        self._generations = [0] * self.SIZE
+        self._generation = 0
+
+        if headless:
+            # Observer-free variants: no bus/memory signals on the hot path
+            self.read = self._read_headless
+            self.write = self._write_headless
+
+        # Watchpoints (see set_watchpoints): the unwatched access methods
+        self._plain_read = self.read
+        self._plain_write = self.write
+        self._watch_reads = None
+        self._watch_writes = None
+        self._on_watch = None
+
         self.reset()
 
         # Connect signals acting as inputs to the memory unit
@@ -25,10 +53,88 @@ class Memory:
 
     def reset(self):
         """Clears all memory to 0."""
-        for i in range(self.SIZE):
-            self._data[i] = 0
+        self._data[:] = bytes(self.SIZE)
+        if self.decode_cache is not None:
+            self.decode_cache.clear()
         self.io_controller.reset()
-        # Determine if we want to emit mass change signals (probably not for reset)
+        if not self.headless:
+            signals.memory_bulk_changed.emit(0, self.SIZE)
+
+    def attach_decode_cache(self, cache):
+        """
+        Register the CPU's DecodeCache. Writes to bytes it covers invalidate
+        the affected instructions, so self-modifying code stays correct.
+        """
+        self.decode_cache = cache
+        self._code_guard = cache.guard
+
+    # ----- Change tracking -----
+
+    @property
+    def generation(self):
+        """Current change generation; bumps whenever collected changes are found"""
+        self._collect_changes()
+        return self._generation
+
+    def changed_since(self, generation):
+        """
+        Addresses (ascending) whose byte changed after `generation`.
+
+        Writes are not tracked as they happen: the dirty map is built on
+        demand by comparing memory with the image seen by the previous
+        collection, so the write paths (including translated code and bulk
+        loads) pay nothing when nobody asks. A byte written and restored
+        between two collections therefore counts as unchanged.
+        """
+        self._collect_changes()
+        if generation >= self._generation:
+            return []
+        generations = self._generations
+        return [address for address in range(self.SIZE) if generations[address] > generation]
+
+    def _collect_changes(self):
+        """Stamp every byte that differs from the shadow image with a new generation"""
+        data = self._data
+        shadow = self._shadow
+        if data == shadow:
+            return
+        # Dirty map: one 0/1 flag per address
+        dirty = (int.from_bytes(data, "little") ^ int.from_bytes(shadow, "little")
+                 ).to_bytes(self.SIZE, "little").translate(_NONZERO)
+        shadow[:] = data
+        self._generation += 1
+        generation = self._generation
+        generations = self._generations
+        address = dirty.find(1)
+        while address >= 0:
+            generations[address] = generation
+            address = dirty.find(1, address + 1)
+
+    # ----- Watchpoints -----
+
+    def set_watchpoints(self, reads, writes, on_access):
+        """
+        Call on_access("read"/"write", address) after every access to an
+        address flagged in the reads/writes bitmaps (None = no watchpoints of
+        that kind). Only while a bitmap is installed do read()/write() go
+        through the checking variants; otherwise they stay the plain methods.
+        """
+        self._watch_reads = reads
+        self._watch_writes = writes
+        self._on_watch = on_access
+        self.read = self._read_watched if reads is not None else self._plain_read
+        self.write = self._write_watched if writes is not None else self._plain_write
+
+    def _read_watched(self, address):
+        value = self._plain_read(address)
+        if self._watch_reads[address]:
+            self._on_watch("read", address)
+        return value
+
+    def _write_watched(self, address, value):
+        self._plain_write(address, value)
+        if self._watch_writes[address]:
+            self._on_watch("write", address)
 
     def read(self, address):
         """
@@ -65,6 +171,9 @@ class Memory:
 
         val = value & 0xFF  # Ensure 8-bit
 
+        if self._code_guard[address]:
+            self.decode_cache.invalidate(address)
+
         # Check for I/O port writes
         if address == IOController.OUTPUT_PORT:
             # Write to OUTPUT port (0xFE)
@@ -84,7 +193,47 @@ class Memory:
             signals.memory_changed.emit(address, val)
             signals.bus_transfer.emit("Data Bus", "Memory", val, "data")
 
+    def _read_headless(self, address):
+        """read() without bus signals"""
+        if not (0 <= address < self.SIZE):
+            raise ValueError(f"Memory access out of bounds: {address:#04x}")
+        if address == IOController.INPUT_PORT:
+            return self.io_controller.read_input()
+        return self._data[address]
+
+    def _write_headless(self, address, value):
+        """write() without bus/memory signals"""
+        if not (0 <= address < self.SIZE):
+            raise ValueError(f"Memory write out of bounds: {address:#04x}")
+        val = value & 0xFF
+        if self._code_guard[address]:
+            self.decode_cache.invalidate(address)
+        if address == IOController.OUTPUT_PORT:
+            self.io_controller.write_output(val)
+        self._data[address] = val
+
     def load_program(self, start_address, data):
-        """Helper to load a program (list of bytes) into memory."""
-        for i, byte in enumerate(data):
-            self.write(start_address + i, byte)
+        """
+        Helper to load a program (list of bytes) into memory.
+
+        RAM is filled with one slice assignment and announced with a single
+        memory_bulk_changed(start, length); bytes landing on the I/O ports
+        still go through write() so the ports behave as before.
+        """
+        payload = bytes(byte & 0xFF for byte in data)
+        end = start_address + len(payload)
+        if not payload:
+            return
+        if start_address < 0 or end > self.SIZE:
+            bad = start_address if start_address < 0 else self.SIZE
+            raise ValueError(f"Memory write out of bounds: {bad:#04x}")
+
+        ram_end = min(end, IOController.OUTPUT_PORT)
+        if start_address < ram_end:
+            self._data[start_address:ram_end] = payload[:ram_end - start_address]
+            if self.decode_cache is not None:
+                self.decode_cache.invalidate_range(start_address, ram_end)
+            if not self.headless:
+                signals.memory_bulk_changed.emit(start_address, ram_end - start_address)
+        for address in range(max(start_address, ram_end), end):
+            self.write(address, payload[address - start_address])
@@ -0,0 +1,72 @@
+"""
+Execution profiler for BasCAT
+
+Counts how often the instruction at each address executes, and the clock
+cycles it took, in flat lists indexed by address. While profiling, the CPU
+swaps in an execute variant that adds to both per instruction, and translated
+blocks keep per-exit counters that are folded in on demand (see
+BlockTranslator.set_profile), so translated code keeps its speed.
+
+Cycles are charged for the opcode actually executed (CPU.CYCLES), so they
+stay right for self-modifying code and after the program is overwritten or
+reloaded. Reports aggregate addresses to assembly lines and BASIC lines
+through the line maps.
+"""
+
+
+class Profiler:
+    """
+    counts[address]: executions of the instruction starting at address.
+    cycles[address]: clock cycles those executions took.
+
+    table() turns the counts into rows (key, executions, cycles), where
+    executions is the number of instructions executed at that address or in
+    that line.
+    """
+
+    GROUPINGS = ("address", "line", "basic_line")
+
+    def __init__(self, size):
+        self.counts = [0] * size
+        self.cycles = [0] * size
+
+    def reset(self):
+        """Forget all counts"""
+        self.counts[:] = [0] * len(self.counts)
+        self.cycles[:] = [0] * len(self.cycles)
+
+    def total(self):
+        """Instructions counted"""
+        return sum(self.counts)
+
+    def table(self, line_map, asm_to_basic, by="basic_line"):
+        """
+        Profile rows (key, executions, cycles), most cycles first.
+
+        line_map: address -> assembly line; asm_to_basic: assembly line ->
+        BASIC line. by: "address", "line" (assembly line) or "basic_line".
+        Addresses without a line are left out of the line groupings.
+        """
+        if by not in self.GROUPINGS:
+            raise ValueError(f"Unknown profile grouping {by!r}, expected one of {self.GROUPINGS}")
+        rows = {}
+        for address, executions in enumerate(self.counts):
+            if not executions:
+                continue
+            if by == "address":
+                key = address
+            else:
+                key = line_map.get(address)
+                if key is not None and by == "basic_line":
+                    key = asm_to_basic.get(key)
+                if key is None:
+                    continue
+            cycles = self.cycles[address]
+            row = rows.get(key)
+            if row is None:
+                rows[key] = [executions, cycles]
+            else:
+                row[0] += executions
+                row[1] += cycles
+        return sorted(((key, executions, cycles) for key, (executions, cycles) in rows.items()),
+                      key=lambda row: (-row[2], row[0]))
@@ -1,46 +1,115 @@
-from PyQt6.QtCore import QObject, pyqtSignal
+"""
+Pure-Python signal hub for the CAL-EB architecture.
 
-class ArchitectureSignals(QObject):
+Mirrors the connect/disconnect/emit API of pyqtSignal so the core simulator
+can be imported without PyQt6. The GUI bridges these signals onto real Qt
+signals through src.gui.qt_bridge.
+"""
+
+
+class BoundSignal:
+    """A signal instance owned by one object. Holds the connected slots."""
+
+    __slots__ = ("name", "types", "_slots", "__weakref__")
+
+    def __init__(self, name, types):
+        self.name = name
+        self.types = types
+        self._slots = ()  # Tuple so emit can iterate while slots change
+
+    def connect(self, slot):
+        """Connect a callable; it is called with the emitted arguments"""
+        self._slots = self._slots + (slot,)
+
+    def disconnect(self, slot=None):
+        """Disconnect a slot, or every slot if none is given"""
+        if slot is None:
+            self._slots = ()
+            return
+        if slot not in self._slots:
+            raise TypeError(f"disconnect() failed: slot is not connected to '{self.name}'")
+        slots = list(self._slots)
+        slots.remove(slot)
+        self._slots = tuple(slots)
+
+    def emit(self, *args):
+        for slot in self._slots:
+            slot(*args)
+
+    def has_receivers(self):
+        """True if at least one slot is connected"""
+        return bool(self._slots)
+
+
+class Signal:
+    """
+    Declares a signal on a class, like pyqtSignal.
+    Each instance of the owning class gets its own BoundSignal on first access.
+    """
+
+    def __init__(self, *types):
+        self.types = types
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        bound = BoundSignal(self.name, self.types)
+        # Cache on the instance so later lookups skip the descriptor
+        obj.__dict__[self.name] = bound
+        return bound
+
+
+class ArchitectureSignals:
     """
     Central signal hub for the CAL-EB architecture.
     Simulates the control and data buses by emitting signals when state changes.
     """
     # Memory signals
-    memory_read = pyqtSignal(int)  # address
-    memory_write = pyqtSignal(int, int)  # address, value
-    memory_changed = pyqtSignal(int, int)  # address, new_value
+    memory_read = Signal(int)  # address
+    memory_write = Signal(int, int)  # address, value
+    memory_changed = Signal(int, int)  # address, new_value
+    memory_bulk_changed = Signal(int, int)  # start address, length (reset/program load)
 
     # CPU Register updates (for visualization)
-    register_updated = pyqtSignal(str, int)  # register_name, value
-    pc_updated = pyqtSignal(int)
-    mar_updated = pyqtSignal(int)
-    ir_updated = pyqtSignal(int)
-    sp_updated = pyqtSignal(int)
+    register_updated = Signal(str, int)  # register_name, value
+    pc_updated = Signal(int)
+    mar_updated = Signal(int)
+    ir_updated = Signal(int)
+    sp_updated = Signal(int)
 
     # ALU flags update (for visualization)
-    flags_updated = pyqtSignal(dict)  # flags dictionary {'Z': 0/1, 'N': 0/1, 'C': 0/1, 'O': 0/1}
+    flags_updated = Signal(int)  # packed flags byte (see alu.FLAG_Z/N/C/O; alu.unpack_flags)
 
     # Bus activity (for animation)
     # source, destination, value, bus_type ('data', 'address', 'control')
-    bus_transfer = pyqtSignal(str, str, int, str)
+    bus_transfer = Signal(str, str, int, str)
 
     # Code execution tracking
     # Emits the source line number being executed
-    current_line_changed = pyqtSignal(int)  # line_number
+    current_line_changed = Signal(int)  # line_number
+    instruction_executed = Signal(int)  # address of the completed instruction
+    breakpoint_hit = Signal(str, int)  # kind ("breakpoint", "condition_error", "read", "write"), address
+    simulation_error = Signal(str)  # message; execution failed and the clock was stopped
 
     # I/O signals
-    output_written = pyqtSignal(int)  # value (byte)
-    output_char_written = pyqtSignal(str)  # character
-    output_cleared = pyqtSignal()  # output buffer cleared
-    input_queued = pyqtSignal(int)  # value queued
-    input_consumed = pyqtSignal()  # input was read
-    input_requested = pyqtSignal()  # program tried to read but no input available
-    
+    output_written = Signal(int)  # value (byte)
+    output_char_written = Signal(str)  # character
+    output_cleared = Signal()  # output buffer cleared
+    input_queued = Signal(int)  # value queued
+    input_consumed = Signal()  # input was read
+    input_requested = Signal()  # program tried to read but no input available
+
     # Memory panel signals
-    memory_panel_toggle = pyqtSignal()  # toggle memory panel visibility
+    memory_panel_toggle = Signal()  # toggle memory panel visibility
 
-    def __init__(self):
-        super().__init__()
+    @classmethod
+    def signal_names(cls):
+        """Names of all declared signals, in declaration order"""
+        return [name for name, value in vars(cls).items() if isinstance(value, Signal)]
 
 # Global singleton for easy access across components
 signals = ArchitectureSignals()
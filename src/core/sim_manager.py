@@ -1,21 +1,98 @@
-from src.core.cpu import CPU
+import threading
+import time
+
+from src.core.cpu import CPU, REGISTER_INDEX
 from src.core.memory import Memory
 from src.core.clock import Clock
 from src.core.assembler import Assembler
+from src.core.breakpoints import Breakpoints
+from src.core.decode_cache import DecodeCache
+from src.core.profiler import Profiler
 from src.core.signals import signals
+from src.core.state_delta import DeltaRecorder, StateDelta
+from src.core.translator import BlockTranslator
+
+class SimSnapshot:
+    """Immutable view of CPU and memory state at one instant"""
+
+    __slots__ = ("registers", "pc", "ir", "mar", "sp", "flags", "halted", "memory")
+
+    def __init__(self, registers, pc, ir, mar, sp, flags, halted, memory):
+        self.registers = registers
+        self.pc = pc
+        self.ir = ir
+        self.mar = mar
+        self.sp = sp
+        self.flags = flags
+        self.halted = halted
+        self.memory = memory
+
 
 class SimManager:
-    def __init__(self):
-        self.memory = Memory()
-        self.cpu = CPU(self.memory)
-        self.clock = Clock()
+    # Instructions per translated run between deadline/interrupt checks
+    TRANSLATED_CHUNK = 4096
+    # Default instruction budget of the run_until_* calls
+    RUN_BUDGET = 1_000_000
+
+    def __init__(self, headless=False, clock=None):
+        """
+        headless: if True, CPU, Memory, ALU and I/O run observer-free variants
+        that emit no signals (for batch runs without a GUI), and clock bursts
+        run through the basic-block translator.
+        clock: Clock driving run(); defaults to a timer-less core Clock, which
+        a SimWorker thread paces (or pass a QtClock to run on the GUI thread).
+        """
+        self.headless = headless
+        self.memory = Memory(headless=headless)
+        self.cpu = CPU(self.memory, headless=headless)
+        self.clock = clock or Clock()
+        self.translator = BlockTranslator(self.cpu) if headless else None
+        self._quiet_translator = None  # Translator of an observed simulator's quiet runs
+        self.breakpoints = Breakpoints(self.cpu, self.memory)
+        self._resume_pc = None  # run() starts past a breakpoint at this PC
+        self._cycle_target = 0  # cpu.cycles the clock bursts have run up to
         self.line_map = {}  # Maps memory address to assembly line number
         self.basic_line_map = {}  # Maps BASIC line number → list of assembly line numbers
         self.asm_to_basic_map = {}  # Maps assembly line number → BASIC line number
+        self.address_basic_line = None  # Address → BASIC line (see _build_address_lines)
+        self._build_address_lines()
         self.execution_mode = "basic"  # "basic" or "assembly"
         self.current_basic_line = None  # Track current BASIC line for step-over
+        self.delta_recorder = None  # Created by start_delta_recording()
+        self.profiler = None  # Created by start_profiling()
+        self.profiling = False
+        self.execution_time = 0.0  # Seconds spent in run_burst since the last flush
+        self._flushed_cycles = 0  # cpu.cycles at the last flush (0 after a reset)
+
+        # Held while executing, so another thread (GUI) can read consistent state
+        self.lock = threading.RLock()
+        # Set from another thread to break out of run_burst/step_over early
+        self.interrupt_requested = False
+
+        self.clock.tick.connect(self.run_burst)
+
+    def start_delta_recording(self):
+        """
+        Start folding per-micro-operation signals into a StateDelta that the
+        GUI collects once per display frame with flush_delta().
+        """
+        if self.delta_recorder is None:
+            self.delta_recorder = DeltaRecorder(signals)
+        self.delta_recorder.attach()
+        return self.delta_recorder
 
-        self.clock.tick.connect(self.handle_tick)
+    def flush_delta(self):
+        """Return everything that changed since the last flush"""
+        if self.delta_recorder is None:
+            return StateDelta()
+        with self.lock:
+            delta = self.delta_recorder.flush()
+            delta.execution_time = self.execution_time
+            self.execution_time = 0.0
+            cycles = self.cpu.cycles
+            delta.cycles = cycles - self._flushed_cycles
+            self._flushed_cycles = cycles
+            return delta
     
     def load_code(self, source_code):
         machine_code, error, line_map = Assembler.assemble(source_code)
@@ -26,12 +103,37 @@ class SimManager:
         self.clock.stop()
         self.cpu.reset()
         self.memory.reset()
+        self._flushed_cycles = 0
 
         # Then set line_map and load program
         self.line_map = line_map
+        self._build_address_lines()
+        self.breakpoints.resolve(self.line_map, self.basic_line_map)
         self.memory.load_program(0, machine_code)
+        if self.profiler is not None:
+            self._collect_profile()
+            self.profiler.reset()  # Counts of the previous program
         return True
 
+    def request_interrupt(self):
+        """Ask a running burst or step-over to return as soon as possible"""
+        self.interrupt_requested = True
+
+    def clear_interrupt(self):
+        self.interrupt_requested = False
+
+    def snapshot(self):
+        """Consistent copy of the architectural state (taken under the lock)"""
+        with self.lock:
+            cpu = self.cpu
+            return SimSnapshot(
+                registers=dict(cpu.registers),
+                pc=cpu.PC, ir=cpu.IR, mar=cpu.MAR, sp=cpu.SP,
+                flags=dict(cpu.alu.flags),
+                halted=cpu.halted,
+                memory=bytes(self.memory._data),
+            )
+
     def set_basic_line_map(self, basic_line_map):
         """
         Set the BASIC-to-assembly line mapping.
@@ -43,6 +145,67 @@ class SimManager:
         for basic_line, asm_lines in basic_line_map.items():
             for asm_line in asm_lines:
                 self.asm_to_basic_map[asm_line] = basic_line
+        self._build_address_lines()
+        self.breakpoints.resolve(self.line_map, self.basic_line_map)
+
+    def basic_line_cycles(self):
+        """
+        {BASIC line: clock cycles to execute each of its instructions once},
+        the cost of one pass through the statement (see CPU.CYCLES).
+        """
+        data = self.memory._data
+        cycles = {}
+        for address in range(Memory.SIZE):
+            basic_line = self.address_basic_line[address]
+            if basic_line is not None:
+                cycles[basic_line] = cycles.get(basic_line, 0) + CPU.CYCLES[data[address]]
+        return cycles
+
+    # ----- Profiling -----
+
+    def start_profiling(self):
+        """
+        Opt in to profiling: count executions of every instruction address
+        (kept across resets and runs until reset_profile or a new program).
+        """
+        if self.profiler is None:
+            self.profiler = Profiler(len(self.address_basic_line))
+        self.profiling = True
+        self._set_profile(self.profiler)
+
+    def stop_profiling(self):
+        """Stop counting; the profile collected so far stays available"""
+        self._collect_profile()
+        self.profiling = False
+        self._set_profile(None)
+
+    def reset_profile(self):
+        """Forget the profile collected so far"""
+        if self.profiler is not None:
+            self._collect_profile()
+            self.profiler.reset()
+
+    def profile_table(self, by="basic_line"):
+        """
+        The profile as rows (key, executions, cycles), most cycles first,
+        keyed by "address", "line" (assembly line) or "basic_line".
+        """
+        if self.profiler is None:
+            return []
+        self._collect_profile()
+        return self.profiler.table(self.line_map, self.asm_to_basic_map, by)
+
+    def _set_profile(self, profiler):
+        self.cpu.set_profile(profiler)
+        for translator in (self.translator, self._quiet_translator):
+            if translator is not None:
+                translator.set_profile(profiler)
+
+    def _collect_profile(self):
+        """Fold the translators' block counters into the profile"""
+        for translator in (self.translator, self._quiet_translator):
+            if translator is not None:
+                translator.collect_profile()
 
     def set_execution_mode(self, mode):
         """Set execution mode: 'basic' or 'assembly'"""
@@ -52,15 +215,24 @@ class SimManager:
         self.clock.stop()
         self.cpu.reset()
         self.memory.reset()
+        self._flushed_cycles = 0
         self.line_map = {}  # Clear line map so step will reload code
+        self._build_address_lines()
         self.current_basic_line = None
 
     def run(self):
-        self.clock.start(1) # Default 1Hz
+        # Resuming at a breakpoint executes its instruction instead of stopping again
+        self._resume_pc = self.cpu.PC
+        self._cycle_target = self.cpu.cycles
+        self.breakpoints.hit = None
+        self.clock.start()  # At the speed last set with set_speed()
 
     def step(self):
         """Step into: Execute single assembly instruction"""
+        self.breakpoints.hit = None
         self.handle_tick()
+        if self.breakpoints.hit is not None:
+            self._stop_at_hit()
 
     def step_over(self):
         """
@@ -71,46 +243,352 @@ class SimManager:
             return
 
         # Get current BASIC line
-        current_address = self.cpu.PC
-        if current_address in self.line_map:
-            asm_line = self.line_map[current_address]
-            if asm_line in self.asm_to_basic_map:
-                start_basic_line = self.asm_to_basic_map[asm_line]
-            else:
-                # No BASIC mapping, just do single step
-                self.step()
-                return
-        else:
-            # No line mapping, just do single step
+        lines = self.address_basic_line
+        start_basic_line = lines[self.cpu.PC]
+        if start_basic_line is None:
+            # No BASIC mapping, just do single step
             self.step()
             return
 
         # Execute instructions until we reach a different BASIC line
-        while not self.cpu.halted:
+        cpu = self.cpu
+        check_breakpoints = self._begin_stepping()
+        while not cpu.halted and not self.interrupt_requested:
             self.handle_tick()
+            if check_breakpoints and self._breakpoint_reached():
+                break
+            if lines[cpu.PC] != start_basic_line:
+                break
 
-            # Check if we've moved to a different BASIC line
-            current_address = self.cpu.PC
-            if current_address in self.line_map:
-                asm_line = self.line_map[current_address]
-                if asm_line in self.asm_to_basic_map:
-                    current_basic_line = self.asm_to_basic_map[asm_line]
-                    if current_basic_line != start_basic_line:
-                        # Moved to different BASIC line, stop
-                        break
-                else:
-                    # No BASIC mapping, stop
-                    break
-            else:
-                # No line mapping, stop
+    def step_out(self):
+        """
+        Step out: run until execution leaves the innermost loop around the
+        current instruction (the shortest backward jump spanning PC). Outside
+        any loop this is a step over.
+        """
+        if self.cpu.halted:
+            return
+        loop = self._enclosing_loop(self.cpu.PC)
+        if loop is None:
+            self.step_over()
+            return
+
+        low, high = loop
+        cpu = self.cpu
+        check_breakpoints = self._begin_stepping()
+        while not cpu.halted and not self.interrupt_requested:
+            self.handle_tick()
+            if check_breakpoints and self._breakpoint_reached():
+                break
+            if not (low <= cpu.PC <= high):
                 break
 
+    def run_to_line(self, basic_line):
+        """
+        Run to cursor: run until execution reaches BASIC line `basic_line`
+        (if it starts there: until it comes back). See run_until_basic_line.
+        """
+        return self.run_until_basic_line(basic_line)
+
+    # ----- Budgeted runs -----
+    #
+    # These execute in a tight loop with the delta recorder detached, so no
+    # view sees the individual instructions; the final state is folded into
+    # the delta once they stop. Each returns (reason, instructions executed),
+    # reason being "target", "halted", "budget", "interrupted", "input" (an IN
+    # is waiting on an empty input queue; it is neither executed nor counted)
+    # or the kind of breakpoint hit ("breakpoint", "condition_error", "read",
+    # "write"). The instruction at the starting PC always executes, so a run
+    # that starts on its target (or at a breakpoint) goes on until execution
+    # comes back to it.
+
+    def run_instructions(self, count):
+        """Execute up to `count` instructions"""
+        return self._run_quiet(count)
+
+    def run_until_halt(self, max_instructions=RUN_BUDGET):
+        """Run until HALT, at most max_instructions"""
+        return self._run_quiet(max_instructions)
+
+    def run_until_address(self, address, max_instructions=RUN_BUDGET):
+        """Run until PC reaches address, at most max_instructions"""
+        self.breakpoints.validate_address(address)
+        targets = bytearray(len(self.address_basic_line))
+        targets[address] = 1
+        return self._run_quiet(max_instructions, targets)
+
+    def run_until_basic_line(self, basic_line, max_instructions=RUN_BUDGET):
+        """
+        Run until execution enters BASIC line `basic_line` (reaches its
+        lowest address, like a BASIC-line breakpoint), at most
+        max_instructions. A line without code is never reached.
+        """
+        lines = self.address_basic_line
+        targets = bytearray(len(lines))
+        entry = next((address for address, line in enumerate(lines) if line == basic_line), None)
+        if entry is not None:
+            targets[entry] = 1
+        return self._run_quiet(max_instructions, targets)
+
+    def _run_quiet(self, budget, targets=None):
+        """
+        Execute up to `budget` instructions without observers, stopping
+        before an address flagged in `targets`, at breakpoints and
+        watchpoints, on HALT and on request_interrupt().
+        """
+        self.clock.stop()
+        cpu = self.cpu
+        if cpu.halted:
+            return "halted", 0
+        breakpoints = self.breakpoints
+        breakpoints.hit = None
+
+        recorder = self.delta_recorder
+        recording = recorder is not None and recorder.attached
+        if recording:
+            recorder.detach()
+        output = self.memory.io_controller.output_buffer
+        output_start = len(output)
+        start = time.perf_counter()
+        executed = 0
+        try:
+            if breakpoints.watching:
+                reason, executed = self._run_quiet_checked(budget, targets)
+            else:
+                reason, executed = self._run_quiet_translated(budget, targets)
+        finally:
+            self.execution_time += time.perf_counter() - start
+            if recording:
+                recorder.attach()
+                recorder.record_state(cpu, self.line_map.get(cpu.PC), executed,
+                                      output[output_start:])
+        if breakpoints.hit is not None:
+            self._stop_at_hit()
+        elif reason == "input" and not self.headless:
+            signals.input_requested.emit()
+        return reason, executed
+
+    def _waiting_for_input(self):
+        """Whether the instruction at PC is an IN that would block (input queue empty)"""
+        pc = self.cpu.PC
+        data = self.memory._data
+        return (pc + 1 < len(data) and data[pc] == 0x41 and REGISTER_INDEX[data[pc + 1]] is not None
+                and not self.memory.io_controller.has_input())
+
+    def _run_quiet_translated(self, budget, targets):
+        """
+        _run_quiet through translated blocks (no watchpoints): blocks stop
+        at targets, breakpoint addresses and IN instructions, where the loop
+        decides.
+        """
+        cpu = self.cpu
+        translator = self.translator
+        if translator is None:
+            # Observed simulators translate only for quiet runs
+            if self._quiet_translator is None:
+                self._quiet_translator = BlockTranslator(cpu)
+                if self.profiling:
+                    self._quiet_translator.set_profile(self.profiler)
+            translator = self._quiet_translator
+
+        breakpoints = self.breakpoints
+        data = self.memory._data
+        inputs = [address for address in self.line_map if data[address] == 0x41]  # IN
+        stops = targets
+        if breakpoints.active or inputs:
+            stops = bytearray(targets or len(self.address_basic_line))
+            for address, flag in enumerate(breakpoints.check):
+                if flag:
+                    stops[address] = 1
+            for address in inputs:
+                stops[address] = 1
+
+        executed = 0
+        while executed < budget:
+            if cpu.halted:
+                return "halted", executed
+            if self.interrupt_requested:
+                return "interrupted", executed
+            chunk = min(budget - executed, self.TRANSLATED_CHUNK)
+            pc = cpu.PC
+            if executed and stops is not None and stops[pc]:
+                if targets is not None and targets[pc]:
+                    return "target", executed
+                if pc < Breakpoints.SIZE and breakpoints.check[pc] and breakpoints.should_stop(pc):
+                    return breakpoints.hit[0], executed
+            if self._waiting_for_input():
+                return "input", executed
+            if stops is None:
+                executed += translator.run(chunk)
+            else:
+                executed += translator.run_until(chunk, stops)
+        return ("halted" if cpu.halted else "budget"), executed
+
+    def _run_quiet_checked(self, budget, targets):
+        """_run_quiet one instruction at a time (watchpoints need every access)"""
+        cpu = self.cpu
+        execute = cpu.execute_instruction
+        breakpoints = self.breakpoints
+        check = breakpoints.check
+        data = self.memory._data
+        skip = cpu.PC
+        executed = 0
+        while executed < budget:
+            if cpu.halted:
+                return "halted", executed
+            if self.interrupt_requested:
+                return "interrupted", executed
+            pc = cpu.PC
+            if pc != skip:
+                if targets is not None and targets[pc]:
+                    return "target", executed
+                if pc < Breakpoints.SIZE and check[pc] and breakpoints.should_stop(pc):
+                    return breakpoints.hit[0], executed
+            skip = None
+            if pc < Breakpoints.SIZE and data[pc] == 0x41 and self._waiting_for_input():
+                return "input", executed
+            execute()
+            executed += 1
+            if breakpoints.hit is not None:
+                return breakpoints.hit[0], executed
+        return ("halted" if cpu.halted else "budget"), executed
+
+    def _begin_stepping(self):
+        """Start a multi-instruction step; returns whether to check breakpoints"""
+        self.breakpoints.hit = None
+        return self.breakpoints.active
+
+    def _enclosing_loop(self, address):
+        """(first, last) address of the shortest backward jump spanning address"""
+        data = self.memory._data
+        best = None
+        for start in self.line_map:
+            if data[start] in CPU.JUMP_CONDITIONS and start + 1 < len(data):
+                target = data[start + 1]
+                end = start + 1  # Last byte of the jump
+                if target <= address <= end and (best is None or end - target < best[1] - best[0]):
+                    best = (target, end)
+        return best
+
+    def _build_address_lines(self):
+        """
+        Fill address_basic_line: the BASIC line of the instruction starting
+        at each address (None where there is none). Padded past 0xFF so a PC
+        that ran off the end of memory still indexes safely.
+        """
+        lines = [None] * (Memory.SIZE + DecodeCache.MAX_LENGTH)
+        asm_to_basic = self.asm_to_basic_map
+        for address, asm_line in self.line_map.items():
+            lines[address] = asm_to_basic.get(asm_line)
+        self.address_basic_line = lines
+
     def stop(self):
         self.clock.stop()
 
     def set_speed(self, hz):
         self.clock.set_speed(hz)
 
+    def run_burst(self, cycles, deadline):
+        """
+        Clock tick: execute instructions until `cycles` more clock cycles
+        have elapsed, stopping early once the wall-clock deadline
+        (perf_counter seconds) has passed. An instruction that overshoots
+        the target borrows from the next burst; cycles a burst did not get to
+        before its deadline are dropped (see Clock).
+        """
+        self._cycle_target = min(self._cycle_target, self.cpu.cycles) + cycles
+        start = time.perf_counter()
+        try:
+            if self.breakpoints.active:
+                self._run_burst_checked(self._cycle_target, deadline)
+            elif self.translator is not None:
+                self._run_burst_translated(self._cycle_target, deadline)
+            else:
+                self._run_burst_interpreted(self._cycle_target, deadline)
+        finally:
+            self.execution_time += time.perf_counter() - start
+
+    def _run_burst_interpreted(self, target, deadline):
+        """run_burst one instruction at a time, until cpu.cycles reaches target"""
+        cpu = self.cpu
+        handle_tick = self.handle_tick
+        now = time.perf_counter
+        i = 0
+        while cpu.cycles < target:
+            if cpu.halted:
+                self.clock.stop()
+                return
+            if self.interrupt_requested:
+                return
+            handle_tick()
+            # Check the budget every 64 instructions
+            if not (i & 0x3F) and now() >= deadline:
+                return
+            i += 1
+
+    def _run_burst_checked(self, target, deadline):
+        """run_burst that stops at breakpoints and watchpoints"""
+        cpu = self.cpu
+        handle_tick = self.handle_tick
+        breakpoints = self.breakpoints
+        check = breakpoints.check
+        now = time.perf_counter
+        skip, self._resume_pc = self._resume_pc, None
+        i = 0
+        while cpu.cycles < target:
+            if cpu.halted:
+                self.clock.stop()
+                return
+            if self.interrupt_requested:
+                return
+            pc = cpu.PC
+            if pc != skip and pc < Breakpoints.SIZE and check[pc] and breakpoints.should_stop(pc):
+                self._stop_at_hit()
+                return
+            skip = None
+            handle_tick()
+            if breakpoints.hit is not None:
+                self._stop_at_hit()
+                return
+            # Check the budget every 64 instructions
+            if not (i & 0x3F) and now() >= deadline:
+                return
+            i += 1
+
+    def _breakpoint_reached(self):
+        """After an instruction: stop if it hit a watchpoint or PC is at a breakpoint"""
+        breakpoints = self.breakpoints
+        pc = self.cpu.PC
+        if breakpoints.hit is None and pc < Breakpoints.SIZE and breakpoints.check[pc]:
+            breakpoints.should_stop(pc)
+        if breakpoints.hit is None:
+            return False
+        self._stop_at_hit()
+        return True
+
+    def _stop_at_hit(self):
+        """Stop the clock and announce breakpoints.hit"""
+        self.clock.stop()
+        kind, address = self.breakpoints.hit
+        signals.breakpoint_hit.emit(kind, address)
+
+    def _run_burst_translated(self, target, deadline):
+        """run_burst through translated basic blocks (headless)"""
+        cpu = self.cpu
+        run = self.translator.run
+        now = time.perf_counter
+        while cpu.cycles < target:
+            if cpu.halted:
+                self.clock.stop()
+                return
+            if self.interrupt_requested:
+                return
+            # An instruction count that cannot overshoot the remaining cycles
+            count = max((target - cpu.cycles) // CPU.MAX_CYCLES, 1)
+            run(min(count, self.TRANSLATED_CHUNK))
+            if now() >= deadline:
+                return
+
     def handle_tick(self):
         if self.cpu.halted:
             self.clock.stop()
@@ -118,7 +596,7 @@ class SimManager:
 
         # Emit the current source line being executed
         current_address = self.cpu.PC
-        if current_address in self.line_map:
+        if not self.headless and current_address in self.line_map:
             line_num = self.line_map[current_address]
             signals.current_line_changed.emit(line_num)
 
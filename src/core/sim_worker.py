@@ -0,0 +1,134 @@
+"""
+Simulation worker thread for BasCAT
+
+Runs the CPU on a dedicated thread so long operations (Run at full speed, a
+Step Over across a whole FOR loop) never block the GUI event loop.
+
+The GUI talks to the worker through a command queue (run, pause, step,
+step_over, step_out, run_to_line, run_until_address, run_until_halt,
+run_instructions, speed, input). Every command and every
+clock burst executes with SimManager.lock held, so the GUI can read a
+consistent snapshot or flush the frame delta by taking the same lock between
+bursts. If execution fails (e.g. PC runs past the end of memory), the worker
+stops the clock, emits signals.simulation_error and keeps serving commands.
+"""
+
+import queue
+import threading
+import time
+
+from src.core.signals import signals
+
+
+class SimWorker(threading.Thread):
+    """
+    Worker thread that owns execution of a SimManager.
+
+    The worker is also the timer backend of sim.clock: while the clock is
+    running it calls clock.pulse() every clock.interval_ms().
+    """
+
+    # Commands that must break out of a long-running burst or step-over
+    INTERRUPTING = {"pause", "quit"}
+
+    def __init__(self, sim):
+        super().__init__(name="SimWorker", daemon=True)
+        self.sim = sim
+        self.commands = queue.Queue()
+
+    def post(self, command, *args):
+        """Queue a command for the worker (returns immediately)"""
+        if command in self.INTERRUPTING:
+            self.sim.request_interrupt()
+        self.commands.put((command, args))
+
+    def call(self, function, *args):
+        """
+        Run function(*args) on the calling thread with the simulator locked,
+        interrupting any long-running command first. Returns its result.
+        """
+        self.sim.request_interrupt()
+        with self.sim.lock:
+            try:
+                return function(*args)
+            finally:
+                self.sim.clear_interrupt()
+
+    def shutdown(self, timeout=1.0):
+        """Stop the worker thread"""
+        self.post("quit")
+        if self.is_alive():
+            self.join(timeout)
+
+    def run(self):
+        sim = self.sim
+        clock = sim.clock
+        next_pulse = None
+
+        while True:
+            # Sleep until the next clock pulse, or until a command arrives
+            if clock.running:
+                now = time.perf_counter()
+                if next_pulse is None:
+                    next_pulse = now + clock.interval_ms() / 1000.0
+                timeout = max(0.0, next_pulse - now)
+            else:
+                next_pulse = None
+                timeout = None
+
+            try:
+                command, args = self.commands.get(timeout=timeout)
+            except queue.Empty:
+                command = None
+
+            if command == "quit":
+                break
+
+            with sim.lock:
+                try:
+                    if command is not None:
+                        sim.clear_interrupt()
+                        self._execute(command, args)
+                        continue
+                    clock.pulse()
+                except Exception as error:
+                    self._report(error)
+                    continue
+
+            # Pulses are paced from the previous target; Clock itself
+            # compensates for any lateness when counting owed instructions.
+            next_pulse += clock.interval_ms() / 1000.0
+            if next_pulse < time.perf_counter():
+                next_pulse = None
+
+    def _report(self, error):
+        """Stop after a failed command or pulse (simulator lock held)"""
+        self.sim.stop()
+        signals.simulation_error.emit(f"{type(error).__name__}: {error}")
+
+    def _execute(self, command, args):
+        """Execute one queued command (simulator lock held)"""
+        sim = self.sim
+        if command == "run":
+            sim.run()
+        elif command == "pause":
+            sim.stop()
+        elif command == "step":
+            sim.step()
+        elif command == "step_over":
+            sim.step_over()
+        elif command == "step_out":
+            sim.step_out()
+        elif command == "run_to_line":
+            sim.run_to_line(*args)
+        elif command == "run_until_address":
+            sim.run_until_address(*args)
+        elif command == "run_until_halt":
+            sim.run_until_halt(*args)
+        elif command == "run_instructions":
+            sim.run_instructions(*args)
+        elif command == "speed":
+            sim.set_speed(*args)
+        elif command == "input":
+            for value in args[0]:
+                sim.memory.io_controller.queue_input(value)
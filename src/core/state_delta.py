@@ -0,0 +1,177 @@
+"""
+Frame-coalesced state deltas for BasCAT
+
+Instead of repainting on every register write, PC increment and bus transfer,
+the GUI consumes one StateDelta per display frame. DeltaRecorder listens to the
+core signal hub, folds every micro-operation into the pending delta, and hands
+it over on flush().
+"""
+
+from src.core.alu import unpack_flags
+
+
+class StateDelta:
+    """
+    Compact summary of everything that changed since the previous frame.
+
+    registers:      register name -> latest value (only registers written)
+    pc/ir/mar/sp:   latest value, or None if unchanged
+    flags:          latest flags dict, or None if unchanged (built on flush
+                    from the packed byte carried by flags_updated)
+    dirty_memory:   set of RAM addresses written
+    bus_activity:   (source, dest, bus_type) -> [count, last value]
+    output:         bytes written to the OUTPUT port, in order
+    output_cleared: True if the output buffer was cleared (before `output`)
+    line:           last source line executed, or None
+    instructions:   number of instructions executed
+    cycles:         clock cycles executed (see CPU.CYCLES)
+    execution_time: seconds the simulator spent in clock bursts
+    """
+
+    __slots__ = ("registers", "pc", "ir", "mar", "sp", "flags", "dirty_memory",
+                 "bus_activity", "output", "output_cleared", "line", "instructions",
+                 "cycles", "execution_time")
+
+    def __init__(self):
+        self.registers = {}
+        self.pc = None
+        self.ir = None
+        self.mar = None
+        self.sp = None
+        self.flags = None
+        self.dirty_memory = set()
+        self.bus_activity = {}
+        self.output = []
+        self.output_cleared = False
+        self.line = None
+        self.instructions = 0
+        self.cycles = 0
+        self.execution_time = 0.0
+
+    def is_empty(self):
+        """True if nothing changed"""
+        return not (self.registers or self.dirty_memory or self.bus_activity or self.output
+                    or self.output_cleared or self.instructions or self.cycles
+                    or self.pc is not None or self.ir is not None or self.mar is not None
+                    or self.sp is not None or self.flags is not None or self.line is not None)
+
+    def bus_transfer_count(self):
+        """Total number of bus transfers folded into this delta"""
+        return sum(count for count, _ in self.bus_activity.values())
+
+
+class DeltaRecorder:
+    """
+    Accumulates hub signals into a StateDelta until flush() is called.
+    """
+
+    def __init__(self, hub):
+        self.hub = hub
+        self._delta = StateDelta()
+        self._connections = [
+            (hub.register_updated, self._on_register),
+            (hub.pc_updated, self._on_pc),
+            (hub.ir_updated, self._on_ir),
+            (hub.mar_updated, self._on_mar),
+            (hub.sp_updated, self._on_sp),
+            (hub.flags_updated, self._on_flags),
+            (hub.memory_changed, self._on_memory),
+            (hub.memory_bulk_changed, self._on_memory_bulk),
+            (hub.bus_transfer, self._on_bus),
+            (hub.output_written, self._on_output),
+            (hub.output_cleared, self._on_output_cleared),
+            (hub.current_line_changed, self._on_line),
+            (hub.instruction_executed, self._on_instruction),
+        ]
+        self.attached = False
+        self.attach()
+
+    def attach(self):
+        """Start recording"""
+        if not self.attached:
+            for signal, slot in self._connections:
+                signal.connect(slot)
+            self.attached = True
+
+    def detach(self):
+        """Stop recording (pending changes are kept until the next flush)"""
+        if self.attached:
+            for signal, slot in self._connections:
+                signal.disconnect(slot)
+            self.attached = False
+
+    def flush(self):
+        """Return the accumulated delta and start a new one"""
+        delta = self._delta
+        self._delta = StateDelta()
+        if delta.flags is not None:
+            delta.flags = unpack_flags(delta.flags)
+        return delta
+
+    def record_state(self, cpu, line=None, instructions=0, output=()):
+        """
+        Fold the complete CPU and memory state into the pending delta, after
+        a run that executed with the recorder detached.
+        """
+        delta = self._delta
+        delta.registers.update(dict(cpu.registers))
+        delta.pc = cpu.PC
+        delta.ir = cpu.IR
+        delta.mar = cpu.MAR
+        delta.sp = cpu.SP
+        delta.flags = cpu.alu.packed_flags
+        delta.dirty_memory.update(range(cpu.memory.SIZE))
+        delta.output.extend(output)
+        if line is not None:
+            delta.line = line
+        delta.instructions += instructions
+
+    # ----- Hub slots -----
+
+    def _on_register(self, name, value):
+        self._delta.registers[name] = value
+
+    def _on_pc(self, value):
+        self._delta.pc = value
+
+    def _on_ir(self, value):
+        self._delta.ir = value
+
+    def _on_mar(self, value):
+        self._delta.mar = value
+
+    def _on_sp(self, value):
+        self._delta.sp = value
+
+    def _on_flags(self, packed):
+        self._delta.flags = packed
+
+    def _on_memory(self, address, value):
+        self._delta.dirty_memory.add(address)
+
+    def _on_memory_bulk(self, start, length):
+        self._delta.dirty_memory.update(range(start, start + length))
+
+    def _on_bus(self, source, dest, value, bus_type):
+        activity = self._delta.bus_activity
+        key = (source, dest, bus_type)
+        entry = activity.get(key)
+        if entry is None:
+            activity[key] = [1, value]
+        else:
+            entry[0] += 1
+            entry[1] = value
+
+    def _on_output(self, value):
+        self._delta.output.append(value)
+
+    def _on_output_cleared(self):
+        delta = self._delta
+        delta.output.clear()
+        delta.output_cleared = True
+
+    def _on_line(self, line_number):
+        self._delta.line = line_number
+
+    def _on_instruction(self, address):
+        self._delta.instructions += 1
@@ -0,0 +1,76 @@
+"""
+Throughput measurement for BasCAT
+
+Turns per-frame counts (instructions, clock cycles, time spent executing and
+time spent updating the views) into rolling rates, so the GUI can show
+whether the simulator or the visualization limits the speed.
+"""
+
+import time
+from collections import deque
+
+
+class ThroughputMeter:
+    """
+    Rolling execution rates, recomputed every `interval` seconds.
+
+    After each completed interval:
+    - ips:          instructions per second
+    - effective_hz: clock cycles per second
+    - cpu_share:    fraction of wall-clock time spent executing instructions
+    - gui_share:    fraction of wall-clock time spent applying frame updates
+    and the last `history` values of each are kept in `history` (for
+    sparklines).
+    """
+
+    SERIES = ("ips", "effective_hz", "cpu_share", "gui_share")
+
+    def __init__(self, interval=0.5, history=60, time_source=time.perf_counter):
+        self.interval = interval
+        self._time = time_source
+        self.history = {name: deque(maxlen=history) for name in self.SERIES}
+        self.reset()
+
+    def reset(self):
+        """Forget all measurements"""
+        self._start = self._time()
+        self._instructions = 0
+        self._cycles = 0
+        self._execution_time = 0.0
+        self._gui_time = 0.0
+        self.ips = 0.0
+        self.effective_hz = 0.0
+        self.cpu_share = 0.0
+        self.gui_share = 0.0
+        for series in self.history.values():
+            series.clear()
+
+    def add(self, instructions=0, cycles=0, execution_time=0.0, gui_time=0.0):
+        """Count work done in the current interval"""
+        self._instructions += instructions
+        self._cycles += cycles
+        self._execution_time += execution_time
+        self._gui_time += gui_time
+
+    def sample(self):
+        """
+        Close the current interval if it has lasted `interval` seconds.
+        Returns True if the rates were updated.
+        """
+        now = self._time()
+        elapsed = now - self._start
+        if elapsed < self.interval:
+            return False
+        self.ips = self._instructions / elapsed
+        self.effective_hz = self._cycles / elapsed
+        self.cpu_share = min(self._execution_time / elapsed, 1.0)
+        self.gui_share = min(self._gui_time / elapsed, 1.0)
+        for name in self.SERIES:
+            self.history[name].append(getattr(self, name))
+
+        self._start = now
+        self._instructions = 0
+        self._cycles = 0
+        self._execution_time = 0.0
+        self._gui_time = 0.0
+        return True
@@ -0,0 +1,529 @@
+"""
+Basic-block translator for BasCAT
+
+Translates straight-line runs of CAL-EB code into Python closures so loops
+execute without per-instruction dispatch. A basic block starts at any address
+execution reaches and ends after the first JMP/JZ/JNZ/JC/JNC/HALT/IN (or
+before an instruction that overlaps the I/O ports). Inside a block registers,
+SP and the packed flags byte live in local variables and are written back to
+the CPU when the block exits. Arithmetic uses the ALU's precomputed tables.
+
+Blocks are invalidated like predecoded instructions: the translator registers
+with the CPU's DecodeCache, so Memory writes into a block's bytes drop it. A
+block that writes into its own code exits right after that write, so the
+modified instructions are re-translated before they run.
+
+The translator runs without observers; it is meant for headless execution
+and for the quiet runs of SimManager (run_until_halt, run_instructions).
+
+While a profile is set (set_profile), every block counts its exits by the
+number of instructions they had executed, and collect_profile() folds those
+counters (and the cycles of the instructions they stand for) into the
+per-address profile.
+"""
+
+from src.core import alu as alu_tables
+from src.core.cpu import REGISTER_INDEX, REGISTER_NAMES
+from src.core.io_controller import IOController
+
+
+# Block terminators: branches, HALT and IN (which may block for input)
+BRANCH_OPCODES = frozenset((0x10, 0x11, 0x12, 0x13, 0x14))
+TERMINATORS = BRANCH_OPCODES | {0xFF, 0x41}
+
+
+class BasicBlock:
+    """
+    A translated block: run(budget) executes it (repeatedly, for a block that
+    loops to itself, while the budget allows) and returns the instruction count.
+    """
+
+    __slots__ = ("start", "end", "length", "run", "source", "addresses", "cycles", "hits")
+
+    def __init__(self, start, end, length, run, source, addresses=(), cycles=(), hits=None):
+        self.start = start    # Address of the first instruction
+        self.end = end        # Address after the last instruction
+        self.length = length  # Number of instructions
+        self.run = run
+        self.source = source  # Generated Python, for debugging
+        self.addresses = addresses  # Address of each instruction
+        self.cycles = cycles  # Clock cycles of each instruction
+        # Profiling: hits[n] counts passes that executed the first n instructions
+        self.hits = hits
+
+
+class BlockTranslator:
+    """
+    Translates and runs basic blocks for a CPU.
+
+    run(budget) executes up to `budget` instructions, block by block. A block
+    that does not fit in the remaining budget is executed instruction by
+    instruction through the CPU interpreter, so the count is exact.
+    """
+
+    MAX_FACTORIES = 4096  # Compiled blocks remembered across reloads
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+        self.memory = cpu.memory
+        self.blocks = [None] * self.memory.SIZE
+        # (start, code bytes) -> compiled block factory, kept across clear()
+        # so reloading or restarting a program does not recompile it
+        self._factories = {}
+        # Address -> start addresses of the blocks covering it
+        self._covering = [set() for _ in range(self.memory.SIZE)]
+        self.profile = None  # Profiler receiving the counts (see set_profile)
+        self._retired = []  # Dropped blocks whose hits are not collected yet
+
+        cache = cpu._decode_cache
+        self._guard = cache.guard
+        cache.dependents.append(self)
+
+    # ----- Execution -----
+
+    def run(self, budget):
+        """Execute up to `budget` instructions; returns the number executed"""
+        cpu = self.cpu
+        blocks = self.blocks
+        translate = self.translate
+        executed = 0
+        while executed < budget and not cpu.halted:
+            pc = cpu.PC
+            try:
+                block = blocks[pc] or translate(pc)
+            except IndexError:
+                block = None  # PC ran off the end; the interpreter raises
+            if block is None or block.length > budget - executed:
+                cpu.execute_instruction()
+                executed += 1
+            else:
+                executed += block.run(budget - executed)
+        return executed
+
+    def run_until(self, budget, stops):
+        """
+        Like run(), but return before executing an address flagged in the
+        bytearray `stops` (the first instruction always executes). Blocks
+        containing a flagged address run through the interpreter.
+        """
+        cpu = self.cpu
+        blocks = self.blocks
+        translate = self.translate
+        find = stops.find
+        executed = 0
+        while executed < budget and not cpu.halted:
+            pc = cpu.PC
+            if executed and stops[pc]:
+                break
+            try:
+                block = blocks[pc] or translate(pc)
+            except IndexError:
+                block = None
+            if block is None or block.length > budget - executed or find(1, block.start, block.end) >= 0:
+                cpu.execute_instruction()
+                executed += 1
+            else:
+                executed += block.run(budget - executed)
+        return executed
+
+    # ----- Invalidation (called by DecodeCache) -----
+
+    def invalidate(self, address):
+        """Drop every block covering address"""
+        for start in tuple(self._covering[address]):
+            self._drop(start)
+
+    def clear(self):
+        """Drop all blocks"""
+        self._retired += [block for block in self.blocks
+                          if block is not None and block.hits is not None]
+        self.blocks[:] = [None] * len(self.blocks)
+        for starts in self._covering:
+            starts.clear()
+
+    def _drop(self, start):
+        block = self.blocks[start]
+        if block is not None:
+            self.blocks[start] = None
+            for address in range(block.start, block.end):
+                self._covering[address].discard(start)
+            if block.hits is not None:
+                # It may still be running: collect its hits later
+                self._retired.append(block)
+
+    # ----- Profiling -----
+
+    def set_profile(self, profiler):
+        """
+        Count executions and cycles per address into a Profiler, or stop
+        with None. Blocks are retranslated with or without their exit
+        counters.
+        """
+        self.collect_profile()
+        self.clear()
+        self._retired.clear()
+        self.profile = profiler
+
+    def collect_profile(self):
+        """Add the blocks' exit counters to the profile and zero them"""
+        if self.profile is None:
+            return
+        counts = self.profile.counts
+        cycles = self.profile.cycles
+        blocks = [block for block in self.blocks if block is not None] + self._retired
+        self._retired = []
+        for block in blocks:
+            hits = block.hits
+            if not any(hits):
+                continue
+            # Instruction i ran in every pass that executed more than i instructions
+            executed = 0
+            for i in range(block.length, 0, -1):
+                executed += hits[i]
+                address = block.addresses[i - 1]
+                counts[address] += executed
+                cycles[address] += executed * block.cycles[i - 1]
+            hits[:] = [0] * len(hits)
+
+    # ----- Translation -----
+
+    def translate(self, start):
+        """Translate the block at start, or return None if it cannot be"""
+        instructions = self._scan(start)
+        if not instructions:
+            return None
+        end = instructions[-1][0] + instructions[-1][2]
+        memory = self.memory
+        profiling = self.profile is not None
+        key = (start, bytes(memory._data[start:end]), profiling)
+        factory = self._factories.get(key)
+        if factory is None:
+            if len(self._factories) >= self.MAX_FACTORIES:
+                self._factories.clear()
+            source = _BlockCompiler(self.cpu, start, end, instructions, profiling).compile()
+            namespace = {name: getattr(alu_tables, name) for name in _TABLES}
+            exec(compile(source, f"<block {start:#04x}>", "exec"), namespace)
+            factory = namespace["make_block"]
+            factory.source = source
+            self._factories[key] = factory
+
+        io = memory.io_controller
+        hits = [0] * (len(instructions) + 1) if profiling else None
+        run = factory(
+            self.cpu, self.cpu.regs, self.cpu.alu, memory._data,
+            self._guard, self.cpu._decode_cache.invalidate, memory.read,
+            memory.write, io.write_output, io.has_input, hits)
+
+        block = BasicBlock(start, end, len(instructions), run, factory.source,
+                           [instruction[0] for instruction in instructions],
+                           [self.cpu.CYCLES[instruction[1]] for instruction in instructions], hits)
+        self.blocks[start] = block
+        self._guard[start:end] = b"\x01" * (end - start)
+        for address in range(start, end):
+            self._covering[address].add(start)
+        return block
+
+    def _scan(self, start):
+        """Decode instructions from start up to and including a terminator"""
+        data = self.memory._data
+        layout = self.cpu.OPERAND_LAYOUT
+        instructions = []
+        address = start
+        while address < IOController.OUTPUT_PORT:
+            opcode = data[address]
+            length = 1 + len(layout[opcode])
+            if address + length > IOController.OUTPUT_PORT:
+                break
+            instructions.append((address, opcode, length, bytes(data[address + 1:address + length])))
+            address += length
+            if opcode in TERMINATORS:
+                break
+        return instructions
+
+
+# ALU tables visible to generated code
+_TABLES = ("RESULT_FLAGS", "ADD_RESULT", "ADD_FLAGS", "SUB_RESULT", "SUB_FLAGS")
+
+
+class _BlockCompiler:
+    """
+    Generates the Python source of one basic block.
+
+    The generated closure takes the instruction budget and returns the number
+    of instructions it executed. A block whose branch jumps back to its own
+    start (a loop) iterates inside the closure while the budget allows.
+    Every exit writes back all registers, SP and flags the block modifies and
+    adds the executed clock cycles to cpu.cycles, so
+    exit code is rendered after the body, once those sets are known.
+    """
+
+    def __init__(self, cpu, start, end, instructions, profiling=False):
+        self.cpu = cpu
+        self.profiling = profiling  # Count exits in hits[instructions executed]
+        self.start = start
+        self.end = end
+        self.instructions = instructions
+        self.lines = []          # Source lines, or exit tuples rendered later
+        self.regs_used = set()
+        self.regs_written = []   # Registers to write back, in first-write order
+        self.flags_read = False  # Flags read before any instruction sets them
+        self.sp_used = False
+        self.flags_set = False
+
+        # Clock cycles of the first n instructions
+        self.cycles = [0]
+        for _, opcode, _, _ in instructions:
+            self.cycles.append(self.cycles[-1] + cpu.CYCLES[opcode])
+
+        address, opcode, _, operands = instructions[-1]
+        self.loop = opcode in BRANCH_OPCODES and operands[0] == start
+        self.base = 2 if self.loop else 1
+        self.live_flags = self._flag_liveness()
+        self.index = 0  # Instruction being compiled
+
+    def _flag_liveness(self):
+        """
+        Per instruction: True if the flags it sets can be observed, i.e. a
+        branch or a block exit comes before the next instruction setting them.
+        """
+        cpu = self.cpu
+        live = True  # Flags are written back when the block exits
+        result = [True] * len(self.instructions)
+        for i in range(len(self.instructions) - 1, -1, -1):
+            _, opcode, _, operands = self.instructions[i]
+            has_reg = bool(operands) and REGISTER_INDEX[operands[-1 if opcode == 0x31 else 0]] is not None
+            if opcode in cpu.ALU_OPS or opcode in (0x08, 0x09):
+                if has_reg:
+                    result[i] = live
+                    live = False
+            elif opcode in BRANCH_OPCODES:
+                live = True
+            elif opcode in (0x20, 0x41) and has_reg:
+                live = True  # May exit (self-modifying PUSH, IN waiting for input)
+            elif opcode == 0x31 and has_reg and self.start <= operands[0] < self.end:
+                live = True  # Self-modifying STM exits
+        return result
+
+    def reg(self, index):
+        """Local variable for a register index, or None if it does not exist"""
+        number = REGISTER_INDEX[index]
+        if number is None:
+            return None
+        self.regs_used.add(number)
+        return "r" + REGISTER_NAMES[number]
+
+    def operand(self, byte_val):
+        """Expression for a Value/Reg operand byte"""
+        if byte_val & 0x80:
+            return self.reg(byte_val & 0x7F) or "0"
+        return str(byte_val)
+
+    def emit(self, line, indent=0):
+        self.lines.append("    " * (self.base + indent + 1) + line)
+
+    def assign(self, var, expr, indent=0):
+        self.emit(f"{var} = {expr}", indent)
+        number = REGISTER_NAMES.index(var[1:])
+        if number not in self.regs_written:
+            self.regs_written.append(number)
+
+    def set_flags(self, expr):
+        """Set the packed flags local F, unless a later instruction overwrites them"""
+        if not self.live_flags[self.index]:
+            return  # Overwritten before anything can observe them
+        self.emit(f"F = {expr}")
+        self.flags_set = True
+
+    def exit(self, pc, address, opcode, length, count, indent=0):
+        """Write back state and return, leaving PC at `pc`"""
+        self.lines.append((self.base + indent + 1, pc, opcode, address + length - 1, count))
+
+    def loop_back(self, address, opcode, length, count, indent=0):
+        """Taken branch of a looping block: iterate again if the budget allows"""
+        self.emit(f"done += {count}", indent)
+        self.emit(f"if done + {count} > budget:", indent)
+        self.exit(self.start, address, opcode, length, 0, indent + 1)
+        self.emit("continue", indent)
+
+    def render_exit(self, depth, pc, opcode, mar, count):
+        pad = "    " * depth
+        total = len(self.instructions)
+        cycles = self.cycles[count]
+        if self.loop:
+            # `done` counts the instructions of completed iterations
+            cycles = f"done // {total} * {self.cycles[-1]} + {cycles}"
+        lines = [f"cpu.IR = {opcode}", f"cpu.MAR = {mar}", f"cpu.PC = {pc}",
+                 f"cpu.cycles += {cycles}"]
+        if self.profiling:
+            lines.append(f"hits[{count}] += 1")
+            if self.loop:
+                lines.append(f"hits[{total}] += done // {total}")
+        if self.loop:
+            count = f"done + {count}" if count else "done"
+        lines += [f"regs[{n}] = r{REGISTER_NAMES[n]}" for n in self.regs_written]
+        if self.sp_used:
+            lines.append("cpu.SP = SP")
+        if self.flags_set:
+            lines.append("alu.packed_flags = F")
+        lines.append(f"return {count}")
+        return [pad + line for line in lines]
+
+    def store(self, addr_expr, value, address, opcode, length, count, constant=None):
+        """Memory write with code-guard check; exits if the block modified itself"""
+        if constant is not None and constant >= IOController.OUTPUT_PORT:
+            self.emit(f"write({constant}, {value})")
+            return
+        indent = 0
+        if constant is None:
+            self.emit(f"if {addr_expr} < {IOController.OUTPUT_PORT}:")
+            indent = 1
+        self.emit(f"data[{addr_expr}] = {value}", indent)
+        self.emit(f"if guard[{addr_expr}]:", indent)
+        self.emit(f"invalidate({addr_expr})", indent + 1)
+        next_pc = address + length
+        if constant is None:
+            self.emit(f"if {self.start} <= {addr_expr} < {self.end}:", indent + 1)
+            self.exit(next_pc, address, opcode, length, count, indent + 2)
+            self.emit("else:")
+            self.emit(f"write({addr_expr}, {value})", 1)
+        elif self.start <= constant < self.end:
+            self.exit(next_pc, address, opcode, length, count, indent + 1)
+
+    def compile(self):
+        cpu = self.cpu
+        flags_known = False
+        total = len(self.instructions)
+
+        for count, (address, opcode, length, operands) in enumerate(self.instructions, 1):
+            self.index = count - 1
+            next_pc = address + length
+            x = operands[0] if operands else None
+            y = operands[1] if len(operands) > 1 else None
+
+            if opcode == 0x01:  # LOAD Reg, Value
+                r = self.reg(x)
+                if r:
+                    self.assign(r, str(y))
+
+            elif opcode in cpu.ALU_OPS:  # ADD/SUB/AND/OR/XOR Reg, Value/Reg
+                r = self.reg(x)
+                if r:
+                    value = self.operand(y)
+                    op = cpu.ALU_OPS[opcode]
+                    if op in ("ADD", "SUB"):
+                        self.emit(f"t = ({r} << 8) | {value}")
+                        self.assign(r, f"{op}_RESULT[t]")
+                        self.set_flags(f"{op}_FLAGS[t]")
+                    else:
+                        symbol = {"AND": "&", "OR": "|", "XOR": "^"}[op]
+                        self.assign(r, f"{r} {symbol} {value}")
+                        self.set_flags(f"RESULT_FLAGS[{r}]")
+                    flags_known = True
+
+            elif opcode == 0x04:  # MOV Dest, Source
+                r = self.reg(x)
+                if r:
+                    if y & 0x80:
+                        source = self.reg(y & 0x7F)
+                        if source:
+                            self.assign(r, source)
+                    else:
+                        self.assign(r, str(y))
+
+            elif opcode == 0x08:  # NOT Reg
+                r = self.reg(x)
+                if r:
+                    self.assign(r, f"{r} ^ 255")
+                    self.set_flags(f"RESULT_FLAGS[{r}]")
+                    flags_known = True
+
+            elif opcode == 0x09:  # CMP Reg, Value
+                r = self.reg(x)
+                if r:
+                    self.set_flags(f"SUB_FLAGS[({r} << 8) | {y}]")
+                    flags_known = True
+
+            elif opcode in BRANCH_OPCODES:  # JMP/JZ/JNZ/JC/JNC Address
+                condition = cpu.JUMP_CONDITIONS[opcode]
+                indent = 0
+                if condition is not None:
+                    bit, expected = condition
+                    if not flags_known:
+                        self.flags_read = True
+                    self.emit(f"if F & {bit}:" if expected else f"if not F & {bit}:")
+                    indent = 1
+                if self.loop:
+                    self.loop_back(address, opcode, length, count, indent)
+                else:
+                    self.exit(x, address, opcode, length, count, indent)
+                if condition is not None:
+                    self.exit(next_pc, address, opcode, length, count)
+
+            elif opcode == 0x20:  # PUSH Reg
+                r = self.reg(x)
+                if r:
+                    self.sp_used = True
+                    self.emit("addr = SP")
+                    self.emit("SP = (SP - 1) & 255")
+                    self.store("addr", r, address, opcode, length, count)
+
+            elif opcode == 0x21:  # POP Reg
+                r = self.reg(x)
+                if r:
+                    self.sp_used = True
+                    self.emit("SP = (SP + 1) & 255")
+                    self.assign(r, f"read(SP) if SP == {IOController.INPUT_PORT} else data[SP]")
+
+            elif opcode == 0x30:  # LDM Reg, [addr]
+                r = self.reg(x)
+                if r:
+                    if y == IOController.INPUT_PORT:
+                        self.assign(r, f"read({y})")
+                    else:
+                        self.assign(r, f"data[{y}]")
+
+            elif opcode == 0x31:  # STM [addr], Reg
+                r = self.reg(y)
+                if r:
+                    self.store(str(x), r, address, opcode, length, count, constant=x)
+
+            elif opcode == 0x40:  # OUT Reg
+                r = self.reg(x)
+                if r:
+                    self.emit(f"write_output({r})")
+                    self.emit(f"data[{IOController.OUTPUT_PORT}] = {r}")
+
+            elif opcode == 0x41:  # IN Reg - blocks (stays on IN) until input is queued
+                r = self.reg(x)
+                if r:
+                    self.emit("if not has_input():")
+                    self.exit(address, address, opcode, length, count, 1)
+                    self.assign(r, f"read({IOController.INPUT_PORT})")
+
+            elif opcode == 0xFF:  # HALT
+                self.emit("cpu.halted = True")
+
+            if count == total and opcode not in BRANCH_OPCODES:
+                self.exit(next_pc, address, opcode, length, count)
+
+        # Registers and flags written anywhere must hold their entry values
+        # at any exit reached before the write (e.g. on a later iteration).
+        prologue = [f"r{REGISTER_NAMES[n]} = regs[{n}]" for n in sorted(self.regs_used)]
+        if self.sp_used:
+            prologue.append("SP = cpu.SP")
+        if self.flags_set or self.flags_read:
+            prologue.append("F = alu.packed_flags")
+        if self.loop:
+            prologue += ["done = 0", "while True:"]
+
+        body = []
+        for line in self.lines:
+            body += self.render_exit(*line) if isinstance(line, tuple) else [line]
+
+        header = [
+            "def make_block(cpu, regs, alu, data, guard, invalidate, read, write,",
+            "               write_output, has_input, hits):",
+            "    def block(budget):",
+        ]
+        footer = ["    return block"]
+        return "\n".join(header + ["        " + line for line in prologue] + body + footer) + "\n"
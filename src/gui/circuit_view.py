@@ -1,8 +1,17 @@
+import time
+
 from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene
 from PyQt6.QtGui import QPainter, QBrush, QColor, QPen
 from PyQt6.QtCore import Qt
 
 class CircuitView(QGraphicsView):
+    # Bus animation limits
+    PACKET_POOL_SIZE = 6        # DataPackets created once and reused
+    MAX_PACKETS_PER_FRAME = 2   # New packet animations started per frame
+    PACKET_DURATION_MS = 500
+    GLOW_RATE = 20.0            # Transfers/sec above which buses glow instead
+    GLOW_HOLD_MS = 250          # How long a glow outlives the last transfer
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.scene = QGraphicsScene(self)
@@ -21,6 +30,11 @@ class CircuitView(QGraphicsView):
         self.draw_grid()
         self.setup_scene()
 
+        # Level of detail: above glow_rate bus transfers per second the buses
+        # glow instead of animating individual packets
+        self.glow_rate = self.GLOW_RATE
+        self.setup_packet_pool()
+
 
     def draw_grid(self):
         pen = QPen(QColor("#2a2a2a"))
@@ -175,41 +189,98 @@ class CircuitView(QGraphicsView):
         self.stack_visual.clicked = self.on_stack_clicked
         self.scene.addItem(self.stack_visual)
 
-        # Connect signals
-        from src.core.signals import signals
-        signals.bus_transfer.connect(self.on_bus_transfer)
-        signals.register_updated.connect(self.on_register_updated)
-        signals.pc_updated.connect(self.on_pc_updated)
-        signals.ir_updated.connect(self.on_ir_updated)
-        signals.mar_updated.connect(self.on_mar_updated)
-        signals.sp_updated.connect(self.on_sp_updated)
-        signals.flags_updated.connect(self.on_flags_updated)
-
-    def on_bus_transfer(self, source, dest, value, bus_type):
+        # State changes arrive once per display frame through apply_delta()
+
+    def apply_delta(self, delta):
+        """Apply one frame's worth of state changes (a core StateDelta)"""
+        for register_name, value in delta.registers.items():
+            self.on_register_updated(register_name, value)
+        if delta.pc is not None:
+            self.on_pc_updated(delta.pc)
+        if delta.ir is not None:
+            self.on_ir_updated(delta.ir)
+        if delta.mar is not None:
+            self.on_mar_updated(delta.mar)
+        if delta.sp is not None:
+            self.on_sp_updated(delta.sp)
+        if delta.flags is not None:
+            self.on_flags_updated(delta.flags)
+
+        if delta.bus_activity:
+            self.animate_bus_activity(delta)
+
+    def setup_packet_pool(self):
+        """Create the reusable packets, each with its own animation"""
         from src.gui.components.graphics import DataPacket
-        from PyQt6.QtCore import QVariantAnimation, QEasingCurve
-
-        # Determine path based on source/dest (Simplified mapping)
-        # Ideally we have a routing map. For now, assume everything goes via Main Data Bus?
-        # Or just animate on the specific bus segment if known.
-
+        from PyQt6.QtCore import QVariantAnimation, QEasingCurve, QTimer
+
+        self._free_packets = []
+        for _ in range(self.PACKET_POOL_SIZE):
+            packet = DataPacket([])
+            packet.setVisible(False)
+            self.scene.addItem(packet)
+
+            anim = QVariantAnimation(self)
+            anim.setStartValue(0.0)
+            anim.setEndValue(1.0)
+            anim.setDuration(self.PACKET_DURATION_MS)
+            anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
+            anim.valueChanged.connect(packet.set_progress)
+            anim.finished.connect(lambda entry=(packet, anim): self._release_packet(entry))
+            self._free_packets.append((packet, anim))
+
+        self._last_bus_frame = None
+        self._glow_timer = QTimer(self)
+        self._glow_timer.setSingleShot(True)
+        self._glow_timer.timeout.connect(lambda: self.data_bus_main.set_active(False))
+
+    def animate_bus_activity(self, delta):
+        """Show one frame of bus transfers: packets when slow, a glow when fast"""
+        now = time.monotonic()
+        if self._last_bus_frame is None:
+            elapsed = self.PACKET_DURATION_MS / 1000
+        else:
+            elapsed = max(now - self._last_bus_frame, 0.001)
+        self._last_bus_frame = now
+
+        if delta.bus_transfer_count() / elapsed > self.glow_rate:
+            # All packet paths run along the data bus
+            self.data_bus_main.set_active(True)
+            self._glow_timer.start(self.GLOW_HOLD_MS)
+            return
+
+        # Animate at most one packet per bus path, and a few per frame
+        animated = set()
+        for (source, dest, bus_type), (count, value) in delta.bus_activity.items():
+            path = self._bus_path(source)
+            if path not in animated:
+                if len(animated) == self.MAX_PACKETS_PER_FRAME:
+                    break
+                animated.add(path)
+                self.on_bus_transfer(source, dest, value, bus_type)
+
+    def _bus_path(self, source):
+        """Path a packet from `source` travels along (simplified routing)"""
         # Demo Animation: Animate along the data bus (LEFT_BUS_X = 130)
-        path = [(130, 50), (130, 480)]  # Default - along data bus
         if source == "Memory":
-            path = [(130, 480), (130, 50)]  # Memory (bottom) to CPU (top)
-
-        packet = DataPacket(path)
-        self.scene.addItem(packet)
-
-        anim = QVariantAnimation(self)
-        anim.setStartValue(0.0)
-        anim.setEndValue(1.0)
-        anim.setDuration(500) # 500ms
-        anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        anim.valueChanged.connect(packet.set_progress)
-        anim.finished.connect(lambda: self.scene.removeItem(packet))
+            return ((130, 480), (130, 50))  # Memory (bottom) to CPU (top)
+        return ((130, 50), (130, 480))  # Default - along data bus
+
+    def on_bus_transfer(self, source, dest, value, bus_type):
+        """Send a pooled packet along the bus; dropped if every packet is in flight"""
+        if not self._free_packets:
+            return
+        packet, anim = self._free_packets.pop()
+        packet.set_path(list(self._bus_path(source)))
+        packet.set_progress(0.0)
+        packet.setVisible(True)
         anim.start()
 
+    def _release_packet(self, entry):
+        """Return a finished packet to the pool"""
+        entry[0].setVisible(False)
+        self._free_packets.append(entry)
+
     def on_register_updated(self, register_name, value):
         """Update register visual when register value changes"""
         register_map = {
@@ -1,6 +1,8 @@
+from bisect import bisect_left
+
 from PyQt6.QtWidgets import QGraphicsRectItem, QGraphicsTextItem, QGraphicsItem
-from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPainterPath, QPainterPathStroker
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPainterPath, QPainterPathStroker, QPolygonF
+from PyQt6.QtCore import Qt, QPointF, QRectF
 
 class VisualComponent(QGraphicsRectItem):
     def __init__(self, x, y, width, height, label, show_value=True):
@@ -257,86 +259,93 @@ class BusVisual(QGraphicsItem):
         self.active = False
         self.color = QColor("#444444")
         self.active_color = QColor("#00ff00")
+
+        # Geometry never changes: build the line, hit shape and pens once
+        self._pen = QPen(self.color)
+        self._pen.setWidth(4)
+        self._active_pen = QPen(self.active_color)
+        self._active_pen.setWidth(4)
+        self._line = QPolygonF([QPointF(x, y) for x, y in self.points])
+        path = QPainterPath()
+        if self.points:
+            path.addPolygon(self._line)
+            # Stroke width buffering for hit testing/bounds
+            stroker = QPainterPathStroker()
+            stroker.setWidth(10) # Hit area width
+            path = stroker.createStroke(path)
+        self._shape = path
+        self._bounds = path.boundingRect()
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def set_active(self, active):
+        """Glow (active) or not; repaints only on change"""
+        if active != self.active:
+            self.active = active
+            self.update()
         
     def boundingRect(self):
-        return self.shape().boundingRect()
+        return self._bounds
 
     def shape(self):
-        path = QPainterPath()
-        if not self.points:
-            return path
-        path.moveTo(self.points[0][0], self.points[0][1])
-        for x, y in self.points[1:]:
-            path.lineTo(x, y)
-        
-        # Stroke width buffering for hit testing/bounds
-        stroker = QPainterPathStroker()
-        stroker.setWidth(10) # Hit area width
-        return stroker.createStroke(path)
+        return self._shape
 
     def paint(self, painter, option, widget):
-        pen = QPen(self.active_color if self.active else self.color)
-        pen.setWidth(4)
-        painter.setPen(pen)
-
         if len(self.points) < 2:
             return
-
-        # Draw lines connecting all points
-        for i in range(len(self.points) - 1):
-            p1 = self.points[i]
-            p2 = self.points[i + 1]
-            painter.drawLine(int(p1[0]), int(p1[1]), int(p2[0]), int(p2[1]))
+        painter.setPen(self._active_pen if self.active else self._pen)
+        painter.drawPolyline(self._line)
 
 class DataPacket(QGraphicsItem):
     def __init__(self, path_points, color=QColor("#00ff9d")):
         super().__init__()
-        self.points = path_points
         self.color = color
         self.progress = 0.0 # 0.0 to 1.0 along the path
         self.radius = 5
-        
-        # Calculate total length for accurate speed
-        self.total_length = 0
+
+        # The packet looks the same wherever it is: cache its geometry and
+        # pixmap, so moving it does not repaint
+        r = self.radius
+        self._brush = QBrush(self.color)
+        self._bounds = QRectF(-r, -r, 2 * r, 2 * r)
+        self._shape = QPainterPath()
+        self._shape.addEllipse(self._bounds)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.set_path(path_points)
+
+    def set_path(self, path_points):
+        """Route the packet along new points (pooled packets are reused)"""
+        self.points = path_points
+        self.progress = 0.0
+
+        # Segment lengths and cumulative distance at the start of each point,
+        # for accurate speed and a bisect lookup in set_progress
         self.segments = []
-        if len(self.points) >= 2:
-            for i in range(len(self.points) - 1):
-                p1 = self.points[i]
-                p2 = self.points[i+1]
-                # Dist
-                d = ((p1[0]-p2[0])**2 + (p1[1]-p2[1])**2)**0.5
-                self.segments.append(d)
-                self.total_length += d
+        self.cumulative = [0.0]
+        for (x1, y1), (x2, y2) in zip(self.points, self.points[1:]):
+            d = ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+            self.segments.append(d)
+            self.cumulative.append(self.cumulative[-1] + d)
+        self.total_length = self.cumulative[-1]
                 
     def boundingRect(self):
-        return QGraphicsRectItem(0,0,1,1).boundingRect() # simplified
+        return self._bounds
 
     def shape(self):
-        path = QPainterPath()
-        path.addEllipse(self.pos(), self.radius, self.radius)
-        return path
+        return self._shape
 
     def paint(self, painter, option, widget):
-        painter.setBrush(QBrush(self.color))
+        painter.setBrush(self._brush)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(int(-self.radius), int(-self.radius), int(self.radius*2), int(self.radius*2))
+        painter.drawEllipse(self._bounds)
         
     def set_progress(self, val):
         self.progress = val
-        # Calculate position based on progress
+        if not self.segments:
+            return
+        # Calculate position based on progress: find the segment by bisection
         distance = val * self.total_length
-        current_dist = 0
-        
-        for i, seg_len in enumerate(self.segments):
-            if current_dist + seg_len >= distance:
-                # We are in this segment
-                ratio = (distance - current_dist) / seg_len if seg_len > 0 else 0
-                p1 = self.points[i]
-                p2 = self.points[i+1]
-                
-                new_x = p1[0] + (p2[0] - p1[0]) * ratio
-                new_y = p1[1] + (p2[1] - p1[1]) * ratio
-                self.setPos(new_x, new_y)
-                break
-            current_dist += seg_len
-        self.update()
+        i = min(bisect_left(self.cumulative, distance, 1) - 1, len(self.segments) - 1)
+        seg_len = self.segments[i]
+        ratio = (distance - self.cumulative[i]) / seg_len if seg_len > 0 else 0
+        (x1, y1), (x2, y2) = self.points[i], self.points[i + 1]
+        self.setPos(x1 + (x2 - x1) * ratio, y1 + (y2 - y1) * ratio)
@@ -4,12 +4,15 @@ from PyQt6.QtCore import Qt, pyqtSignal
 class ControlPanel(QWidget):
     # Signals to Main Window -> CPU
     run_clicked = pyqtSignal()
+    pause_clicked = pyqtSignal()
     step_clicked = pyqtSignal()
     step_over_clicked = pyqtSignal()
     reset_clicked = pyqtSignal()
     speed_changed = pyqtSignal(int)
     mode_changed = pyqtSignal(str)  # "basic" or "assembly"
 
+    TURBO_POSITION = 61  # Slider notch above 1 MHz
+
     def __init__(self):
         super().__init__()
         layout = QHBoxLayout(self)
@@ -18,6 +21,7 @@ class ControlPanel(QWidget):
         self.btn_step = QPushButton("Step Into")
         self.btn_step_over = QPushButton("Step Over")
         self.btn_run = QPushButton("Run")
+        self.btn_pause = QPushButton("Pause")
 
         # Mode selector
         self.mode_selector = QComboBox()
@@ -27,33 +31,65 @@ class ControlPanel(QWidget):
             "Assembly Mode: Step through individual assembly instructions"
         )
 
+        # Logarithmic speed scale: 10^(pos/10) Hz, 1 Hz to 1 MHz, top notch = turbo
         self.slider_speed = QSlider(Qt.Orientation.Horizontal)
-        self.slider_speed.setRange(1, 20) # 1Hz to 20Hz
-        self.slider_speed.setValue(1)
+        self.slider_speed.setRange(0, self.TURBO_POSITION)
+        self.slider_speed.setValue(0)
+        self.lbl_speed = QLabel(self.format_speed(1))
+        self.lbl_speed.setMinimumWidth(60)
 
         # Tooltips
         self.btn_reset.setToolTip("Reset CPU and memory")
         self.btn_step.setToolTip("Step Into: Execute one assembly instruction")
         self.btn_step_over.setToolTip("Step Over: Execute one BASIC statement")
         self.btn_run.setToolTip("Run program continuously")
+        self.btn_pause.setToolTip("Pause a running program")
+        self.slider_speed.setToolTip("Clock speed (rightmost = turbo: as fast as possible)")
 
         layout.addWidget(self.btn_reset)
         layout.addWidget(self.btn_step)
         layout.addWidget(self.btn_step_over)
         layout.addWidget(self.btn_run)
+        layout.addWidget(self.btn_pause)
         layout.addWidget(QLabel("Mode:"))
         layout.addWidget(self.mode_selector)
         layout.addWidget(QLabel("Speed:"))
         layout.addWidget(self.slider_speed)
+        layout.addWidget(self.lbl_speed)
 
         # Connect internal signals
         self.btn_reset.clicked.connect(self.reset_clicked.emit)
         self.btn_step.clicked.connect(self.step_clicked.emit)
         self.btn_step_over.clicked.connect(self.step_over_clicked.emit)
         self.btn_run.clicked.connect(self.run_clicked.emit)
-        self.slider_speed.valueChanged.connect(self.speed_changed.emit)
+        self.btn_pause.clicked.connect(self.pause_clicked.emit)
+        self.slider_speed.valueChanged.connect(self.on_speed_changed)
         self.mode_selector.currentIndexChanged.connect(self.on_mode_changed)
 
+    @classmethod
+    def position_to_hz(cls, position):
+        """Slider position -> clock frequency in Hz (0 = turbo)"""
+        if position >= cls.TURBO_POSITION:
+            return 0
+        return round(10 ** (position / 10))
+
+    @staticmethod
+    def format_speed(hz):
+        """Human-readable frequency"""
+        if hz == 0:
+            return "Turbo"
+        if hz >= 1_000_000:
+            return f"{hz / 1_000_000:.1f} MHz"
+        if hz >= 1000:
+            return f"{hz / 1000:.1f} kHz"
+        return f"{hz} Hz"
+
+    def on_speed_changed(self, position):
+        """Handle speed slider change"""
+        hz = self.position_to_hz(position)
+        self.lbl_speed.setText(self.format_speed(hz))
+        self.speed_changed.emit(hz)
+
     def on_mode_changed(self, index):
         """Handle mode combo box change"""
         mode = "basic" if index == 0 else "assembly"
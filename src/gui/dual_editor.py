@@ -7,15 +7,79 @@ Provides synchronized highlighting during execution.
 Mode behavior:
 - BASIC Mode: Shows BASIC editor, assembly hidden until compiled (with toggle)
 - Assembly Mode: Shows only assembly editor (editable), BASIC hidden
+
+While profiling, each editor shows a heat gutter: the hotter a line (share of
+the profiled cycles), the brighter its mark.
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-                              QPlainTextEdit, QLabel, QPushButton, QMessageBox)
-from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextFormat
-from PyQt6.QtCore import Qt, pyqtSignal
+                              QPlainTextEdit, QLabel, QPushButton, QMessageBox, QToolTip)
+from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextFormat, QPainter
+from PyQt6.QtCore import Qt, QEvent, QPoint, QRectF, pyqtSignal
 from PyQt6.QtWidgets import QTextEdit
 
 
+class HeatGutter(QWidget):
+    """
+    Strip to the left of a code editor marking hot lines.
+
+    heat: editor line (0-based) -> (heat 0..1, tooltip text). Only visible
+    while there is something to show.
+    """
+    WIDTH = 8
+    # Heat (in 1/32 steps) -> color, dim orange to bright red
+    COLORS = [QColor.fromHsvF(0.12 * (1 - i / 31), 1.0, 0.35 + 0.65 * i / 31) for i in range(32)]
+
+    def __init__(self, editor):
+        super().__init__()
+        self.editor = editor
+        self.heat = {}
+        self.setFixedWidth(self.WIDTH)
+        self.hide()
+        # Repaint when the editor scrolls or relayouts
+        editor.updateRequest.connect(self._on_update_request)
+
+    def set_heat(self, heat):
+        self.heat = heat
+        self.setVisible(bool(heat))
+        self.update()
+
+    def _on_update_request(self, rect, dy):
+        if self.heat:
+            self.update()
+
+    def paintEvent(self, event):
+        if not self.heat:
+            return
+        editor = self.editor
+        painter = QPainter(self)
+        offset = editor.contentOffset()
+        top_margin = editor.viewport().y()
+        block = editor.firstVisibleBlock()
+        while block.isValid():
+            geometry = editor.blockBoundingGeometry(block).translated(offset)
+            top = geometry.top() + top_margin
+            if top > self.height():
+                break
+            entry = self.heat.get(block.blockNumber())
+            if entry is not None:
+                painter.fillRect(QRectF(0, top, self.WIDTH, geometry.height()),
+                                 self.COLORS[min(int(entry[0] * 31), 31)])
+            block = block.next()
+
+    def event(self, event):
+        if event.type() == QEvent.Type.ToolTip:
+            y = event.pos().y() - self.editor.viewport().y()
+            row = self.editor.cursorForPosition(QPoint(0, y)).blockNumber()
+            entry = self.heat.get(row)
+            if entry is not None:
+                QToolTip.showText(event.globalPos(), entry[1], self)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().event(event)
+
+
 class SingleEditor(QWidget):
     """Single code editor with line highlighting support"""
 
@@ -41,10 +105,29 @@ class SingleEditor(QWidget):
         if read_only:
             self.editor.setStyleSheet("background-color: #2a2a2a;")
 
-        self.layout.addWidget(self.editor)
+        # Heat gutter (profiler) beside the editor
+        self.gutter = HeatGutter(self.editor)
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.setSpacing(0)
+        row.addWidget(self.gutter)
+        row.addWidget(self.editor)
+        self.layout.addLayout(row)
 
         # Track current highlighted line
         self.current_highlight_line = -1
+        self._highlight_format = None  # Built on first highlight
+        self.editor.textChanged.connect(self._on_text_changed)
+
+    def _on_text_changed(self):
+        """Edited text: the highlighted line must be redrawn next time, heat is stale"""
+        self.current_highlight_line = -1
+        if self.gutter.heat:
+            self.gutter.set_heat({})
+
+    def set_heat(self, heat):
+        """Show line heat in the gutter: {line (0-based): (heat 0..1, tooltip)}"""
+        self.gutter.set_heat(heat)
 
     def get_code(self):
         """Get editor contents"""
@@ -68,20 +151,26 @@ class SingleEditor(QWidget):
 
     def highlight_line(self, line_number):
         """Highlight the specified line number (0-based)"""
+        if line_number == self.current_highlight_line:
+            return  # Already shown
         self.current_highlight_line = line_number
 
-        # Create a selection for the line
-        block = self.editor.document().findBlockByLineNumber(line_number)
+        # Create a selection for the line (source lines are text blocks)
+        block = self.editor.document().findBlockByNumber(line_number)
         if not block.isValid():
             return
 
         cursor = QTextCursor(block)
         cursor.select(QTextCursor.SelectionType.LineUnderCursor)
 
+        if self._highlight_format is None:
+            self._highlight_format = QTextEdit.ExtraSelection().format
+            self._highlight_format.setBackground(QColor("#3a3a00"))  # Dark yellow background
+            self._highlight_format.setProperty(QTextFormat.Property.FullWidthSelection, True)
+
         # Create extra selection with highlight color
         selection = QTextEdit.ExtraSelection()
-        selection.format.setBackground(QColor("#3a3a00"))  # Dark yellow background
-        selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
+        selection.format = self._highlight_format
         selection.cursor = cursor
 
         # Apply the selection
@@ -99,8 +188,6 @@ class SingleEditor(QWidget):
         cursor = self.editor.textCursor()
         cursor.movePosition(cursor.MoveOperation.Start)
         self.editor.setTextCursor(cursor)
-        # Force immediate repaint
-        self.editor.viewport().repaint()
 
 
 class DualEditor(QWidget):
@@ -183,6 +270,8 @@ class DualEditor(QWidget):
         self.compiled_assembly = ""
         self.basic_to_asm_map = {}  # Maps BASIC line number → list of assembly line numbers
         self.asm_to_basic_map = {}  # Maps assembly line number → BASIC line number
+        self._basic_line_rows = None  # BASIC line number → editor line (see highlight_basic_line_number)
+        self.basic_editor.editor.textChanged.connect(self._on_basic_text_changed)
 
         # Execution mode: "basic" or "assembly"
         self.mode = "basic"
@@ -307,15 +396,24 @@ class DualEditor(QWidget):
         Highlight a BASIC line by its line number (e.g., 10, 20, 30).
         Finds the actual editor line (0-based) that starts with this number.
         """
-        code = self.basic_editor.get_code()
-        lines = code.splitlines()
-
-        for i, line in enumerate(lines):
-            # Check if this line starts with the line number
-            parts = line.strip().split()
-            if parts and parts[0].isdigit() and int(parts[0]) == basic_line_number:
-                self.basic_editor.highlight_line(i)
-                return
+        row = self._basic_rows().get(basic_line_number)
+        if row is not None:
+            self.basic_editor.highlight_line(row)
+
+    def _basic_rows(self):
+        """BASIC line number -> editor line (0-based)"""
+        if self._basic_line_rows is None:
+            # Index editor lines by the number they start with (first wins)
+            self._basic_line_rows = {}
+            for i, line in enumerate(self.basic_editor.get_code().splitlines()):
+                parts = line.strip().split()
+                if parts and parts[0].isdigit():
+                    self._basic_line_rows.setdefault(int(parts[0]), i)
+        return self._basic_line_rows
+
+    def _on_basic_text_changed(self):
+        """BASIC source edited: the line index is stale"""
+        self._basic_line_rows = None
 
     def highlight_basic_statement(self, basic_line_number):
         """
@@ -332,6 +430,34 @@ class DualEditor(QWidget):
                 # Highlight the first assembly line for this statement
                 self.assembly_editor.highlight_line(asm_lines[0])
 
+    def show_profile(self, asm_rows, basic_rows):
+        """
+        Show profile tables (SimManager.profile_table rows keyed by assembly
+        line and by BASIC line) as heat gutters.
+        """
+        total = sum(cycles for _, _, cycles in asm_rows) or 1
+        self.assembly_editor.set_heat(self._heat(asm_rows, total, lambda line: line))
+        self.basic_editor.set_heat(self._heat(basic_rows, total, self._basic_rows().get))
+
+    def clear_profile(self):
+        """Hide the heat gutters"""
+        self.assembly_editor.set_heat({})
+        self.basic_editor.set_heat({})
+
+    @staticmethod
+    def _heat(rows, total, editor_row):
+        """{editor line: (heat, tooltip)} for profile rows; heat is relative to the hottest"""
+        if not rows:
+            return {}
+        hottest = rows[0][2] or 1
+        heat = {}
+        for key, executions, cycles in rows:
+            row = editor_row(key)
+            if row is not None:
+                heat[row] = (cycles / hottest,
+                             f"{executions:,} instructions, {cycles:,} cycles ({cycles / total:.1%})")
+        return heat
+
     def clear_highlights(self):
         """Clear all highlighting in both editors"""
         self.basic_editor.clear_highlight()
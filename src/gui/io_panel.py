@@ -10,9 +10,14 @@ Supports two modes:
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
                              QLineEdit, QPushButton, QLabel, QGroupBox,
                              QRadioButton, QButtonGroup, QMessageBox)
-from PyQt6.QtGui import QFont, QColor
+import re
+
+from PyQt6.QtGui import QFont, QColor, QTextCharFormat
 from PyQt6.QtCore import Qt, pyqtSignal
 
+# Output bytes shown as "[0xNN]" in ASCII mode (split keeps them as separators)
+_NON_PRINTABLE = re.compile(rb"([^\x20-\x7e\t\n\r])")
+
 
 class IOPanel(QWidget):
     """
@@ -28,9 +33,18 @@ class IOPanel(QWidget):
     # Signal for numeric input (value as int)
     numeric_input_submitted = pyqtSignal(int)
 
+    OUTPUT_SCROLLBACK = 20000  # Characters kept in the output display
+
     def __init__(self):
         super().__init__()
         self.numeric_mode = False  # Default to ASCII mode
+        self.scrollback = self.OUTPUT_SCROLLBACK
+        # Program output not yet shown; only the last `scrollback` bytes can
+        # ever be visible, so older ones are dropped as it fills
+        self._pending_output = bytearray()
+        self._plain_format = QTextCharFormat()
+        self._hex_format = QTextCharFormat()
+        self._hex_format.setForeground(QColor("#888888"))
         self.setup_ui()
 
     def setup_ui(self):
@@ -186,8 +200,51 @@ class IOPanel(QWidget):
 
     def clear_output(self):
         """Clear the output display"""
+        self._pending_output.clear()
         self.output_display.clear()
 
+    def queue_output(self, values):
+        """Buffer program output bytes until the next flush_output()"""
+        pending = self._pending_output
+        pending += bytes(values)
+        if len(pending) > self.scrollback:
+            del pending[:-self.scrollback]
+
+    def flush_output(self):
+        """Show all buffered output with one edit of the display"""
+        if not self._pending_output:
+            return
+        data = bytes(self._pending_output)
+        self._pending_output.clear()
+
+        cursor = self.output_display.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        if self.numeric_mode:
+            # Numeric mode - one decimal value per line
+            cursor.insertText("".join(f"{value}\n" for value in data), self._plain_format)
+        else:
+            # ASCII mode - printable runs as text, anything else as hex codes
+            for i, chunk in enumerate(_NON_PRINTABLE.split(data)):
+                if not chunk:
+                    continue
+                if i % 2:
+                    cursor.insertText(f"[0x{chunk[0]:02X}]", self._hex_format)
+                else:
+                    cursor.insertText(chunk.decode("ascii"), self._plain_format)
+
+        # Scrollback cap: drop the oldest characters
+        excess = self.output_display.document().characterCount() - 1 - self.scrollback
+        if excess > 0:
+            cursor.movePosition(cursor.MoveOperation.Start)
+            cursor.movePosition(cursor.MoveOperation.NextCharacter, cursor.MoveMode.KeepAnchor, excess)
+            cursor.removeSelectedText()
+            cursor.movePosition(cursor.MoveOperation.End)
+        cursor.endEditBlock()
+
+        self.output_display.setTextCursor(cursor)
+        self.output_display.ensureCursorVisible()
+
     def display_byte(self, value):
         """
         Display a single byte value as output.
@@ -198,22 +255,16 @@ class IOPanel(QWidget):
         Args:
             value: Byte value (0-255)
         """
-        if self.numeric_mode:
-            # Numeric mode - display as decimal value with newline
-            self.append_output(f"{value}\n")
-        else:
-            # ASCII mode - display as character if printable
-            if 32 <= value <= 126:
-                self.append_output(chr(value))
-            elif value == 10:  # Newline
-                self.append_output('\n')
-            elif value == 13:  # Carriage return
-                self.append_output('\r')
-            elif value == 9:  # Tab
-                self.append_output('\t')
-            else:
-                # Non-printable - show hex code
-                self.append_output(f"[0x{value:02X}]", color="#888888")
+        self.queue_output((value & 0xFF,))
+        self.flush_output()
+
+    def apply_delta(self, delta):
+        """Apply one frame's worth of output (a core StateDelta)"""
+        if delta.output_cleared:
+            self.clear_output()
+        if delta.output:
+            self.queue_output(delta.output)
+            self.flush_output()
 
     def display_char(self, char):
         """
@@ -1,10 +1,11 @@
 from PyQt6.QtWidgets import (QMainWindow, QDockWidget, QLabel, QWidget, QVBoxLayout,
                               QFileDialog, QMessageBox, QTextBrowser, QDialog,
                               QDialogButtonBox, QSplitter)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QAction
 import json
 import os
+import time
 
 from src.gui.circuit_view import CircuitView
 from src.gui.dual_editor import DualEditor
@@ -13,8 +14,13 @@ from src.gui.io_panel import IOPanel
 from src.gui.metrics_panel import MetricsPanel
 from src.gui.memory_panel import MemoryPanel
 from src.core.sim_manager import SimManager
+from src.core.sim_worker import SimWorker
+from src.gui.qt_bridge import qt_signals
 
 class MainWindow(QMainWindow):
+    FRAME_INTERVAL_MS = 16  # ~60 Hz display refresh
+    PROFILE_INTERVAL = 0.5  # Seconds between heat gutter updates while profiling
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("BasCAT: BASIC Computer Architecture Trainer")
@@ -27,8 +33,11 @@ class MainWindow(QMainWindow):
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
 
-        # Simulation Backbone
+        # Simulation Backbone: the CPU runs on a worker thread, commands are queued
         self.sim = SimManager()
+        self.sim.start_delta_recording()
+        self.worker = SimWorker(self.sim)
+        self.worker.start()
 
         # Central Widget: Vertical Splitter with CPU Circuit on top, Memory Panel below
         self.central_splitter = QSplitter(Qt.Orientation.Vertical)
@@ -62,23 +71,26 @@ class MainWindow(QMainWindow):
         # Current file path
         self.current_file = None
 
+        # Views are refreshed once per display frame from a coalesced state delta
+        self._pending_line = None  # Executed source line not highlighted yet
+        self._profile_shown = 0.0  # perf_counter time of the last heat gutter update
+        self.frame_timer = QTimer(self)
+        self.frame_timer.timeout.connect(self.on_frame)
+        self.frame_timer.start(self.FRAME_INTERVAL_MS)
+
 
     def connect_signals(self):
         # Run Button Logic: Assemble -> Load -> Run
         self.control_panel.run_clicked.connect(self.on_run)
+        self.control_panel.pause_clicked.connect(lambda: self.worker.post("pause"))
         self.control_panel.step_clicked.connect(self.on_step)
         self.control_panel.step_over_clicked.connect(self.on_step_over)
         self.control_panel.reset_clicked.connect(self.on_reset)
-        self.control_panel.speed_changed.connect(self.sim.set_speed)
+        self.control_panel.speed_changed.connect(lambda hz: self.worker.post("speed", hz))
 
         # Connect mode toggle
         self.control_panel.mode_changed.connect(self.on_mode_changed)
 
-        # Connect code execution tracking
-        from src.core.signals import signals
-        signals.current_line_changed.connect(self.on_line_changed)
-        signals.current_line_changed.connect(self.on_instruction_executed)
-
         # Connect dual editor signals
         self.dual_editor.compilation_successful.connect(self.on_compilation_success)
         self.dual_editor.compilation_failed.connect(self.on_compilation_failed)
@@ -86,10 +98,81 @@ class MainWindow(QMainWindow):
         # Connect I/O signals
         self.io_panel.input_submitted.connect(self.on_input_submitted)
         self.io_panel.numeric_input_submitted.connect(self.on_numeric_input_submitted)
-        signals.output_written.connect(self.io_panel.display_byte)
-        signals.output_char_written.connect(self.io_panel.display_char)
-        signals.output_char_written.connect(lambda: self.metrics_panel.increment_output())
-        signals.output_cleared.connect(self.io_panel.clear_output)
+
+    def on_frame(self):
+        """Push everything that changed since the last frame to the views"""
+        # Never wait for the worker: if it is mid-burst, try again next frame
+        if not self.sim.lock.acquire(blocking=False):
+            return
+        frame_start = time.perf_counter()
+        try:
+            delta = self.sim.flush_delta()
+            if not delta.is_empty():
+                self.central_widget.apply_delta(delta)
+                self.memory_panel.apply_delta(delta)
+                self.metrics_panel.apply_delta(delta)
+                self.io_panel.apply_delta(delta)
+                self.metrics_panel.set_halted(self.sim.cpu.halted)
+                if delta.line is not None:
+                    self._pending_line = delta.line
+                    self.metrics_panel.set_basic_line(self.sim.asm_to_basic_map.get(delta.line))
+            self.show_pending_line()
+            if self.sim.profiling and frame_start - self._profile_shown >= self.PROFILE_INTERVAL:
+                self.show_profile()
+            self.metrics_panel.record_frame(time.perf_counter() - frame_start,
+                                            self.sim.clock.frequency_hz)
+        finally:
+            self.sim.lock.release()
+
+    def show_pending_line(self):
+        """
+        Highlight the latest executed source line: at most once per frame
+        while running, not at all in turbo mode, and as soon as the clock
+        stops (pause, step, halt).
+        """
+        if self._pending_line is None:
+            return
+        clock = self.sim.clock
+        if clock.running and clock.is_turbo():
+            return
+        self.on_line_changed(self._pending_line)
+        self._pending_line = None
+
+    def show_profile(self):
+        """Refresh the editors' heat gutters from the profile (simulator lock held)"""
+        self._profile_shown = time.perf_counter()
+        self.dual_editor.show_profile(self.sim.profile_table("line"),
+                                      self.sim.profile_table("basic_line"))
+
+    def on_profile_toggled(self, enabled):
+        """Debug > Profile Execution"""
+        if enabled:
+            self.worker.call(self.sim.start_profiling)
+        else:
+            self.worker.call(self.sim.stop_profiling)
+            self.worker.call(self.show_profile)  # Final profile
+
+    def on_clear_profile(self):
+        """Debug > Clear Profile"""
+        self.worker.call(self.sim.reset_profile)
+        self.dual_editor.clear_profile()
+
+    def load_program(self, code):
+        """Assemble and load code into the simulator. Returns True on success."""
+        if not self.worker.call(self.sim.load_code, code):
+            return False
+        self.worker.call(self.sim.set_basic_line_map, self.dual_editor.basic_to_asm_map)
+        self.metrics_panel.set_line_cycles(self.worker.call(self.sim.basic_line_cycles))
+        # Refresh memory panel to show loaded program
+        self.memory_panel.refresh_display()
+        self.central_widget.stack_visual.set_sp(0xFD)
+        return True
+
+    def closeEvent(self, event):
+        """Stop the simulation worker before closing"""
+        self.frame_timer.stop()
+        self.worker.shutdown()
+        super().closeEvent(event)
 
     def on_run(self):
         """Run the program (uses compiled or hand-written assembly)"""
@@ -107,13 +190,8 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "No Code", "Please enter assembly code to run.")
                 return
 
-        if code.strip() and self.sim.load_code(code):
-            # Pass line mapping to sim manager (empty in assembly mode)
-            self.sim.set_basic_line_map(self.dual_editor.basic_to_asm_map)
-            # Refresh memory panel to show loaded program
-            self.memory_panel.refresh_display()
-            self.central_widget.stack_visual.set_sp(0xFD)
-            self.sim.run()
+        if code.strip() and self.load_program(code):
+            self.worker.post("run")
 
     def on_step(self):
         """Step into: Execute single assembly instruction"""
@@ -130,16 +208,11 @@ class MainWindow(QMainWindow):
                     QMessageBox.warning(self, "No Code", "Please enter assembly code to run.")
                     return
 
-            if not self.sim.load_code(code):
+            if not self.load_program(code):
                 return  # Assembly error
-            self.sim.set_basic_line_map(self.dual_editor.basic_to_asm_map)
-            # Refresh memory panel to show loaded program
-            self.memory_panel.refresh_display()
-            self.central_widget.stack_visual.set_sp(0xFD)
 
-        self.sim.step()
-        # Refresh memory panel after step execution
-        self.memory_panel.refresh_display()
+        # Views refresh on the next frame once the worker has executed it
+        self.worker.post("step")
 
     def on_step_over(self):
         """Step over: Execute entire BASIC statement (multiple assembly instructions)"""
@@ -156,33 +229,23 @@ class MainWindow(QMainWindow):
                     QMessageBox.warning(self, "No Code", "Please enter assembly code to run.")
                     return
 
-            if not self.sim.load_code(code):
+            if not self.load_program(code):
                 return  # Assembly error
-            self.sim.set_basic_line_map(self.dual_editor.basic_to_asm_map)
-            # Refresh memory panel to show loaded program
-            self.memory_panel.refresh_display()
-            self.central_widget.stack_visual.set_sp(0xFD)
 
-        self.sim.step_over()
-        # Refresh memory panel after step execution
-        self.memory_panel.refresh_display()
+        self.worker.post("step_over")
 
     def on_reset(self):
         """Reset the simulation"""
+        self.worker.call(self.sim.reset)
+        self.on_frame()  # Show the reset state before zeroing the counters
+        self._pending_line = None
         self.dual_editor.clear_highlights()
-        self.sim.reset()
         self.metrics_panel.reset_metrics()
         # Refresh memory panel to show cleared memory
         self.memory_panel.refresh_display()
         # Update stack visual with reset SP
         self.central_widget.stack_visual.set_sp(0xFD)
 
-    def on_instruction_executed(self):
-        """Update metrics when an instruction is executed"""
-        self.metrics_panel.increment_instruction()
-        self.metrics_panel.set_pc(self.sim.cpu.PC)
-        self.metrics_panel.set_halted(self.sim.cpu.halted)
-
     def on_mode_changed(self, mode):
         """Handle execution mode change (basic vs assembly)"""
         self.execution_mode = mode
@@ -213,13 +276,13 @@ class MainWindow(QMainWindow):
 
     def on_input_submitted(self, text):
         """Handle input submitted from I/O panel (ASCII mode)"""
-        # Queue the input string to the I/O controller
-        self.sim.memory.io_controller.queue_string(text)
+        # Queue the input string to the I/O controller (on the worker thread)
+        self.worker.post("input", [ord(char) for char in text])
 
     def on_numeric_input_submitted(self, value):
         """Handle numeric input submitted from I/O panel (Numeric mode)"""
         # Queue the single byte value directly
-        self.sim.memory.io_controller.queue_input(value)
+        self.worker.post("input", [value])
 
     def setup_docks(self):
         # Dual Editor Dock (Left) - BASIC + Assembly side-by-side
@@ -255,10 +318,15 @@ class MainWindow(QMainWindow):
         self.central_widget.set_memory(self.sim.memory)
         self.memory_panel.set_memory(self.sim.memory)
         
-        # Connect SP updates to memory panel and toggle signal
-        from src.core.signals import signals
-        signals.sp_updated.connect(self.memory_panel.set_sp)
-        signals.memory_panel_toggle.connect(self.toggle_memory_panel)
+        # Connect memory panel toggle signal (SP updates arrive via on_frame)
+        qt_signals.memory_panel_toggle.connect(self.toggle_memory_panel)
+
+        # Execution errors on the worker thread (e.g. PC past the end of memory)
+        qt_signals.simulation_error.connect(self.on_simulation_error)
+
+    def on_simulation_error(self, message):
+        """The worker stopped the clock because execution failed"""
+        QMessageBox.warning(self, "Simulation Error", f"Execution stopped:\n{message}")
 
     def toggle_memory_panel(self):
         """Toggle memory panel visibility by collapsing/expanding the splitter"""
@@ -311,6 +379,19 @@ class MainWindow(QMainWindow):
         examples_menu = menubar.addMenu("&Examples")
         self.load_examples_menu(examples_menu)
 
+        # Debug Menu
+        debug_menu = menubar.addMenu("&Debug")
+
+        self.profile_action = QAction("&Profile Execution", self)
+        self.profile_action.setCheckable(True)
+        self.profile_action.setToolTip("Count executions and cycles per line (heat gutter)")
+        self.profile_action.toggled.connect(self.on_profile_toggled)
+        debug_menu.addAction(self.profile_action)
+
+        clear_profile_action = QAction("&Clear Profile", self)
+        clear_profile_action.triggered.connect(self.on_clear_profile)
+        debug_menu.addAction(clear_profile_action)
+
         # Help Menu
         help_menu = menubar.addMenu("&Help")
 
@@ -4,15 +4,186 @@ Memory Panel Widget for BasCAT
 Shows detailed memory contents including:
 - Full memory dump (address, hex, decimal, ASCII)
 - Stack region highlighting
-- Variable region highlighting  
+- Variable region highlighting
 - I/O port indicators
 """
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-                              QTableWidgetItem, QLabel, QGroupBox, QHeaderView,
-                              QScrollArea, QPushButton, QComboBox)
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                              QLabel, QHeaderView, QPushButton, QComboBox)
 from PyQt6.QtGui import QFont, QColor, QBrush
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+def get_region_name(addr):
+    """Get region name for an address"""
+    if addr >= 0xFE:
+        return "I/O Port"
+    elif addr > 0xED:
+        return "Stack"
+    elif 0x80 <= addr <= 0x99:
+        var_name = chr(ord('A') + addr - 0x80)
+        return f"Var {var_name}"
+    elif addr < 0x80:
+        return "Program"
+    else:
+        return "Free RAM"
+
+
+# Per-address highlight roles (region colors)
+ROLE_PLAIN, ROLE_STACK, ROLE_PORT, ROLE_VAR = range(4)
+REGION_NAMES = tuple(get_region_name(addr) for addr in range(256))
+ADDRESS_ROLES = bytes(ROLE_PORT if addr >= 0xFE else
+                      ROLE_STACK if addr > 0xED else
+                      ROLE_VAR if 0x80 <= addr <= 0x99 else
+                      ROLE_PLAIN for addr in range(256))
+
+# Cell texts for every address/byte value
+ADDRESS_TEXT = tuple(f"0x{value:02X}" for value in range(256))
+DECIMAL_TEXT = tuple(str(value) for value in range(256))
+ASCII_TEXT = tuple(chr(value) if 32 <= value <= 126 else "·" for value in range(256))
+
+# Views: name -> [(address, region label), ...]
+VIEWS = {
+    # Stack grows downward from 0xFD: show 0xFD down to 0xF0
+    "Stack Region": [(addr, "Stack") for addr in range(0xFD, 0xEF, -1)],
+    # Variables A-Z live at 0x80-0x99
+    "Variables": [(0x80 + i, f"Var {name}") for i, name in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ")],
+    "Full Memory": list(enumerate(REGION_NAMES)),
+    "I/O Ports": [(0xFE, "OUT Port"), (0xFF, "IN Port")],
+}
+
+
+class MemoryTableModel(QAbstractTableModel):
+    """
+    Table model over Memory._data: one row per address of the current view.
+
+    Cells are produced on demand from precomputed text and role tables, so
+    a refresh only tells the view which rows changed (dataChanged) and the
+    view repaints the visible ones.
+    """
+    HEADERS = ["Addr", "Hex", "Dec", "Chr", "Region"]
+
+    def __init__(self, memory=None):
+        super().__init__()
+        self.memory = memory
+        self.sp_value = 0xFD
+        self.addresses = []
+        self.labels = []
+        self._rows = {}  # Address -> row in the current view
+        self._generation = 0  # Memory generation the view reflects
+        self._center = Qt.AlignmentFlag.AlignCenter
+        # Role -> (foreground, background); stack colors depend on SP
+        self._brushes = {
+            ROLE_PORT: (QBrush(QColor("#ff55ff")), None),
+            ROLE_VAR: (QBrush(QColor("#55ffff")), None),
+        }
+        self._active_stack = (QBrush(QColor("#55ff55")), QBrush(QColor("#2a3a2a")))
+        self._sp_marker = (QBrush(QColor("#ffff55")), QBrush(QColor("#3a3a1a")))
+
+    def set_memory(self, memory):
+        self.memory = memory
+        self.refresh()
+
+    def set_view(self, rows):
+        """Show the given [(address, label), ...]"""
+        self.beginResetModel()
+        self.addresses = [addr for addr, _ in rows]
+        self.labels = [label for _, label in rows]
+        self._rows = {addr: row for row, addr in enumerate(self.addresses)}
+        if self.memory:
+            self._generation = self.memory.generation
+        self.endResetModel()
+
+    def set_sp(self, sp_value):
+        """Move the SP marker; repaints only the stack rows between old and new SP"""
+        old, self.sp_value = self.sp_value, sp_value
+        if old != sp_value:
+            self._emit_rows(addr for addr in range(min(old, sp_value), max(old, sp_value) + 1)
+                            if ADDRESS_ROLES[addr] == ROLE_STACK)
+
+    def refresh(self):
+        """Mark every row changed (e.g. after reset or load)"""
+        if self.memory:
+            self._generation = self.memory.generation
+        if self.addresses:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.addresses) - 1, len(self.HEADERS) - 1))
+
+    def update_changed(self):
+        """Emit dataChanged for the rows whose bytes changed since the last update"""
+        if not self.memory:
+            return
+        changed = self.memory.changed_since(self._generation)
+        self._generation = self.memory.generation
+        if changed:
+            self._emit_rows(changed, 1, 3)
+
+    def _emit_rows(self, addresses, first_column=0, last_column=4):
+        """dataChanged for the rows of addresses, coalescing adjacent rows"""
+        rows = sorted(self._rows[addr] for addr in addresses if addr in self._rows)
+        start = None
+        for row in rows:
+            if start is None:
+                start = end = row
+            elif row == end + 1:
+                end = row
+            else:
+                self.dataChanged.emit(self.index(start, first_column), self.index(end, last_column))
+                start = end = row
+        if start is not None:
+            self.dataChanged.emit(self.index(start, first_column), self.index(end, last_column))
+
+    # ----- QAbstractTableModel -----
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.addresses)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        column = index.column()
+        addr = self.addresses[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return ADDRESS_TEXT[addr]
+            if column == 4:
+                label = self.labels[row]
+                if addr == self.sp_value and ADDRESS_ROLES[addr] == ROLE_STACK:
+                    return label + " ◄SP"
+                return label
+            # Direct access to avoid I/O side effects
+            value = self.memory._data[addr] if self.memory else 0
+            if column == 1:
+                return ADDRESS_TEXT[value]
+            if column == 2:
+                return DECIMAL_TEXT[value]
+            return ASCII_TEXT[value]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._center if column < 4 else None
+        if role == Qt.ItemDataRole.ForegroundRole or role == Qt.ItemDataRole.BackgroundRole:
+            brushes = self._row_brushes(addr)
+            if brushes is None:
+                return None
+            return brushes[0] if role == Qt.ItemDataRole.ForegroundRole else brushes[1]
+        return None
+
+    def _row_brushes(self, addr):
+        address_role = ADDRESS_ROLES[addr]
+        if address_role == ROLE_STACK:
+            if addr > self.sp_value:
+                # Active stack entry (above SP)
+                return self._active_stack
+            if addr == self.sp_value:
+                # Stack pointer location
+                return self._sp_marker
+            return None
+        return self._brushes.get(address_role)
 
 
 class MemoryPanel(QWidget):
@@ -20,62 +191,62 @@ class MemoryPanel(QWidget):
     Memory viewer panel showing memory contents in a table format.
     Highlights stack region and variable locations.
     """
-    
+
     def __init__(self, memory=None):
         super().__init__()
         self.memory = memory
         self.sp_value = 0xFD  # Default stack pointer
+        self.model = MemoryTableModel(memory)
         self.setup_ui()
-        
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(3, 3, 3, 3)
         layout.setSpacing(2)
-        
+
         # Header with controls (compact)
         header = QHBoxLayout()
         header.setSpacing(5)
-        
+
         # View mode selector
         header.addWidget(QLabel("View:"))
         self.view_mode = QComboBox()
-        self.view_mode.addItems(["Stack Region", "Variables", "Full Memory", "I/O Ports"])
+        self.view_mode.addItems(list(VIEWS))
         self.view_mode.currentTextChanged.connect(self.on_view_changed)
         header.addWidget(self.view_mode)
-        
+
         header.addStretch()
-        
+
         # Stack info (inline with header)
         self.stack_info = QLabel("SP: 0xFD | Entries: 0")
         self.stack_info.setStyleSheet("color: #888; font-size: 9px;")
         header.addWidget(self.stack_info)
-        
+
         # Refresh button
         refresh_btn = QPushButton("↻")
         refresh_btn.setMaximumWidth(30)
         refresh_btn.setToolTip("Refresh display")
         refresh_btn.clicked.connect(self.refresh_display)
         header.addWidget(refresh_btn)
-        
+
         layout.addLayout(header)
-        
+
         # Memory table (compact)
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Addr", "Hex", "Dec", "Chr", "Region"])
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.setFont(QFont("Courier New", 9))  # Smaller font
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.verticalHeader().setDefaultSectionSize(18)  # Compact rows
         self.table.verticalHeader().setVisible(False)  # Hide row numbers
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #1e1e1e;
                 alternate-background-color: #252525;
                 color: #e0e0e0;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #3a3a00;
             }
             QHeaderView::section {
@@ -86,157 +257,46 @@ class MemoryPanel(QWidget):
                 font-size: 9px;
             }
         """)
-        
+
         layout.addWidget(self.table)
-        
+
         # Set minimum height so dock can be resized smaller
         self.setMinimumHeight(100)
-        
+
         # Initial display
         self.on_view_changed("Stack Region")
-        
+
     def set_memory(self, memory):
         """Set the memory object to read from"""
         self.memory = memory
-        self.refresh_display()
-        
+        self.model.set_memory(memory)
+
     def set_sp(self, sp_value):
         """Update stack pointer value"""
         self.sp_value = sp_value
         self.update_stack_info()
-        if self.view_mode.currentText() == "Stack Region":
-            self.refresh_display()
-            
+        self.model.set_sp(sp_value)
+
+    def apply_delta(self, delta):
+        """Apply one frame's worth of state changes (a core StateDelta)"""
+        if delta.sp is not None:
+            self.set_sp(delta.sp)
+        self.model.update_changed()
+
     def update_stack_info(self):
         """Update the stack info bar"""
         stack_entries = 0xFD - self.sp_value
         self.stack_info.setText(f"SP: 0x{self.sp_value:02X} | Stack entries: {stack_entries}")
-        
+
     def on_view_changed(self, mode):
         """Handle view mode change"""
-        self.refresh_display()
-        
+        self.model.set_view(VIEWS[mode])
+        self.update_stack_info()
+
     def refresh_display(self):
         """Refresh the memory display based on current view mode"""
-        mode = self.view_mode.currentText()
-        
-        if mode == "Stack Region":
-            self.show_stack_region()
-        elif mode == "Variables":
-            self.show_variables()
-        elif mode == "Full Memory":
-            self.show_full_memory()
-        elif mode == "I/O Ports":
-            self.show_io_ports()
-            
-    def show_stack_region(self):
-        """Show stack memory region (0xF0-0xFD)"""
-        self.table.setRowCount(0)
-        
-        # Stack grows downward from 0xFD
-        for addr in range(0xFD, 0xEF, -1):  # Show 0xFD down to 0xF0
-            self.add_memory_row(addr, "Stack")
-            
-        self.update_stack_info()
-        
-    def show_variables(self):
-        """Show variable memory region (0x80-0x99 for A-Z)"""
-        self.table.setRowCount(0)
-        
-        var_names = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        for i, var_name in enumerate(var_names):
-            addr = 0x80 + i  # A=0x80, B=0x81, etc.
-            self.add_memory_row(addr, f"Var {var_name}")
-            
-    def show_full_memory(self):
-        """Show all 256 bytes of memory (0x00-0xFF)"""
-        self.table.setRowCount(0)
-        
-        for addr in range(0, 256):
-            region = self.get_region_name(addr)
-            self.add_memory_row(addr, region)
-            
-    def show_io_ports(self):
-        """Show I/O port addresses"""
-        self.table.setRowCount(0)
-        
-        self.add_memory_row(0xFE, "OUT Port")
-        self.add_memory_row(0xFF, "IN Port")
-        
-    def add_memory_row(self, addr, region):
-        """Add a row to the memory table"""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        
-        # Get value from memory
-        if self.memory:
-            try:
-                value = self.memory._data[addr]  # Direct access to avoid I/O side effects
-            except (IndexError, AttributeError):
-                value = 0
-        else:
-            value = 0
-            
-        # Address
-        addr_item = QTableWidgetItem(f"0x{addr:02X}")
-        addr_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Hex value
-        hex_item = QTableWidgetItem(f"0x{value:02X}")
-        hex_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Decimal value
-        dec_item = QTableWidgetItem(str(value))
-        dec_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # ASCII (if printable)
-        if 32 <= value <= 126:
-            ascii_char = chr(value)
-        else:
-            ascii_char = "·"
-        ascii_item = QTableWidgetItem(ascii_char)
-        ascii_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Region
-        region_item = QTableWidgetItem(region)
-        
-        # Highlight based on region
-        if "Stack" in region and addr > self.sp_value:
-            # Active stack entry (above SP)
-            for item in [addr_item, hex_item, dec_item, ascii_item, region_item]:
-                item.setBackground(QBrush(QColor("#2a3a2a")))
-                item.setForeground(QBrush(QColor("#55ff55")))
-        elif addr == self.sp_value and "Stack" in region:
-            # Stack pointer location
-            for item in [addr_item, hex_item, dec_item, ascii_item, region_item]:
-                item.setBackground(QBrush(QColor("#3a3a1a")))
-                item.setForeground(QBrush(QColor("#ffff55")))
-            region_item.setText(region + " ◄SP")
-        elif "Port" in region:
-            # I/O ports
-            for item in [addr_item, hex_item, dec_item, ascii_item, region_item]:
-                item.setForeground(QBrush(QColor("#ff55ff")))
-        elif "Var" in region:
-            # Variables
-            for item in [addr_item, hex_item, dec_item, ascii_item, region_item]:
-                item.setForeground(QBrush(QColor("#55ffff")))
-                
-        self.table.setItem(row, 0, addr_item)
-        self.table.setItem(row, 1, hex_item)
-        self.table.setItem(row, 2, dec_item)
-        self.table.setItem(row, 3, ascii_item)
-        self.table.setItem(row, 4, region_item)
-        
+        self.model.refresh()
+
     def get_region_name(self, addr):
         """Get region name for an address"""
-        if addr >= 0xFE:
-            return "I/O Port"
-        elif addr > 0xED:
-            return "Stack"
-        elif 0x80 <= addr <= 0x99:
-            var_name = chr(ord('A') + addr - 0x80)
-            return f"Var {var_name}"
-        elif addr < 0x80:
-            return "Program"
-        else:
-            return "Free RAM"
+        return REGION_NAMES[addr]
@@ -3,14 +3,47 @@ Metrics Panel for Phase 6
 
 Displays real-time execution statistics:
 - Instructions executed
-- Clock cycles
+- Clock cycles (per CPU.CYCLES), cycles per instruction and the cost of
+  the current BASIC line
 - Memory utilization
 - I/O operations
+- Throughput: instructions/sec, effective vs requested clock, and the
+  share of wall-clock time spent executing vs updating the views
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox, QGridLayout
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QFont, QPainter, QPen, QColor, QPolygonF
+
+from src.core.throughput import ThroughputMeter
+from src.gui.controls import ControlPanel
+
+
+class Sparkline(QWidget):
+    """Tiny line chart of a rolling series (e.g. ThroughputMeter.history)"""
+
+    def __init__(self, series, color="#00ffcc", maximum=None):
+        super().__init__()
+        self.series = series
+        self.color = QColor(color)
+        self.maximum = maximum  # Fixed top of the scale (None = series max)
+        self.setFixedHeight(18)
+        self.setMinimumWidth(60)
+
+    def paintEvent(self, event):
+        values = list(self.series)
+        if len(values) < 2:
+            return
+        top = self.maximum or max(values) or 1
+        width = self.width() - 1
+        height = self.height() - 2
+        step = width / (self.series.maxlen - 1)  # Newest value at the right edge
+        x0 = width - step * (len(values) - 1)
+        line = QPolygonF([QPointF(x0 + i * step, 1 + height * (1 - min(value / top, 1.0)))
+                          for i, value in enumerate(values)])
+        painter = QPainter(self)
+        painter.setPen(QPen(self.color, 1))
+        painter.drawPolyline(line)
 
 
 class MetricsPanel(QWidget):
@@ -22,10 +55,14 @@ class MetricsPanel(QWidget):
     - Clock cycles
     - Memory usage
     - I/O operations count
+    - Throughput (measured rates, see ThroughputMeter)
     """
 
     def __init__(self):
         super().__init__()
+        self.meter = ThroughputMeter()
+        self.requested_hz = 1
+        self.line_cycles = {}  # BASIC line -> cycles per pass (SimManager.basic_line_cycles)
         self.init_ui()
         self.reset_metrics()
 
@@ -48,11 +85,18 @@ class MetricsPanel(QWidget):
 
         self.lbl_instructions = self._create_metric_label("0")
         self.lbl_cycles = self._create_metric_label("0")
+        self.lbl_cpi = self._create_metric_label("0.00")
+        self.lbl_line_cycles = self._create_metric_label("-")
+        self.lbl_line_cycles.setToolTip("Cycles of one pass through the current BASIC line")
 
         exec_layout.addWidget(QLabel("Instructions:"), 0, 0)
         exec_layout.addWidget(self.lbl_instructions, 0, 1)
         exec_layout.addWidget(QLabel("Clock Cycles:"), 1, 0)
         exec_layout.addWidget(self.lbl_cycles, 1, 1)
+        exec_layout.addWidget(QLabel("Cycles/Instr:"), 2, 0)
+        exec_layout.addWidget(self.lbl_cpi, 2, 1)
+        exec_layout.addWidget(QLabel("Line Cost:"), 3, 0)
+        exec_layout.addWidget(self.lbl_line_cycles, 3, 1)
 
         exec_group.setLayout(exec_layout)
         layout.addWidget(exec_group)
@@ -102,6 +146,37 @@ class MetricsPanel(QWidget):
         cpu_group.setLayout(cpu_layout)
         layout.addWidget(cpu_group)
 
+        # Throughput group (measured, refreshed every meter interval)
+        speed_group = QGroupBox("Throughput")
+        speed_layout = QGridLayout()
+
+        self.lbl_ips = self._create_metric_label("0")
+        self.lbl_effective_hz = self._create_metric_label("0 Hz")
+        self.lbl_requested_hz = self._create_metric_label(ControlPanel.format_speed(self.requested_hz))
+        self.lbl_cpu_share = self._create_metric_label("0%")
+        self.lbl_gui_share = self._create_metric_label("0%")
+        history = self.meter.history
+        self.spark_ips = Sparkline(history["ips"])
+        self.spark_cpu_share = Sparkline(history["cpu_share"], "#55ff55", maximum=1.0)
+        self.spark_gui_share = Sparkline(history["gui_share"], "#ff55ff", maximum=1.0)
+
+        speed_layout.addWidget(QLabel("Instr/sec:"), 0, 0)
+        speed_layout.addWidget(self.lbl_ips, 0, 1)
+        speed_layout.addWidget(self.spark_ips, 1, 0, 1, 2)
+        speed_layout.addWidget(QLabel("Effective:"), 2, 0)
+        speed_layout.addWidget(self.lbl_effective_hz, 2, 1)
+        speed_layout.addWidget(QLabel("Requested:"), 3, 0)
+        speed_layout.addWidget(self.lbl_requested_hz, 3, 1)
+        speed_layout.addWidget(QLabel("CPU time:"), 4, 0)
+        speed_layout.addWidget(self.lbl_cpu_share, 4, 1)
+        speed_layout.addWidget(self.spark_cpu_share, 5, 0, 1, 2)
+        speed_layout.addWidget(QLabel("GUI time:"), 6, 0)
+        speed_layout.addWidget(self.lbl_gui_share, 6, 1)
+        speed_layout.addWidget(self.spark_gui_share, 7, 0, 1, 2)
+
+        speed_group.setLayout(speed_layout)
+        layout.addWidget(speed_group)
+
         # Add stretch to push everything to top
         layout.addStretch()
 
@@ -121,14 +196,63 @@ class MetricsPanel(QWidget):
         self.input_operations = 0
         self.output_operations = 0
         self.program_bytes = 0
+        self.meter.reset()
         self.update_display()
+        self.update_throughput()
 
-    def increment_instruction(self):
-        """Increment instruction counter"""
+    def increment_instruction(self, cycles=1):
+        """Count one instruction that took `cycles` clock cycles"""
         self.instruction_count += 1
-        self.clock_cycles += 1  # For now, 1 instruction = 1 cycle
+        self.clock_cycles += cycles
+        self.update_display()
+
+    def apply_delta(self, delta):
+        """Apply one frame's worth of state changes (a core StateDelta)"""
+        self.instruction_count += delta.instructions
+        self.clock_cycles += delta.cycles
+        # Printable characters only, like the per-character signal it replaces
+        self.output_operations += sum(32 <= value <= 126 for value in delta.output)
+        self.meter.add(instructions=delta.instructions, cycles=delta.cycles,
+                       execution_time=delta.execution_time)
+        if delta.pc is not None:
+            self.set_pc(delta.pc)
         self.update_display()
 
+    def record_frame(self, gui_time, requested_hz):
+        """
+        Account one display frame: gui_time seconds spent applying it and the
+        clock frequency asked for (0 = turbo). Refreshes the throughput
+        figures whenever the meter completes an interval.
+        """
+        self.meter.add(gui_time=gui_time)
+        if requested_hz != self.requested_hz:
+            self.requested_hz = requested_hz
+            self.lbl_requested_hz.setText(ControlPanel.format_speed(requested_hz))
+        if self.meter.sample():
+            self.update_throughput()
+
+    def set_line_cycles(self, line_cycles):
+        """Set the per-BASIC-line cycle costs of the loaded program"""
+        self.line_cycles = line_cycles
+        self.lbl_line_cycles.setText("-")
+
+    def set_basic_line(self, basic_line):
+        """Show the cycle cost of the BASIC line being executed"""
+        cycles = self.line_cycles.get(basic_line)
+        self.lbl_line_cycles.setText("-" if cycles is None else f"{basic_line}: {cycles}")
+
+    def update_throughput(self):
+        """Show the meter's latest rates"""
+        meter = self.meter
+        self.lbl_ips.setText(f"{meter.ips:,.0f}")
+        # format_speed(0) means turbo; a measured 0 Hz is just idle
+        hz = round(meter.effective_hz)
+        self.lbl_effective_hz.setText(ControlPanel.format_speed(hz) if hz else "0 Hz")
+        self.lbl_cpu_share.setText(f"{meter.cpu_share:.0%}")
+        self.lbl_gui_share.setText(f"{meter.gui_share:.0%}")
+        for sparkline in (self.spark_ips, self.spark_cpu_share, self.spark_gui_share):
+            sparkline.update()
+
     def increment_input(self):
         """Increment input operation counter"""
         self.input_operations += 1
@@ -160,6 +284,8 @@ class MetricsPanel(QWidget):
         """Update all metric displays"""
         self.lbl_instructions.setText(f"{self.instruction_count}")
         self.lbl_cycles.setText(f"{self.clock_cycles}")
+        cpi = self.clock_cycles / self.instruction_count if self.instruction_count else 0
+        self.lbl_cpi.setText(f"{cpi:.2f}")
         self.lbl_input_ops.setText(f"{self.input_operations}")
         self.lbl_output_ops.setText(f"{self.output_operations}")
 
@@ -0,0 +1,87 @@
+"""
+Qt adapter for the pure-Python core.
+
+QtSignalBridge re-emits signals of the core hub (src.core.signals) as real
+pyqtSignals, so widgets get Qt semantics: queued delivery across threads and
+slots that take fewer arguments than the signal carries. A hub signal is only
+forwarded once something connects to its Qt mirror, so unobserved
+micro-operations never pay for a Qt emit.
+QtClock drives the core Clock from a QTimer.
+"""
+
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from src.core.clock import Clock
+from src.core.signals import signals
+
+
+class QtSignalBridge(QObject):
+    """Qt mirror of ArchitectureSignals (same names and argument types)"""
+    # Memory signals
+    memory_read = pyqtSignal(int)
+    memory_write = pyqtSignal(int, int)
+    memory_changed = pyqtSignal(int, int)
+    memory_bulk_changed = pyqtSignal(int, int)
+
+    # CPU Register updates
+    register_updated = pyqtSignal(str, int)
+    pc_updated = pyqtSignal(int)
+    mar_updated = pyqtSignal(int)
+    ir_updated = pyqtSignal(int)
+    sp_updated = pyqtSignal(int)
+
+    # ALU flags update
+    flags_updated = pyqtSignal(int)
+
+    # Bus activity
+    bus_transfer = pyqtSignal(str, str, int, str)
+
+    # Code execution tracking
+    current_line_changed = pyqtSignal(int)
+    instruction_executed = pyqtSignal(int)
+    breakpoint_hit = pyqtSignal(str, int)
+    simulation_error = pyqtSignal(str)
+
+    # I/O signals
+    output_written = pyqtSignal(int)
+    output_char_written = pyqtSignal(str)
+    output_cleared = pyqtSignal()
+    input_queued = pyqtSignal(int)
+    input_consumed = pyqtSignal()
+    input_requested = pyqtSignal()
+
+    # Memory panel signals
+    memory_panel_toggle = pyqtSignal()
+
+    def __init__(self, hub):
+        super().__init__()
+        self.hub = hub
+        self._hub_names = set(hub.signal_names())
+        self._forwarded = set()
+
+    def connectNotify(self, signal):
+        """Start forwarding a hub signal the first time its mirror is connected"""
+        name = bytes(signal.name()).decode()
+        if name in self._hub_names and name not in self._forwarded:
+            self._forwarded.add(name)
+            getattr(self.hub, name).connect(getattr(self, name).emit)
+
+
+class QtClock(Clock):
+    """Clock whose pulses come from a QTimer on the GUI event loop"""
+
+    def __init__(self, budget_ms=10):
+        super().__init__(budget_ms)
+        self.timer = QTimer()
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.pulse)
+
+    def _start_timer(self, interval_ms):
+        self.timer.start(interval_ms)
+
+    def _stop_timer(self):
+        self.timer.stop()
+
+
+# Global Qt mirror of the core signal hub
+qt_signals = QtSignalBridge(signals)
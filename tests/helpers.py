@@ -0,0 +1,28 @@
+"""Shared helpers for the tests: compiling and loading the BASIC examples"""
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.sim_manager import SimManager
+from src.compiler.compiler import SimpleBASCATCompiler
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+def compile_example(name):
+    """Compile examples/basic/<name>, asserting it compiles"""
+    with open(os.path.join(ROOT, "examples", "basic", name)) as f:
+        result = SimpleBASCATCompiler().compile(f.read())
+    assert result.success
+    return result
+
+def load_example(name, headless=True):
+    """A SimManager with examples/basic/<name> loaded and its BASIC line map set"""
+    result = compile_example(name)
+    sim = SimManager(headless=headless)
+    assert sim.load_code(result.assembly)
+    sim.set_basic_line_map(result.line_map)
+    return sim
+
+def load_counter(headless=True):
+    """examples/basic/04_counter.bas: FOR I = 0 TO 5 / PRINT I / NEXT I"""
+    return load_example("04_counter.bas", headless)
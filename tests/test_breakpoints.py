@@ -0,0 +1,145 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.sim_manager import SimManager
+from src.core.signals import signals
+from src.core.breakpoints import compile_condition
+from src.compiler.compiler import SimpleBASCATCompiler
+
+COUNTER = """
+    LOAD A, 0
+loop:
+    ADD A, 1
+    STM 0x90, A
+    CMP A, 5
+    JNZ loop
+    HALT
+"""
+
+def run(sim, limit=100000):
+    sim.run()
+    sim.run_burst(limit, float("inf"))
+
+def test_address_breakpoint():
+    """Execution stops before the instruction at a breakpoint, and resumes past it"""
+    for headless in (True, False):
+        sim = SimManager(headless=headless)
+        assert sim.load_code(COUNTER)
+        hits = []
+        def on_hit(kind, address):
+            hits.append((kind, address))
+        signals.breakpoint_hit.connect(on_hit)
+        sim.breakpoints.add(0x03)  # ADD A, 1
+        run(sim)
+        assert sim.cpu.PC == 0x03 and sim.cpu.registers["A"] == 0
+        assert not sim.clock.running
+        assert sim.breakpoints.hit == ("breakpoint", 0x03)
+        run(sim)
+        assert sim.cpu.PC == 0x03 and sim.cpu.registers["A"] == 1
+        assert hits[-1] == ("breakpoint", 0x03)
+        sim.breakpoints.remove(0x03)
+        assert not sim.breakpoints.active
+        run(sim)
+        assert sim.cpu.halted and sim.cpu.registers["A"] == 5
+        signals.breakpoint_hit.disconnect(on_hit)
+
+def test_watchpoints():
+    """Watched reads and writes stop after the accessing instruction"""
+    sim = SimManager(headless=True)
+    assert sim.load_code(COUNTER)
+    sim.breakpoints.watch(0x90, write=True)
+    run(sim)
+    assert sim.breakpoints.hit == ("write", 0x90)
+    assert sim.memory._data[0x90] == 1
+    assert sim.cpu.PC == 0x09  # After STM
+    run(sim)
+    assert sim.memory._data[0x90] == 2
+
+    sim.breakpoints.unwatch(0x90)
+    assert sim.memory.write == sim.memory._plain_write
+    sim.breakpoints.watch(0xFF, read=True, write=False)
+    assert sim.load_code("LOAD A, 1\nIN B\nHALT")
+    sim.memory.io_controller.queue_input(7)
+    run(sim)
+    assert sim.breakpoints.hit == ("read", 0xFF)
+    assert sim.cpu.registers["B"] == 7 and not sim.cpu.halted
+
+def test_basic_line_breakpoint():
+    """BASIC line breakpoints resolve to the statement's first instruction"""
+    result = SimpleBASCATCompiler().compile("10 LET A = 1\n20 LET B = 2\n30 PRINT B\n40 END\n")
+    assert result.success
+    sim = SimManager(headless=True)
+    sim.breakpoints.add_basic_line(20)
+    assert sim.load_code(result.assembly)
+    sim.set_basic_line_map(result.line_map)
+    asm_lines = result.line_map[20]
+    entry = min(address for address, line in sim.line_map.items() if line in asm_lines)
+    assert sim.breakpoints.check[entry]
+    run(sim)
+    assert sim.cpu.PC == entry
+    assert sim.breakpoints.hit == ("breakpoint", entry)
+
+def test_step_over_stops_at_breakpoint():
+    sim = SimManager(headless=True)
+    assert sim.load_code(COUNTER)
+    sim.set_basic_line_map({10: list(range(20))})
+    sim.breakpoints.add(0x09)
+    sim.step_over()
+    assert sim.cpu.PC == 0x09
+
+def test_conditional_breakpoint():
+    """A conditional breakpoint only stops when its condition holds there"""
+    sim = SimManager(headless=True)
+    assert sim.load_code(COUNTER)
+    sim.breakpoints.add(0x09, "A == 3 and [0x90] > 2 and ZF == 0")  # CMP A, 5
+    run(sim)
+    assert sim.cpu.PC == 0x09 and sim.cpu.registers["A"] == 3
+    assert sim.breakpoints.condition(0x09) == "A == 3 and [0x90] > 2 and ZF == 0"
+    run(sim)
+    assert sim.cpu.halted and sim.cpu.registers["A"] == 5
+
+def test_condition_error_stops():
+    """A condition that fails when evaluated stops there instead of raising"""
+    for condition in ("A % B == 1", "A >> (B - 1)", "1 << 1000 > A"):
+        for advance in (run, lambda sim: sim.run_instructions(1000), lambda sim: sim.step_over()):
+            sim = SimManager(headless=True)
+            assert sim.load_code(COUNTER)
+            sim.set_basic_line_map({10: list(range(20))})
+            sim.breakpoints.add(0x09, condition)  # CMP A, 5
+            advance(sim)
+            assert sim.cpu.PC == 0x09 and not sim.cpu.halted, condition
+            assert sim.breakpoints.hit == ("condition_error", 0x09), condition
+    sim = SimManager(headless=True)
+    assert sim.load_code(COUNTER)
+    sim.breakpoints.add(0x09, "A % B == 1")
+    assert sim.run_instructions(1000)[0] == "condition_error"
+
+def test_condition_compiler():
+    sim = SimManager(headless=True)
+    cpu, memory = sim.cpu, sim.memory
+    cpu.registers["A"] = 10
+    memory._data[0x80] = 6
+    cpu.SP = 0xEF
+    for text, expected in [("A == 10 and [0x80] > 5", True), ("SP < 0xF0", True),
+                           ("[0x7F + 1] == 6", True), ("not (b or c)", True),
+                           ("(A & 0b1010) == 10 and A >> 1 == 5", True), ("CF", False),
+                           ("-A + 10 != 0", False), ("[0xFF]", False)]:
+        assert compile_condition(text, cpu, memory)() is expected, text
+    for bad in ["A ==", "__import__('os')", "A.real", "[1, 2]", "x == 1", "'A' == 1", "A if B else C"]:
+        try:
+            compile_condition(bad, cpu, memory)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Accepted invalid condition {bad!r}")
+
+if __name__ == "__main__":
+    test_address_breakpoint()
+    test_watchpoints()
+    test_basic_line_breakpoint()
+    test_step_over_stops_at_breakpoint()
+    test_conditional_breakpoint()
+    test_condition_error_stops()
+    test_condition_compiler()
+    print("Breakpoint tests passed!")
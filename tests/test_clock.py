@@ -0,0 +1,75 @@
+import sys
+import os
+import random
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.clock import Clock
+from src.core.sim_manager import SimManager
+
+class FakeTime:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+def test_clock_compensates_drift():
+    """Jittery, late pulses still add up to frequency * elapsed instructions"""
+    fake = FakeTime()
+    clock = Clock(time_source=fake)
+    issued = []
+    clock.tick.connect(lambda count, deadline: issued.append(count))
+
+    clock.start(1_000_000)
+    assert clock.interval_ms() == Clock.FRAME_INTERVAL_MS
+
+    rng = random.Random(1)
+    for _ in range(120):
+        fake.now += rng.uniform(0.010, 0.030)  # 16 ms timer firing early/late
+        clock.pulse()
+
+    elapsed = fake.now - 100.0
+    assert abs(sum(issued) - elapsed * 1_000_000) <= 1
+
+def test_slow_clock_one_cycle_per_pulse():
+    """Below the frame rate every pulse is a single cycle"""
+    fake = FakeTime()
+    clock = Clock(time_source=fake)
+    issued = []
+    clock.tick.connect(lambda count, deadline: issued.append(count))
+
+    clock.start(7)
+    assert clock.interval_ms() == 142
+    for _ in range(70):
+        fake.now += 1 / 7
+        clock.pulse()
+    assert all(count == 1 for count in issued)
+    assert abs(len(issued) - 70) <= 1
+
+def test_run_burst_respects_count_and_halt():
+    """A burst runs the requested cycles and stops the clock on HALT"""
+    sim = SimManager(headless=True)
+    assert sim.load_code("""
+    LOAD A, 0
+    loop:
+    ADD A, 1
+    JNZ loop
+    HALT
+    """)
+    sim.clock.start(Clock.TURBO)
+
+    # LOAD takes 4 cycles, each ADD (4) + JNZ (3) iteration 7
+    sim.run_burst(4 + 5 * 7, time.perf_counter() + 10)
+    assert sim.cpu.registers["A"] == 5
+    assert sim.cpu.cycles == 39
+
+    sim.run_burst(Clock.TURBO_BURST, time.perf_counter() + 10)
+    assert sim.cpu.halted
+    assert not sim.clock.running
+
+if __name__ == "__main__":
+    test_clock_compensates_drift()
+    test_slow_clock_one_cycle_per_pulse()
+    test_run_burst_respects_count_and_halt()
+    print("Clock tests passed!")
@@ -4,7 +4,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.core.memory import Memory
 from src.core.cpu import CPU
-from src.core.alu import ALU
+from src.core.alu import ALU, FLAG_Z, FLAG_C, ADD_RESULT, ADD_FLAGS, SUB_RESULT, SUB_FLAGS
 from src.core.signals import signals
 
 def test_memory_read_write():
@@ -18,6 +18,50 @@ def test_alu_add():
     assert res == 30
     assert alu.flags["Z"] == 0
 
+def test_alu_tables():
+    """Table lookups match plain 8-bit arithmetic for every operand pair"""
+    for a in range(256):
+        for b in range(256):
+            index = (a << 8) | b
+            assert ADD_RESULT[index] == (a + b) & 0xFF
+            assert bool(ADD_FLAGS[index] & FLAG_C) == (a + b > 255)
+            assert SUB_RESULT[index] == (a - b) & 0xFF
+            assert bool(SUB_FLAGS[index] & FLAG_C) == (b > a)
+            assert bool(SUB_FLAGS[index] & FLAG_Z) == (a == b)
+
+def test_alu_packed_flags():
+    """Flags are stored packed; the dict view is built on demand"""
+    alu = ALU()
+    emitted = []
+    signals.flags_updated.connect(emitted.append)
+    try:
+        assert alu.operate("SUB", 5, 9) == 252
+    finally:
+        signals.flags_updated.disconnect(emitted.append)
+    assert alu.flags == {"Z": 0, "N": 1, "C": 1, "O": 0}
+    assert emitted == [alu.packed_flags]
+
+    assert alu.operate("XOR", 0x5A, 0x5A) == 0
+    assert alu.flags == {"Z": 1, "N": 0, "C": 0, "O": 0}
+    assert alu.operate("NOT", 0x0F) == 0xF0
+
+    alu.flags = {"Z": 0, "N": 0, "C": 1, "O": 0}
+    assert alu.packed_flags == FLAG_C
+
+def test_alu_lazy_flags():
+    """Only the last operation's flags are visible; nothing is computed up front"""
+    alu = ALU(headless=True)
+    alu.operate("SUB", 1, 2)   # Borrow...
+    alu.operate("AND", 0, 7)   # ...overwritten by a zero result
+    assert alu.flags == {"Z": 1, "N": 0, "C": 0, "O": 0}
+    assert alu._flag_key == 0  # Index of the AND result
+
+    alu.operate("ADD", 200, 100)
+    assert alu._flag_key == (200 << 8) | 100  # Recorded, not yet evaluated
+    assert alu.packed_flags == FLAG_C
+    alu.operate("MOV", 0, 0)                  # MOV leaves flags alone
+    assert alu.packed_flags == FLAG_C
+
 def test_cpu_fetch():
     mem = Memory()
     cpu = CPU(mem)
@@ -35,11 +79,58 @@ def test_cpu_fetch():
     assert cpu.IR == 0x00
     assert cpu.PC == 1
 
+def test_register_file():
+    """Registers live in a bytearray; `registers` is a name-based view of it"""
+    cpu = CPU(Memory())
+    assert isinstance(cpu.regs, bytearray)
+    cpu.registers["C"] = 0x1FF
+    assert cpu.regs[2] == 0xFF
+    cpu.regs[0] = 7
+    assert cpu.registers["A"] == 7
+    assert cpu.registers == {"A": 7, "B": 0, "C": 0xFF, "D": 0}
+    assert dict(cpu.registers) == {"A": 7, "B": 0, "C": 0xFF, "D": 0}
+
+    cpu.reset()
+    assert cpu.regs == bytearray(4)
+    assert "PC" in CPU.__slots__ and "SP" in CPU.__slots__
+    for headless in (False, True):
+        assert not hasattr(CPU(Memory(), headless=headless), "__dict__")
+
+def test_memory_change_generations():
+    mem = Memory(headless=True)
+    start = mem.generation
+    assert mem.changed_since(start) == []
+
+    mem.write(0x10, 5)
+    mem.write(0x80, 7)
+    first = mem.generation
+    assert first > start
+    assert mem.changed_since(start) == [0x10, 0x80]
+
+    mem.write(0x10, 6)
+    mem.write(0x20, 0)  # Same value: not a change
+    assert mem.changed_since(first) == [0x10]
+    assert mem.changed_since(start) == [0x10, 0x80]
+
+    # Bulk paths and direct stores (translated code) are seen too
+    latest = mem.generation
+    mem.load_program(0, [1, 2])
+    mem._data[0x90] = 9
+    assert mem.changed_since(latest) == [0x00, 0x01, 0x90]
+    latest = mem.generation
+    mem.reset()
+    assert mem.changed_since(latest) == [0x00, 0x01, 0x10, 0x80, 0x90]
+
 if __name__ == "__main__":
     try:
         test_memory_read_write()
         test_alu_add()
+        test_alu_tables()
+        test_alu_packed_flags()
+        test_alu_lazy_flags()
         test_cpu_fetch()
+        test_register_file()
+        test_memory_change_generations()
         print("All core tests passed!")
     except AssertionError as e:
         print(f"Test failed: {e}")
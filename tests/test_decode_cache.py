@@ -0,0 +1,81 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.sim_manager import SimManager
+
+# The second pass through `patch` must see the immediate POKEd by STM
+SELF_MODIFYING = """
+    LOAD C, 9
+    LOAD D, 0
+patch:
+    LOAD B, 1
+    ADD D, 1
+    STM 8, C
+    CMP D, 2
+    JNZ patch
+    HALT
+"""
+
+# Overwrites the NOP at `slot` with HALT (0xFF) after the first pass
+PATCH_OPCODE = """
+    LOAD C, 255
+    LOAD D, 0
+slot:
+    NOP
+    ADD D, 1
+    STM 6, C
+    JMP slot
+"""
+
+def run_to_halt(sim, limit=1000):
+    for _ in range(limit):
+        if sim.cpu.halted:
+            break
+        sim.step()
+
+def test_poke_into_operand():
+    """Writing an operand byte invalidates the cached instruction"""
+    for headless in (False, True):
+        sim = SimManager(headless=headless)
+        assert sim.load_code(SELF_MODIFYING)
+        run_to_halt(sim)
+        assert sim.cpu.halted
+        assert sim.cpu.registers["B"] == 9
+        assert sim.cpu.registers["D"] == 2
+
+def test_poke_into_opcode():
+    """Writing an opcode byte re-decodes the instruction"""
+    for headless in (False, True):
+        sim = SimManager(headless=headless)
+        assert sim.load_code(PATCH_OPCODE)
+        run_to_halt(sim)
+        assert sim.cpu.halted
+        assert sim.cpu.registers["D"] == 1
+
+def test_cache_filled_and_cleared():
+    """Instructions are cached on first execution; reloading clears them"""
+    sim = SimManager(headless=True)
+    assert sim.load_code(SELF_MODIFYING)
+    cache = sim.cpu._decode_cache
+    assert len(cache) == 0
+
+    sim.step()
+    assert cache.entries[0] is not None
+    assert cache.guard[0:3] == b"\x01\x01\x01"
+
+    # Writing the middle of an instruction drops it
+    sim.memory.write(1, 3)
+    assert cache.entries[0] is None
+    sim.cpu.PC = 0
+    sim.step()
+    assert sim.cpu.registers["D"] == 9  # LOAD D, 9 after the patch
+
+    sim.memory.reset()
+    assert len(cache) == 0
+
+if __name__ == "__main__":
+    test_poke_into_operand()
+    test_poke_into_opcode()
+    test_cache_filled_and_cleared()
+    print("Decode cache tests passed!")
@@ -1,9 +1,15 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 from PyQt6.QtWidgets import QApplication
 
+from src.core.state_delta import StateDelta
+
+# One QApplication for every test in this module
+app = QApplication.instance() or QApplication([])
+
 def run_tests():
     # Setup app
     app = QApplication.instance()
@@ -38,8 +44,95 @@ def run_tests():
 
     print("GUI Tests Passed!")
 
+def test_circuit_view_bus_pool():
+    """Bus animations reuse pooled packets and glow only above the glow rate"""
+    from src.gui.circuit_view import CircuitView
+    cv = CircuitView()
+    items = cv.scene.items()
+    delta = StateDelta()
+    delta.bus_activity[("Memory", "Data Bus", "data")] = [1, 7]
+    delta.bus_activity[("ALU", "Internal Bus", "data")] = [1, 7]
+    cv.glow_rate = float("inf")
+    for _ in range(20):
+        cv.apply_delta(delta)
+    assert len(cv.scene.items()) == len(items), "Bus animations added scene items instead of reusing the pool"
+    assert not cv._free_packets, "Packet pool not used"
+    cv.glow_rate = 0
+    cv.apply_delta(delta)
+    assert cv.data_bus_main.active, "Bus did not glow above the glow rate"
+
+def test_data_packet_path():
+    """Packets find their position on the path by progress; geometry is cached"""
+    from src.gui.components.graphics import DataPacket
+    packet = DataPacket([(0, 0), (10, 0), (10, 20), (0, 20)])
+    for progress, expected in [(0.0, (0, 0)), (0.2, (8, 0)), (0.5, (10, 10)), (1.0, (0, 20))]:
+        packet.set_progress(progress)
+        assert (packet.pos().x(), packet.pos().y()) == expected, f"Packet at {progress} not at {expected}"
+    assert packet.boundingRect() is packet.boundingRect(), "Packet bounding rect not cached"
+
+def test_memory_panel_model():
+    """Only changed cells are refreshed; views switch between variables and full memory"""
+    from src.gui.memory_panel import MemoryPanel
+    from src.core.memory import Memory
+    memory = Memory(headless=True)
+    memory_panel = MemoryPanel(memory)
+    memory_panel.view_mode.setCurrentText("Variables")
+    model = memory_panel.model
+    changed_rows = []
+    model.dataChanged.connect(lambda top, bottom: changed_rows.append((top.row(), bottom.row())))
+    memory.write(0x81, 0x41)
+    memory_panel.apply_delta(StateDelta())
+    assert model.index(1, 1).data() == "0x41" and model.index(1, 3).data() == "A", \
+        "Changed variable cell not updated"
+    assert changed_rows == [(1, 1)], f"Expected only row 1 to change, got {changed_rows}"
+    memory_panel.view_mode.setCurrentText("Full Memory")
+    assert model.rowCount() == 256 and model.index(0xFD, 4).data() == "Stack ◄SP", \
+        "Full memory view incorrect"
+
+def test_io_panel_buffered_output():
+    """Output arrives once per frame; the scrollback is capped"""
+    from src.gui.io_panel import IOPanel
+    io_panel = IOPanel()
+    delta = StateDelta()
+    delta.output = [72, 105, 1, 10]
+    io_panel.apply_delta(delta)
+    assert io_panel.output_display.toPlainText() == "Hi[0x01]\n", \
+        f"Unexpected output {io_panel.output_display.toPlainText()!r}"
+    io_panel.scrollback = 100
+    delta.output = [ord("a") + i % 26 for i in range(5000)]
+    io_panel.apply_delta(delta)
+    text = io_panel.output_display.toPlainText()
+    expected = "".join(chr(ord("a") + i % 26) for i in range(4900, 5000))
+    assert len(text) <= 100 and text.endswith(expected[-len(text):]), "Scrollback cap not applied"
+
+def test_dual_editor_line_highlighting():
+    """BASIC line numbers map to editor lines, rebuilt after edits"""
+    from src.gui.dual_editor import DualEditor
+    dual = DualEditor()
+    dual.basic_editor.set_code("10 PRINT 1\n\n20 PRINT 2\n")
+    dual.highlight_basic_line_number(20)
+    assert dual.basic_editor.current_highlight_line == 2, "BASIC line 20 not highlighted"
+    dual.basic_editor.set_code("20 PRINT 2\n")
+    dual.highlight_basic_line_number(20)
+    assert dual.basic_editor.current_highlight_line == 0, "BASIC line index not rebuilt after edit"
+
+def test_metrics_panel_counts_printable_output():
+    """Output operations count printable characters, not control bytes"""
+    from src.gui.metrics_panel import MetricsPanel
+    panel = MetricsPanel()
+    delta = StateDelta()
+    delta.output = [72, 105, 1, 10]
+    panel.apply_delta(delta)
+    assert panel.output_operations == 2
+
 if __name__ == "__main__":
     try:
+        test_circuit_view_bus_pool()
+        test_data_packet_path()
+        test_memory_panel_model()
+        test_io_panel_buffered_output()
+        test_dual_editor_line_highlighting()
+        test_metrics_panel_counts_printable_output()
         run_tests()
     except Exception as e:
         print(f"GUI Test Failed: {e}")
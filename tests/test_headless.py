@@ -0,0 +1,70 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.sim_manager import SimManager
+from src.core.signals import signals
+
+PROGRAM = """
+    LOAD A, 3
+    LOAD B, 0
+loop:
+    ADD B, 2
+    PUSH B
+    POP C
+    STM 0x80, C
+    OUT C
+    SUB A, 1
+    CMP A, 0
+    JNZ loop
+    LDM D, 0x80
+    HALT
+"""
+
+def run_to_halt(sim, limit=1000):
+    for _ in range(limit):
+        if sim.cpu.halted:
+            break
+        sim.step()
+
+def test_headless_matches_observed():
+    """Headless and observed modes must reach the same final state"""
+    observed = SimManager()
+    headless = SimManager(headless=True)
+    for sim in (observed, headless):
+        assert sim.load_code(PROGRAM)
+        run_to_halt(sim)
+
+    assert headless.cpu.halted
+    assert headless.cpu.registers == observed.cpu.registers
+    assert headless.cpu.registers["D"] == 6
+    assert headless.cpu.PC == observed.cpu.PC
+    assert headless.cpu.SP == observed.cpu.SP
+    assert headless.cpu.alu.flags == observed.cpu.alu.flags
+    assert headless.memory._data == observed.memory._data
+    assert headless.memory.io_controller.output_buffer == [2, 4, 6]
+
+def test_headless_emits_no_signals():
+    """Headless mode must not emit any architecture signals"""
+    emitted = []
+    handler = lambda *args: emitted.append(args)
+    watched = [signals.bus_transfer, signals.register_updated, signals.pc_updated,
+               signals.mar_updated, signals.flags_updated, signals.memory_changed,
+               signals.output_written, signals.current_line_changed]
+    for sig in watched:
+        sig.connect(handler)
+    try:
+        sim = SimManager(headless=True)
+        assert sim.load_code(PROGRAM)
+        run_to_halt(sim)
+    finally:
+        for sig in watched:
+            sig.disconnect(handler)
+
+    assert sim.cpu.halted
+    assert emitted == []
+
+if __name__ == "__main__":
+    test_headless_matches_observed()
+    test_headless_emits_no_signals()
+    print("Headless tests passed!")
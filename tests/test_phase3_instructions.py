@@ -177,6 +177,38 @@ def test_conditional_jnz():
 
     assert cpu.PC == 9  # Should have jumped
 
+def test_conditional_jc_jnc():
+    """Test JC/JNC (Jump if Carry / Not Carry) and register-operand SUB"""
+    mem = Memory()
+    cpu = CPU(mem)
+
+    code = """
+    LOAD A, 5
+    LOAD B, 10
+    SUB A, B
+    JNC 0
+    JC 14
+    HALT
+    """
+    bytecode, error, _ = Assembler.assemble(code)
+    assert error is None
+
+    for i, byte in enumerate(bytecode):
+        mem.write(i, byte)
+
+    cpu.reset()
+    cpu.execute_instruction()  # LOAD A, 5
+    cpu.execute_instruction()  # LOAD B, 10
+    cpu.execute_instruction()  # SUB A, B (borrow sets C flag)
+    assert cpu.registers["A"] == 0xFB
+    assert cpu.alu.flags["C"] == 1
+
+    cpu.execute_instruction()  # JNC 0 (should not jump)
+    assert cpu.PC == 11
+
+    cpu.execute_instruction()  # JC 14 (should jump)
+    assert cpu.PC == 14
+
 def test_stack_push_pop():
     """Test PUSH and POP instructions"""
     mem = Memory()
@@ -293,6 +325,7 @@ if __name__ == "__main__":
         test_cmp_instruction()
         test_conditional_jz()
         test_conditional_jnz()
+        test_conditional_jc_jnc()
         test_stack_push_pop()
         test_memory_ldm_stm()
         test_mov_register_to_register()
@@ -0,0 +1,74 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests.helpers import load_counter
+
+def step_to_halt(sim):
+    while not sim.cpu.halted:
+        sim.step()
+
+def test_profile_is_the_same_interpreted_and_translated():
+    """Stepping (observed or headless) and translated runs give the same profile"""
+    tables = []
+    for headless, translated in ((False, False), (True, False), (True, True)):
+        sim = load_counter(headless)
+        sim.start_profiling()
+        if translated:
+            sim.run_until_halt()
+        else:
+            step_to_halt(sim)
+        table = sim.profile_table("address")
+        assert sum(executions for _, executions, _ in table) == sim.profiler.total()
+        assert sum(cycles for _, _, cycles in table) == sim.cpu.cycles
+        tables.append(table)
+    assert tables[0] == tables[1] == tables[2]
+
+def test_profile_groupings():
+    """Rows aggregate to assembly and BASIC lines, most cycles first"""
+    sim = load_counter()
+    sim.start_profiling()
+    sim.run_until_halt()
+    basic = sim.profile_table()
+    assert {line for line, _, _ in basic} == {30, 40, 50, 60}
+    assert [row[2] for row in basic] == sorted((row[2] for row in basic), reverse=True)
+    assert dict((line, cycles) for line, _, cycles in basic)[60] == sim.basic_line_cycles()[60]
+    lines = sim.profile_table("line")
+    assert sum(row[2] for row in lines) == sum(row[2] for row in basic) == sim.cpu.cycles
+    try:
+        sim.profile_table("opcode")
+        assert False, "Unknown grouping accepted"
+    except ValueError:
+        pass
+
+def test_profile_cycles_survive_code_changes():
+    """Cycles are those of the instructions that ran, not of what memory holds now"""
+    for headless in (False, True):
+        sim = load_counter(headless)
+        sim.start_profiling()
+        sim.run_until_halt()
+        table = sim.profile_table("address")
+        assert sum(cycles for _, _, cycles in table) == sim.cpu.cycles
+        for address, _, _ in table:
+            sim.memory.write(address, 0x31)  # STM: more cycles than any instruction here
+        assert sim.profile_table("address") == table
+
+def test_profiling_is_opt_in():
+    """Nothing is counted before start_profiling or after stop_profiling"""
+    sim = load_counter()
+    assert sim.profile_table() == []
+    sim.run_instructions(10)
+    sim.start_profiling()
+    sim.run_instructions(20)
+    sim.stop_profiling()
+    sim.run_until_halt()
+    assert sim.profiler.total() == 20
+    sim.reset_profile()
+    assert sim.profile_table() == []
+
+if __name__ == "__main__":
+    test_profile_is_the_same_interpreted_and_translated()
+    test_profile_groupings()
+    test_profile_cycles_survive_code_changes()
+    test_profiling_is_opt_in()
+    print("Profiler tests passed!")
@@ -0,0 +1,58 @@
+import sys
+import os
+import subprocess
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.signals import ArchitectureSignals, signals
+from src.core.clock import Clock
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+def test_signal_connect_emit_disconnect():
+    """Pure-Python signals deliver arguments and can be disconnected"""
+    hub = ArchitectureSignals()
+    received = []
+    slot = lambda name, value: received.append((name, value))
+
+    hub.register_updated.connect(slot)
+    hub.register_updated.emit("A", 42)
+    assert received == [("A", 42)]
+
+    hub.register_updated.disconnect(slot)
+    hub.register_updated.emit("B", 1)
+    assert received == [("A", 42)]
+
+def test_signals_are_per_instance():
+    """Each hub (and each Clock) owns its own connections"""
+    first = ArchitectureSignals()
+    second = ArchitectureSignals()
+    received = []
+    first.pc_updated.connect(received.append)
+    second.pc_updated.emit(7)
+    assert received == []
+
+    clock_a, clock_b = Clock(), Clock()
+    clock_a.tick.connect(lambda: None)
+    assert clock_a.tick.has_receivers()
+    assert not clock_b.tick.has_receivers()
+
+def test_signal_names_match_hub():
+    """The hub exposes every declared signal name"""
+    names = ArchitectureSignals.signal_names()
+    for name in ("register_updated", "bus_transfer", "memory_changed", "current_line_changed"):
+        assert name in names
+        assert hasattr(signals, name)
+
+def test_core_imports_without_qt():
+    """Importing the simulator core must not load PyQt6"""
+    code = ("import sys; from src.core.cpu import CPU; from src.core.sim_manager import SimManager; "
+            "sys.exit(1 if any(m.startswith('PyQt6') for m in sys.modules) else 0)")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT)
+    assert result.returncode == 0
+
+if __name__ == "__main__":
+    test_signal_connect_emit_disconnect()
+    test_signals_are_per_instance()
+    test_signal_names_match_hub()
+    test_core_imports_without_qt()
+    print("Signal hub tests passed!")
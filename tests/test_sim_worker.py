@@ -0,0 +1,112 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.clock import Clock
+from src.core.sim_manager import SimManager
+from src.core.sim_worker import SimWorker
+from src.core.signals import signals
+
+LOOP = """
+    LOAD A, 0
+loop:
+    ADD A, 1
+    JMP loop
+"""
+
+def wait_idle(worker):
+    """Block until every queued command has been executed"""
+    while not worker.commands.empty():
+        time.sleep(0.001)
+    worker.call(lambda: None)
+
+def test_worker_runs_to_halt():
+    """Run executes on the worker thread until HALT"""
+    sim = SimManager(headless=True)
+    worker = SimWorker(sim)
+    worker.start()
+    try:
+        assert worker.call(sim.load_code, "LOAD A, 7\nADD A, 5\nHALT")
+        worker.post("speed", Clock.TURBO)
+        worker.post("run")
+        deadline = time.perf_counter() + 5
+        while not sim.snapshot().halted and time.perf_counter() < deadline:
+            time.sleep(0.005)
+        snapshot = sim.snapshot()
+        assert snapshot.halted
+        assert snapshot.registers["A"] == 12
+    finally:
+        worker.shutdown()
+
+def test_pause_stops_running_program():
+    """Pause arrives through the queue and stops the clock"""
+    sim = SimManager(headless=True)
+    worker = SimWorker(sim)
+    worker.start()
+    try:
+        assert worker.call(sim.load_code, LOOP)
+        worker.post("speed", Clock.TURBO)
+        worker.post("run")
+        time.sleep(0.05)
+        worker.post("pause")
+        wait_idle(worker)
+        assert not sim.clock.running
+        pc = sim.snapshot().pc
+        time.sleep(0.02)
+        assert sim.snapshot().pc == pc
+    finally:
+        worker.shutdown()
+
+def test_pause_interrupts_endless_step_over():
+    """A step-over that never leaves its BASIC line can still be interrupted"""
+    sim = SimManager(headless=True)
+    worker = SimWorker(sim)
+    worker.start()
+    try:
+        assert worker.call(sim.load_code, LOOP)
+        worker.call(sim.set_basic_line_map, {10: [1, 2, 3, 4]})
+        worker.post("step")  # LOAD A, 0 -> now inside the BASIC line's loop
+        worker.post("step_over")
+        time.sleep(0.05)
+        worker.post("pause")
+        wait_idle(worker)
+        assert not sim.snapshot().halted
+    finally:
+        worker.shutdown()
+    assert not worker.is_alive()
+
+def test_worker_survives_execution_error():
+    """A program running off the end of memory stops the clock, not the worker"""
+    sim = SimManager(headless=True)
+    worker = SimWorker(sim)
+    errors = []
+    signals.simulation_error.connect(errors.append)
+    worker.start()
+    try:
+        assert worker.call(sim.load_code, "LOAD A, 7")  # No HALT: PC runs past 0xFF
+        worker.post("speed", Clock.TURBO)
+        worker.post("run")
+        deadline = time.perf_counter() + 5
+        while not errors and time.perf_counter() < deadline:
+            time.sleep(0.005)
+        assert errors and "out of bounds" in errors[0]
+        wait_idle(worker)
+        assert worker.is_alive() and not sim.clock.running
+        worker.call(sim.reset)
+        assert worker.call(sim.load_code, "LOAD A, 7\nHALT")
+        worker.post("step")
+        wait_idle(worker)
+        snapshot = sim.snapshot()
+        assert snapshot.registers["A"] == 7 and snapshot.pc == 3
+    finally:
+        signals.simulation_error.disconnect(errors.append)
+        worker.shutdown()
+    assert not worker.is_alive()
+
+if __name__ == "__main__":
+    test_worker_runs_to_halt()
+    test_pause_stops_running_program()
+    test_pause_interrupts_endless_step_over()
+    test_worker_survives_execution_error()
+    print("Worker tests passed!")
@@ -0,0 +1,85 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.sim_manager import SimManager
+from src.core.signals import signals
+
+def test_delta_coalesces_instruction_effects():
+    """One flush summarises every micro-operation since the previous one"""
+    sim = SimManager()
+    sim.start_delta_recording()
+    try:
+        assert sim.load_code("""
+        LOAD A, 65
+        STM 0x80, A
+        OUT A
+        ADD A, 1
+        OUT A
+        HALT
+        """)
+        sim.flush_delta()  # Discard the load/reset state
+
+        for _ in range(6):
+            sim.step()
+        delta = sim.flush_delta()
+    finally:
+        sim.delta_recorder.detach()
+
+    assert delta.instructions == 6
+    assert delta.registers == {"A": 66}
+    assert delta.pc == 14
+    assert delta.flags == {"Z": 0, "N": 0, "C": 0, "O": 0}
+    assert 0x80 in delta.dirty_memory
+    assert delta.output == [65, 66]
+    assert delta.bus_transfer_count() > 6
+
+    # Nothing happened since the flush
+    assert sim.flush_delta().is_empty()
+
+def test_delta_without_recording_is_empty():
+    """Flushing without a recorder yields an empty delta"""
+    sim = SimManager()
+    assert sim.load_code("LOAD A, 1\nHALT")
+    sim.step()
+    assert sim.flush_delta().is_empty()
+
+def test_program_load_is_one_bulk_change():
+    """Reset and load announce whole ranges instead of one event per byte"""
+    sim = SimManager()
+    per_byte, bulk = [], []
+    slot_changed = lambda address, value: per_byte.append(address)
+    slot_bulk = lambda start, length: bulk.append((start, length))
+    signals.memory_changed.connect(slot_changed)
+    signals.memory_bulk_changed.connect(slot_bulk)
+    sim.start_delta_recording()
+    try:
+        assert sim.load_code("LOAD A, 1\nSTM 0x80, A\nHALT")
+        delta = sim.flush_delta()
+    finally:
+        sim.delta_recorder.detach()
+        signals.memory_changed.disconnect(slot_changed)
+        signals.memory_bulk_changed.disconnect(slot_bulk)
+
+    assert per_byte == []
+    assert bulk == [(0, 256), (0, 7)]
+    assert delta.dirty_memory == set(range(256))
+    assert bytes(sim.memory._data[:7]) == bytes([0x01, 0x00, 0x01, 0x31, 0x80, 0x00, 0xFF])
+
+def test_reload_over_cached_code():
+    """Loading new bytes over executed code invalidates its decoded form"""
+    sim = SimManager(headless=True)
+    assert sim.load_code("LOAD A, 1\nHALT")
+    sim.step()
+    assert sim.cpu.registers["A"] == 1
+    sim.memory.load_program(0, [0x01, 0x00, 0x07])  # LOAD A, 7
+    sim.cpu.PC = 0
+    sim.step()
+    assert sim.cpu.registers["A"] == 7
+
+if __name__ == "__main__":
+    test_delta_coalesces_instruction_effects()
+    test_delta_without_recording_is_empty()
+    test_program_load_is_one_bulk_change()
+    test_reload_over_cached_code()
+    print("State delta tests passed!")
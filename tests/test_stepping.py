@@ -0,0 +1,134 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.cpu import CPU
+from src.core.sim_manager import SimManager
+from tests.helpers import load_counter
+
+READ_LOOP = """
+    LOAD A, 0
+loop:
+    ADD A, 1
+    IN B
+    JMP loop
+"""
+
+def basic_line(sim):
+    return sim.address_basic_line[sim.cpu.PC]
+
+def test_address_table():
+    sim = load_counter()
+    lines = sim.address_basic_line
+    assert lines[0] == 30
+    assert [lines[address] for address in sorted(sim.line_map)][-1] == 60
+    assert lines[0xFF] is None and len(lines) > 0xFF
+    sim.reset()
+    assert not any(sim.address_basic_line)
+
+def test_step_over_statements():
+    sim = load_counter()
+    visited = [basic_line(sim)]
+    for _ in range(4):
+        sim.step_over()
+        visited.append(basic_line(sim))
+    assert visited == [30, 40, 50, 40, 50]
+    assert sim.memory.io_controller.output_buffer == [0, 10, 1, 10]
+
+def test_step_out_of_loop():
+    sim = load_counter()
+    sim.step_over()
+    assert basic_line(sim) == 40
+    sim.step_out()
+    assert basic_line(sim) == 60
+    assert sim.memory.io_controller.output_buffer.count(10) == 6
+
+def test_run_to_line():
+    sim = load_counter()
+    sim.run_to_line(50)
+    assert basic_line(sim) == 50
+    assert sim.memory._data[0x88] == 0
+    sim.run_to_line(50)  # Leaves line 50 and comes back on the next iteration
+    assert basic_line(sim) == 50
+    assert sim.memory._data[0x88] == 1
+    sim.run_to_line(99)  # Never reached: runs to the end
+    assert sim.cpu.halted
+
+def test_run_until_address_and_budget():
+    sim = load_counter()
+    end = max(sim.line_map)  # HALT
+    assert sim.run_instructions(5) == ("budget", 5)
+    reason, executed = sim.run_until_address(end, max_instructions=10)
+    assert (reason, executed) == ("budget", 10)
+    reason, executed = sim.run_until_address(end)
+    assert reason == "target" and sim.cpu.PC == end and not sim.cpu.halted
+    assert sim.memory.io_controller.output_buffer.count(10) == 6
+    assert sim.run_until_halt() == ("halted", 1)
+    assert sim.run_until_halt() == ("halted", 0)
+    try:
+        sim.run_until_address(0x100)
+        assert False, "Address past the end of memory accepted"
+    except ValueError:
+        pass
+
+def test_run_until_basic_line_stops_at_breakpoints():
+    sim = load_counter()
+    assert sim.run_until_basic_line(50)[0] == "target"
+    assert basic_line(sim) == 50
+    sim.breakpoints.watch(0x88)  # I
+    reason, executed = sim.run_until_halt()
+    assert reason == "write" and sim.breakpoints.hit == ("write", 0x88)
+    assert sim.memory._data[0x88] == 1
+
+def test_run_until_halt_stops_at_conditional_breakpoint():
+    sim = load_counter()
+    sim.run_until_basic_line(50)
+    entry = sim.cpu.PC
+    sim.breakpoints.add(entry, "[0x88] == 3")
+    assert sim.run_until_halt()[0] == "breakpoint"
+    assert sim.cpu.PC == entry and sim.memory._data[0x88] == 3
+    assert sim.run_until_halt()[0] == "halted"
+
+def test_quiet_run_stops_waiting_for_input():
+    """An IN on an empty input queue ends a quiet run without being counted"""
+    for headless, checked in ((True, False), (False, False), (True, True)):
+        sim = SimManager(headless=headless)
+        assert sim.load_code(READ_LOOP)
+        if checked:
+            sim.breakpoints.watch(0x80)  # Watchpoints force the checked loop
+        for value in (7, 8, 9):
+            sim.memory.io_controller.queue_input(value)
+        # LOAD, three passes of ADD/IN/JMP, then the ADD before the blocked IN
+        assert sim.run_until_halt() == ("input", 11)
+        assert sim.cpu.cycles == CPU.CYCLES[0x01] + 4 * CPU.CYCLES[0x02] + 3 * (
+            CPU.CYCLES[0x41] + CPU.CYCLES[0x10])
+        assert sim.memory._data[sim.cpu.PC] == 0x41 and sim.cpu.registers["B"] == 9
+        assert sim.run_instructions(100) == ("input", 0)
+        sim.memory.io_controller.queue_input(10)
+        assert sim.run_instructions(3) == ("budget", 3)
+        assert sim.cpu.registers["B"] == 10
+
+def test_quiet_run_records_one_delta():
+    sim = load_counter(headless=False)
+    recorder = sim.start_delta_recording()
+    sim.flush_delta()
+    reason, executed = sim.run_until_halt()
+    assert reason == "halted" and recorder.attached
+    delta = sim.flush_delta()
+    assert delta.instructions == executed
+    assert delta.pc == sim.cpu.PC and delta.registers["A"] == sim.cpu.registers["A"]
+    assert delta.output == sim.memory.io_controller.output_buffer
+    assert len(delta.dirty_memory) == 256
+    recorder.detach()
+
+if __name__ == "__main__":
+    test_address_table()
+    test_step_over_statements()
+    test_step_out_of_loop()
+    test_run_to_line()
+    test_run_until_address_and_budget()
+    test_run_until_basic_line_stops_at_breakpoints()
+    test_run_until_halt_stops_at_conditional_breakpoint()
+    test_quiet_run_stops_waiting_for_input()
+    test_quiet_run_records_one_delta()
+    print("Stepping tests passed!")
@@ -0,0 +1,57 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.throughput import ThroughputMeter
+from src.core.sim_manager import SimManager
+
+class FakeTime:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def test_meter_rates():
+    """Rates are computed per completed interval"""
+    clock = FakeTime()
+    meter = ThroughputMeter(interval=0.5, history=3, time_source=clock)
+    meter.add(instructions=1000, cycles=1500, execution_time=0.2, gui_time=0.05)
+    clock.now = 0.25
+    assert not meter.sample()
+    meter.add(instructions=1000, cycles=1500, execution_time=0.2, gui_time=0.05)
+    clock.now = 0.5
+    assert meter.sample()
+    assert meter.ips == 4000
+    assert meter.effective_hz == 6000
+    assert abs(meter.cpu_share - 0.8) < 1e-9
+    assert abs(meter.gui_share - 0.2) < 1e-9
+
+    # Next interval starts from zero; history is bounded
+    for i in range(4):
+        clock.now += 0.5
+        assert meter.sample()
+    assert meter.ips == 0
+    assert list(meter.history["ips"]) == [0, 0, 0]
+
+def test_execution_time_in_delta():
+    """Time spent in clock bursts reaches the GUI through the frame delta"""
+    sim = SimManager()
+    sim.start_delta_recording()
+    assert sim.load_code("""
+        LOAD A, 0
+    loop:
+        ADD A, 1
+        JMP loop
+    """)
+    sim.flush_delta()
+    sim.run_burst(4 + 70 * 7, float("inf"))  # LOAD, then 70 x ADD + JMP
+    delta = sim.flush_delta()
+    assert delta.instructions == 141
+    assert delta.cycles == 494
+    assert delta.execution_time > 0
+    assert sim.flush_delta().execution_time == 0
+
+if __name__ == "__main__":
+    test_meter_rates()
+    test_execution_time_in_delta()
+    print("Throughput tests passed!")
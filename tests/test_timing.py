@@ -0,0 +1,89 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.cpu import CPU
+from src.core.sim_manager import SimManager
+from tests.helpers import compile_example, load_counter
+
+def test_cycle_table():
+    """One fetch cycle per instruction byte plus the execute cycles"""
+    assert CPU.CYCLES[0x01] == 4  # LOAD A, 5
+    assert CPU.CYCLES[0x12] == 3  # JNZ addr
+    assert CPU.CYCLES[0x31] == 5  # STM [addr], A
+    assert CPU.CYCLES[0x20] == 4  # PUSH A
+    assert CPU.CYCLES[0xFF] == 2  # HALT
+    assert CPU.MAX_CYCLES == 5
+
+def test_cycles_match_across_engines():
+    """Interpreter (observed and headless) and translator count the same cycles"""
+    for name in ("01_hello_world.bas", "04_counter.bas", "09_memory_demo.bas"):
+        assembly = compile_example(name).assembly
+        counts = []
+        for headless in (False, True):
+            sim = SimManager(headless=headless)
+            assert sim.load_code(assembly)
+            steps = 0
+            while not sim.cpu.halted and steps < 100000:
+                sim.step()
+                steps += 1
+            counts.append(sim.cpu.cycles)
+        sim = SimManager(headless=True)
+        assert sim.load_code(assembly)
+        sim.run_until_halt()
+        counts.append(sim.cpu.cycles)
+        assert counts[0] > 0 and counts.count(counts[0]) == 3, (name, counts)
+
+def test_burst_paces_cycles():
+    """Instructions that overshoot a burst's cycles are paid back by the next one"""
+    sim = SimManager(headless=True)
+    assert sim.load_code("""
+    LOAD A, 0
+    loop:
+    ADD A, 1
+    JMP loop
+    """)
+    sim.run()
+    for _ in range(100):
+        sim.run_burst(1, time.perf_counter() + 10)
+    assert 100 <= sim.cpu.cycles < 100 + CPU.MAX_CYCLES
+    sim.reset()
+    assert sim.cpu.cycles == 0
+
+def test_delta_cycles_after_reload():
+    """Cycles in a delta restart from zero after a reload or reset"""
+    program = """
+    LOAD A, 0
+    loop:
+    ADD A, 1
+    JMP loop
+    """
+    sim = SimManager()
+    sim.start_delta_recording()
+    assert sim.load_code(program)
+    sim.run_instructions(1000)
+    assert sim.flush_delta().cycles == sim.cpu.cycles
+    assert sim.load_code(program)
+    sim.run_instructions(3000)  # past the count at the previous flush
+    assert sim.flush_delta().cycles == sim.cpu.cycles > 0
+    sim.reset()
+    assert sim.flush_delta().cycles == 0
+
+def test_basic_line_cycles():
+    """Per BASIC line: the cycles of one pass through its instructions"""
+    sim = load_counter()
+    cycles = sim.basic_line_cycles()
+    assert set(cycles) == {30, 40, 50, 60}
+    assert cycles[60] == CPU.CYCLES[0xFF]
+    data = sim.memory._data
+    assert sum(cycles.values()) == sum(CPU.CYCLES[data[address]] for address in sim.line_map
+                                       if sim.address_basic_line[address] is not None)
+
+if __name__ == "__main__":
+    test_cycle_table()
+    test_cycles_match_across_engines()
+    test_burst_paces_cycles()
+    test_delta_cycles_after_reload()
+    test_basic_line_cycles()
+    print("Timing tests passed!")
@@ -0,0 +1,192 @@
+import sys
+import os
+import glob
+import random
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.memory import Memory
+from src.core.cpu import CPU
+from src.core.assembler import Assembler
+from src.core.translator import BlockTranslator
+from src.core.profiler import Profiler
+from src.core.sim_manager import SimManager
+from src.compiler.compiler import SimpleBASCATCompiler
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+OPCODES = [0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09,
+           0x10, 0x11, 0x12, 0x13, 0x14, 0x20, 0x21, 0x30, 0x31, 0x40, 0x41, 0xFF]
+
+def make_machine(program, inputs):
+    memory = Memory(headless=True)
+    cpu = CPU(memory, headless=True)
+    memory.load_program(0, program)
+    for value in inputs:
+        memory.io_controller.queue_input(value)
+    return memory, cpu
+
+def state(memory, cpu):
+    return (dict(cpu.registers), dict(cpu.alu.flags), cpu.PC, cpu.SP, cpu.IR, cpu.MAR,
+            cpu.halted, cpu.cycles, bytes(memory._data), list(memory.io_controller.output_buffer))
+
+def run_interpreted(program, inputs, limit):
+    memory, cpu = make_machine(program, inputs)
+    executed = 0
+    try:
+        while executed < limit and not cpu.halted:
+            cpu.execute_instruction()
+            executed += 1
+    except ValueError:
+        return "out of bounds", executed
+    return state(memory, cpu), executed
+
+def run_translated(program, inputs, limit):
+    memory, cpu = make_machine(program, inputs)
+    translator = BlockTranslator(cpu)
+    executed = 0
+    try:
+        while executed < limit and not cpu.halted:
+            executed += translator.run(limit - executed)
+    except ValueError:
+        return "out of bounds", None
+    return state(memory, cpu), executed
+
+def assert_equivalent(program, inputs=(), limit=2000):
+    expected, count = run_interpreted(program, inputs, limit)
+    actual, translated_count = run_translated(program, inputs, limit)
+    assert actual == expected
+    if expected != "out of bounds":
+        assert translated_count == count
+
+def example_programs():
+    programs = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "examples", "assembly", "*.asm"))):
+        with open(path) as f:
+            bytecode, error, _ = Assembler.assemble(f.read())
+        if not error:
+            programs.append(bytecode)
+    compiler = SimpleBASCATCompiler()
+    for path in sorted(glob.glob(os.path.join(ROOT, "examples", "basic", "*.bas"))):
+        with open(path) as f:
+            result = compiler.compile(f.read())
+        if result.success:
+            programs.append(result.bytecode)
+    return programs
+
+def random_program(rng, size=48):
+    """Random instruction stream, including self-modifying stores and odd registers"""
+    program = []
+    while len(program) < size:
+        opcode = rng.choice(OPCODES)
+        layout = CPU.OPERAND_LAYOUT[opcode]
+        program.append(opcode)
+        for kind in layout:
+            if kind == "r":
+                program.append(rng.choice([0, 1, 2, 3, 3, 5]))
+            elif opcode in (0x10, 0x11, 0x12, 0x13, 0x14, 0x31):
+                program.append(rng.randrange(size + 4))  # Jump/store into the code
+            else:
+                program.append(rng.choice([0, 1, 0x7F, 0x80, 0x81, 0x83, 0xFE, 0xFF, rng.randrange(256)]))
+    return program
+
+def test_examples_match_interpreter():
+    """Every shipped example ends in the same state translated or interpreted"""
+    for program in example_programs():
+        assert_equivalent(program, inputs=[5, 9, 13, 0, 200, 7, 7, 1])
+
+def test_random_programs_match_interpreter():
+    """Random (often self-modifying) programs match the interpreter exactly"""
+    rng = random.Random(1234)
+    for _ in range(300):
+        assert_equivalent(random_program(rng), inputs=[rng.randrange(256) for _ in range(4)], limit=500)
+
+def test_self_modifying_loop():
+    """A loop that patches its own immediate operand is re-translated"""
+    program, error, _ = Assembler.assemble("""
+        LOAD C, 9
+        LOAD D, 0
+    patch:
+        LOAD B, 1
+        ADD D, 1
+        STM 8, C
+        CMP D, 2
+        JNZ patch
+        HALT
+    """)
+    assert not error
+    assert_equivalent(program)
+    memory, cpu = make_machine(program, ())
+    BlockTranslator(cpu).run(100)
+    assert cpu.halted
+    assert cpu.registers["B"] == 9
+
+def test_budget_is_exact():
+    """run() never executes more instructions than requested"""
+    program, error, _ = Assembler.assemble("""
+        LOAD A, 0
+    loop:
+        ADD A, 1
+        JMP loop
+    """)
+    memory, cpu = make_machine(program, ())
+    translator = BlockTranslator(cpu)
+    assert translator.run(1) == 1
+    assert translator.run(7) == 7
+    assert translator.run(1000) == 1000
+    # 1 LOAD + 1007 loop instructions: ADD runs 504 times
+    assert cpu.registers["A"] == 504 & 0xFF
+
+def profile_counts(program, inputs, limit, translated):
+    """Per-address execution and cycle counts of a profiled run"""
+    memory, cpu = make_machine(program, inputs)
+    profiler = Profiler(memory.SIZE + 3)
+    cpu.set_profile(profiler)
+    translator = BlockTranslator(cpu)
+    translator.set_profile(profiler)
+    executed = 0
+    try:
+        while executed < limit and not cpu.halted:
+            if translated:
+                executed += translator.run(limit - executed)
+            else:
+                cpu.execute_instruction()
+                executed += 1
+    except ValueError:
+        return "out of bounds"
+    translator.collect_profile()
+    assert sum(profiler.cycles) == cpu.cycles
+    return profiler.counts, profiler.cycles
+
+def test_profile_matches_interpreter():
+    """Profiled blocks count every address exactly like the interpreter"""
+    rng = random.Random(99)
+    programs = example_programs() + [random_program(rng) for _ in range(200)]
+    for program in programs:
+        inputs = [rng.randrange(256) for _ in range(4)]
+        expected = profile_counts(program, inputs, 500, translated=False)
+        assert profile_counts(program, inputs, 500, translated=True) == expected
+
+def test_headless_sim_runs_translated():
+    """A headless SimManager clock burst runs through the translator"""
+    sim = SimManager(headless=True)
+    assert sim.load_code("""
+        LOAD A, 0
+    loop:
+        ADD A, 1
+        CMP A, 200
+        JNZ loop
+        HALT
+    """)
+    sim.run_burst(100000, float("inf"))
+    assert sim.cpu.halted
+    assert sim.cpu.registers["A"] == 200
+    assert any(sim.translator.blocks)
+
+if __name__ == "__main__":
+    test_examples_match_interpreter()
+    test_random_programs_match_interpreter()
+    test_self_modifying_loop()
+    test_budget_is_exact()
+    test_profile_matches_interpreter()
+    test_headless_sim_runs_translated()
+    print("Translator tests passed!")